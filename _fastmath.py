@@ -0,0 +1,143 @@
+"""
+Núcleos numéricos das análises estatísticas, compilados com Numba quando disponível.
+
+Cada função recebe ndarrays float64 contíguos e faz em uma única sequência
+compilada o que antes eram várias reduções do pandas (média, variância,
+quantis). O Numba é opcional: sem ele, as mesmas funções rodam como
+NumPy puro, com resultados idênticos (a menos de arredondamento no caso
+de group_moments, que sem Numba usa uma versão vetorizada).
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Substituto sem efeito para numba.njit quando o Numba não está instalado."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _lerp(a: float, b: float, t: float) -> float:
+    """Interpolação linear com a mesma forma numérica usada por np.quantile."""
+    diff = b - a
+    if t >= 0.5:
+        return b - diff * (1.0 - t)
+    return a + diff * t
+
+
+@njit(cache=True)
+def median_quartiles(arr: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Q1, mediana e Q3 com um único np.partition (introselect, O(N)).
+    
+    Mesmos valores de np.quantile(arr, [0.25, 0.5, 0.75]) com interpolação
+    linear; NaN para array vazio.
+    """
+    n = arr.size
+    if n == 0:
+        return np.nan, np.nan, np.nan
+    last = n - 1
+    h1 = last * 0.25
+    h3 = last * 0.75
+    k1 = int(math.floor(h1))
+    k3 = int(math.floor(h3))
+    mid = n // 2
+    mid_lo = mid if n % 2 else mid - 1
+    part = np.partition(arr, np.array([k1, min(k1 + 1, last), mid_lo, mid, k3, min(k3 + 1, last)]))
+    q1 = _lerp(part[k1], part[min(k1 + 1, last)], h1 - k1)
+    q3 = _lerp(part[k3], part[min(k3 + 1, last)], h3 - k3)
+    median = part[mid] if n % 2 else 0.5 * (part[mid_lo] + part[mid])
+    return q1, median, q3
+
+
+@njit(cache=True)
+def iqr_outliers(arr: np.ndarray) -> Tuple[np.ndarray, int]:
+    """Outliers pelas cercas de Tukey: fora de [Q1 - 1.5*IQR, Q3 + 1.5*IQR]."""
+    if arr.size == 0:
+        return arr[:0], 0
+    q1, _, q3 = median_quartiles(arr)
+    iqr = q3 - q1
+    mask = (arr < q1 - 1.5 * iqr) | (arr > q3 + 1.5 * iqr)
+    outliers = arr[mask]
+    return outliers, outliers.size
+
+
+def _group_moments_loop(values: np.ndarray, group_ids: np.ndarray,
+                        n_groups: int) -> Tuple[np.ndarray, ...]:
+    """Passada única de Welford por grupo (versão compilada pelo Numba)."""
+    count = np.zeros(n_groups, dtype=np.int64)
+    mean = np.zeros(n_groups)
+    m2 = np.zeros(n_groups)
+    min_ = np.full(n_groups, np.inf)
+    max_ = np.full(n_groups, -np.inf)
+    for i in range(values.size):
+        x = values[i]
+        g = group_ids[i]
+        if g < 0 or math.isnan(x):
+            continue
+        count[g] += 1
+        delta = x - mean[g]
+        mean[g] += delta / count[g]
+        m2[g] += delta * (x - mean[g])
+        if x < min_[g]:
+            min_[g] = x
+        if x > max_[g]:
+            max_[g] = x
+    for g in range(n_groups):
+        if count[g] == 0:
+            mean[g] = np.nan
+            min_[g] = np.nan
+            max_[g] = np.nan
+    return count, mean, m2, min_, max_
+
+
+def _group_moments_numpy(values: np.ndarray, group_ids: np.ndarray,
+                         n_groups: int) -> Tuple[np.ndarray, ...]:
+    """Mesmas estatísticas com bincount/ufunc.at (sem laço Python por linha)."""
+    valid = (group_ids >= 0) & ~np.isnan(values)
+    x = values[valid]
+    ids = group_ids[valid]
+    count = np.bincount(ids, minlength=n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.bincount(ids, weights=x, minlength=n_groups) / count
+    m2 = np.bincount(ids, weights=(x - mean[ids]) ** 2, minlength=n_groups)
+    min_ = np.full(n_groups, np.inf)
+    max_ = np.full(n_groups, -np.inf)
+    np.minimum.at(min_, ids, x)
+    np.maximum.at(max_, ids, x)
+    empty = count == 0
+    min_[empty] = np.nan
+    max_[empty] = np.nan
+    return count, mean, m2, min_, max_
+
+
+def group_moments(values: np.ndarray, group_ids: np.ndarray,
+                  n_groups: int) -> Tuple[np.ndarray, ...]:
+    """
+    Contagem, média, M2 (soma dos desvios quadráticos), mínimo e máximo por grupo.
+    
+    values: float64 com NaN para ausentes (ignorados); group_ids: int64 em
+    [0, n_groups), com -1 para linhas fora de qualquer grupo. Grupos sem
+    valores válidos saem com count 0 e NaN nas demais estatísticas.
+    
+    Com Numba é uma única passada compilada (Welford, numericamente estável);
+    sem ele, reduções vetorizadas do NumPy.
+    """
+    return _group_moments_impl(
+        np.ascontiguousarray(values, dtype=np.float64),
+        np.ascontiguousarray(group_ids, dtype=np.int64),
+        int(n_groups),
+    )
+
+
+_group_moments_impl = njit(cache=True)(_group_moments_loop) if HAS_NUMBA else _group_moments_numpy
@@ -5,11 +5,14 @@ Este módulo adiciona funcionalidades de agrupamento e comparação por db_type
 mantendo toda a metodologia científica do análise original.
 """
 
+from itertools import combinations
+
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Tuple, Optional
 
 
-def group_by_database_and_os(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+def group_by_database_and_os(df: pd.DataFrame) -> Dict[str, np.ndarray]:
     """
     Agrupa resultados por tipo de banco e sistema operacional.
     
@@ -17,7 +20,8 @@ def group_by_database_and_os(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         df: DataFrame com resultados do benchmark
     
     Returns:
-        Dictionary mapeando grupos para DataFrames filtrados
+        Dictionary mapeando grupos para arrays de posições (int64) das linhas
+        em df; use df.iloc[idx] ou df[col].to_numpy()[idx] para materializar
     """
     groups = {}
     
@@ -27,41 +31,46 @@ def group_by_database_and_os(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
     
     if not has_db_type:
         # Formato legado - apenas por server name
-        for server in df['server_name'].unique() if 'server_name' in df.columns else df['server'].unique():
-            groups[server] = df[df.get('server_name', df.get('server')) == server]
+        server_col = 'server_name' if 'server_name' in df.columns else 'server'
+        groups.update(df.groupby(server_col, sort=False).indices)
         return groups
     
     # Novos agrupamentos
     
     # 1. Por tipo de banco de dados
-    for db_type in df['db_type'].unique():
+    for db_type, idx in df.groupby('db_type', sort=False).indices.items():
         key = f"DB: {db_type.upper()}"
-        groups[key] = df[df['db_type'] == db_type]
+        groups[key] = idx
     
     # 2. Por sistema operacional
     if has_os_type:
-        for os_type in df['os_type'].unique():
+        for os_type, idx in df.groupby('os_type', sort=False).indices.items():
             key = f"OS: {os_type.upper()}"
-            groups[key] = df[df['os_type'] == os_type]
+            groups[key] = idx
     
-    # 3. Por combinação db_type + os_type
+    # 3. Por combinação db_type + os_type (um único groupby, sem máscaras por par)
     if has_os_type:
-        for db_type in df['db_type'].unique():
-            for os_type in df['os_type'].unique():
-                subset = df[(df['db_type'] == db_type) & (df['os_type'] == os_type)]
-                if len(subset) > 0:
+        db_types = df['db_type'].unique()
+        os_types = df['os_type'].unique()
+        by_db_os = df.groupby(['db_type', 'os_type'], sort=False).indices
+        for db_type in db_types:
+            for os_type in os_types:
+                idx = by_db_os.get((db_type, os_type))
+                if idx is not None:
                     key = f"{db_type.upper()} @ {os_type.upper()}"
-                    groups[key] = subset
+                    groups[key] = idx
     
     return groups
 
 
-def get_comparison_pairs(df: pd.DataFrame) -> List[Tuple[str, pd.DataFrame, pd.DataFrame]]:
+def get_comparison_pairs(df: pd.DataFrame) -> List[Tuple[str, np.ndarray, np.ndarray]]:
     """
     Gera pares de comparação interessantes para análise estatística.
     
     Returns:
-        Lista de tuplas (nome_comparação, grupo1_df, grupo2_df)
+        Lista de tuplas (nome_comparação, idx_grupo1, idx_grupo2), onde os
+        índices são posições (int64) das linhas em df. Ex.:
+        vals = df['elapsed_total_seconds'].to_numpy(); a, b = vals[idx1], vals[idx2]
     """
     pairs = []
     
@@ -70,54 +79,60 @@ def get_comparison_pairs(df: pd.DataFrame) -> List[Tuple[str, pd.DataFrame, pd.D
     
     if not has_db_type:
         # Formato legado - comparar servers únicos
-        servers = df['server_name'].unique() if 'server_name' in df.columns else df['server'].unique()
+        server_col = 'server_name' if 'server_name' in df.columns else 'server'
+        by_server = df.groupby(server_col, sort=False).indices
+        servers = df[server_col].unique()
         if len(servers) == 2:
             pairs.append((
                 f"{servers[0]} vs {servers[1]}",
-                df[df.get('server_name', df.get('server')) == servers[0]],
-                df[df.get('server_name', df.get('server')) == servers[1]]
+                by_server[servers[0]],
+                by_server[servers[1]]
             ))
         return pairs
     
     # Comparações multi-DB
     
+    # Posições pré-computadas: um groupby por chave, depois só lookups
+    db_types = df['db_type'].unique()
+    by_db = df.groupby('db_type', sort=False).indices
+    by_db_os = (
+        df.groupby(['db_type', 'os_type'], sort=False).indices
+        if has_os_type else {}
+    )
+    # Pares (db, os) na ordem da primeira ocorrência no CSV
+    db_os_keys = sorted(by_db_os, key=lambda key: by_db_os[key][0])
+    
     # 1. Mesmo DB em OS diferentes
     if has_os_type:
-        for db_type in df['db_type'].unique():
-            os_types = df[df['db_type'] == db_type]['os_type'].unique()
+        for db_type in db_types:
+            os_types = [os_type for (db, os_type) in db_os_keys if db == db_type]
             if len(os_types) == 2:
                 os1, os2 = os_types[0], os_types[1]
                 pairs.append((
                     f"{db_type.upper()}: {os1.upper()} vs {os2.upper()}",
-                    df[(df['db_type'] == db_type) & (df['os_type'] == os1)],
-                    df[(df['db_type'] == db_type) & (df['os_type'] == os2)]
+                    by_db_os[(db_type, os1)],
+                    by_db_os[(db_type, os2)]
                 ))
     
     # 2. DBs diferentes no mesmo OS
     if has_os_type:
         for os_type in df['os_type'].unique():
-            db_types = df[df['os_type'] == os_type]['db_type'].unique()
-            for i in range(len(db_types)):
-                for j in range(i + 1, len(db_types)):
-                    db1, db2 = db_types[i], db_types[j]
-                    pairs.append((
-                        f"{os_type.upper()}: {db1.upper()} vs {db2.upper()}",
-                        df[(df['db_type'] == db1) & (df['os_type'] == os_type)],
-                        df[(df['db_type'] == db2) & (df['os_type'] == os_type)]
-                    ))
-    
-    # 3. Comparação geral entre tipos de DB (agregando todos OS)
-    db_types = df['db_type'].unique()
-    if len(db_types) >= 2:
-        for i in range(len(db_types)):
-            for j in range(i + 1, len(db_types)):
-                db1, db2 = db_types[i], db_types[j]
+            os_db_types = [db for (db, os_key) in db_os_keys if os_key == os_type]
+            for db1, db2 in combinations(os_db_types, 2):
                 pairs.append((
-                    f"Overall: {db1.upper()} vs {db2.upper()}",
-                    df[df['db_type'] == db1],
-                    df[df['db_type'] == db2]
+                    f"{os_type.upper()}: {db1.upper()} vs {db2.upper()}",
+                    by_db_os[(db1, os_type)],
+                    by_db_os[(db2, os_type)]
                 ))
     
+    # 3. Comparação geral entre tipos de DB (agregando todos OS)
+    for db1, db2 in combinations(db_types, 2):
+        pairs.append((
+            f"Overall: {db1.upper()} vs {db2.upper()}",
+            by_db[db1],
+            by_db[db2]
+        ))
+    
     return pairs
 
 
@@ -138,18 +153,19 @@ def print_cross_database_summary(df: pd.DataFrame):
     
     # Contagem por DB type
     print("📊 Distribuição por tipo de banco de dados:")
-    db_counts = df.groupby('db_type').size()
+    by_db = df.groupby('db_type')
+    db_counts = by_db.size()
+    servers_per_db = by_db['server_name'].unique() if 'server_name' in df.columns else None
     for db_type, count in db_counts.items():
-        servers = df[df['db_type'] == db_type]['server_name'].unique() if 'server_name' in df.columns else []
         print(f"   {db_type.upper()}: {count} execuções")
-        if len(servers) > 0:
-            print(f"      Servidores: {', '.join(servers)}")
+        if servers_per_db is not None:
+            print(f"      Servidores: {', '.join(servers_per_db[db_type])}")
     print()
     
     # Contagem por OS
     if has_os_type:
         print("💻 Distribuição por sistema operacional:")
-        os_counts = df.groupby('os_type').size()
+        os_counts = df['os_type'].value_counts(sort=False).sort_index()
         for os_type, count in os_counts.items():
             print(f"   {os_type.upper()}: {count} execuções")
         print()
@@ -157,7 +173,7 @@ def print_cross_database_summary(df: pd.DataFrame):
     # Matrix de combinações
     if has_os_type:
         print("🎯 Matriz DB x OS:")
-        matrix = df.groupby(['db_type', 'os_type']).size().unstack(fill_value=0)
+        matrix = pd.crosstab(df['db_type'], df['os_type'])
         print(matrix)
         print()
     
@@ -4,55 +4,94 @@ Análise Estatística de Resultados do Benchmark Firebird
 
 Este script implementa metodologia científica para análise de performance,
 incluindo:
-- Testes de normalidade (Shapiro-Wilk)
-- Testes de significância estatística (t-test ou Mann-Whitney U)
+- Testes de normalidade (Shapiro-Wilk; D'Agostino-Pearson K² para amostras grandes)
+- Testes de significância estatística (Welch t-test ou Mann-Whitney U)
 - Cálculo de intervalo de confiança (95%)
 - Análise de outliers
 - Tamanho do efeito (Cohen's d)
 
 Referências:
 - Shapiro, S. S., & Wilk, M. B. (1965). An analysis of variance test for normality
+- D'Agostino, R. B., & Pearson, E. S. (1973). Tests for departure from normality
 - Student (1908). The probable error of a mean
+- Welch, B. L. (1947). The generalization of "Student's" problem when several
+  different population variances are involved
 - Mann, H. B., & Whitney, D. R. (1947). On a test of whether one of two random 
   variables is stochastically larger than the other
 - Cohen, J. (1988). Statistical power analysis for the behavioral sciences
 """
 
+from __future__ import annotations
+
+import io
 import sys
 from pathlib import Path
+from functools import lru_cache
 from typing import Tuple, Optional
 import math
 
-# Verificar se pandas e scipy estão instalados
-try:
-    import pandas as pd
-    import statistics
-    from scipy import stats
-    import numpy as np
-except ImportError as e:
-    print("Este script requer pandas, scipy e numpy. Instale com:")
-    print("  uv pip install pandas scipy numpy")
-    print("  ou")
-    print("  pip install pandas scipy numpy")
-    sys.exit(1)
-
-
-def calculate_cohens_d(group1: pd.Series, group2: pd.Series) -> float:
-    """
-    Calcula Cohen's d para medir o tamanho do efeito.
+# pandas, scipy, numpy, PyArrow e os núcleos numéricos são carregados sob
+# demanda por import_dependencies(): sem CSV para analisar, o script retorna
+# sem pagar o import do pandas/scipy nem a carga do Numba
+CSV_ENGINE = 'c'
+
+
+def import_dependencies() -> None:
+    """Importa as dependências da análise para o escopo do módulo (ou encerra)."""
+    global pd, stats, np, CSV_ENGINE
+    global group_moments, iqr_outliers, median_quartiles
     
-    Cohen's d = (mean1 - mean2) / pooled_std
+    # Verificar se pandas e scipy estão instalados
+    try:
+        import pandas as pd
+        from scipy import stats
+        import numpy as np
+    except ImportError as e:
+        print("Este script requer pandas, scipy e numpy. Instale com:")
+        print("  uv pip install pandas scipy numpy")
+        print("  ou")
+        print("  pip install pandas scipy numpy")
+        sys.exit(1)
     
-    Interpretação (Cohen, 1988):
-    - |d| < 0.2: efeito insignificante
-    - 0.2 ≤ |d| < 0.5: efeito pequeno
-    - 0.5 ≤ |d| < 0.8: efeito médio
-    - |d| ≥ 0.8: efeito grande
-    """
-    n1, n2 = len(group1), len(group2)
-    var1, var2 = group1.var(), group2.var()
+    # PyArrow é opcional: quando instalado, o CSV é lido pelo parser multithread do Arrow
+    try:
+        import pyarrow  # noqa: F401
+        CSV_ENGINE = 'pyarrow'
+    except ImportError:
+        CSV_ENGINE = 'c'
+    
+    # Núcleos numéricos (compilados com Numba se instalado; NumPy puro caso contrário)
+    from _fastmath import group_moments, iqr_outliers, median_quartiles
+
+
+# Colunas numéricas (algumas podem vir vazias no CSV), convertidas uma única vez
+# na leitura para float64 contíguo, com NaN nos campos ausentes
+NUMERIC_COLUMNS = (
+    'elapsed_total_seconds', 'elapsed_server_seconds', 'latency_seconds',
+    'seq_reads', 'idx_reads', 'inserts', 'updates', 'deletes',
+)
+
+# Colunas de rótulo com poucos valores distintos: categóricas agrupam por códigos
+# inteiros. Todo groupby sobre elas deve passar observed=True (sem ele o pandas
+# 2.x emite FutureWarning e incluiria categorias sem linhas)
+CATEGORICAL_COLUMNS = ('server', 'server_name', 'db_type', 'os_type')
+
+# Únicas colunas lidas por completo do CSV; query/runs vêm só da primeira linha
+# e plan, rowcount, run_index etc. nunca são usadas
+LOADED_COLUMNS = NUMERIC_COLUMNS + CATEGORICAL_COLUMNS
+
+# A partir deste n (em ambos os grupos) a comparação usa Welch t-test (TCL)
+WELCH_MIN_N = 30
+
+# Acima deste n a normalidade usa D'Agostino K² (uma passada de momentos, sem ordenação)
+SHAPIRO_MAX_N = 50
+
+
+def cohens_d_from_moments(mean1: float, var1: float, n1: int,
+                          mean2: float, var2: float, n2: int) -> float:
+    """Cohen's d a partir de média/variância/n já calculados (sem nova passada nos dados)."""
     pooled_std = math.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2))
-    return (group1.mean() - group2.mean()) / pooled_std if pooled_std > 0 else 0
+    return (mean1 - mean2) / pooled_std if pooled_std > 0 else 0
 
 
 def interpret_cohens_d(d: float) -> str:
@@ -68,38 +107,52 @@ def interpret_cohens_d(d: float) -> str:
         return "grande"
 
 
+def normality_test_name(n: int) -> str:
+    """Nome do teste de normalidade aplicado por test_normality para n amostras."""
+    return "Shapiro-Wilk" if n <= SHAPIRO_MAX_N else "D'Agostino K²"
+
+
 def test_normality(data: pd.Series) -> Tuple[float, float, bool]:
     """
-    Testa normalidade usando Shapiro-Wilk.
+    Testa normalidade usando Shapiro-Wilk (n <= SHAPIRO_MAX_N) ou
+    D'Agostino-Pearson K² (n maior).
     
     Retorna: (estatística, p-valor, é_normal)
     H0: Os dados seguem distribuição normal
     Se p > 0.05, não rejeitamos H0 (dados são normais)
     
-    Shapiro & Wilk (1965)
+    Shapiro & Wilk (1965); D'Agostino & Pearson (1973)
     """
-    if len(data) < 3:
+    n = len(data)
+    if n < 3:
         return 0, 0, False
-    stat, p = stats.shapiro(data)
+    if n > SHAPIRO_MAX_N:
+        # Shapiro-Wilk é hipersensível e O(N log N) para n grande
+        stat, p = stats.normaltest(data)
+    else:
+        stat, p = stats.shapiro(data)
     return stat, p, p > 0.05
 
 
-def statistical_test(group1: pd.Series, group2: pd.Series) -> Tuple[str, float, float, bool]:
+def statistical_test(group1: np.ndarray, group2: np.ndarray) -> Tuple[str, float, float, bool]:
     """
     Realiza teste estatístico apropriado.
     
-    Se ambos grupos são normais: t-test independente (Student, 1908)
+    Se ambos grupos têm n >= WELCH_MIN_N: Welch t-test (Welch, 1947), robusto à
+    não-normalidade pelo Teorema Central do Limite e a variâncias diferentes
     Caso contrário: Mann-Whitney U test (Mann & Whitney, 1947)
     
+    A escolha depende só de n, sem um Shapiro-Wilk por grupo a cada comparação.
+    
     Retorna: (nome_teste, estatística, p-valor, há_diferença_significativa)
     """
-    _, _, normal1 = test_normality(group1)
-    _, _, normal2 = test_normality(group2)
+    group1 = np.asarray(group1, dtype=np.float64)
+    group2 = np.asarray(group2, dtype=np.float64)
     
-    if normal1 and normal2:
-        # t-test para amostras independentes
-        stat, p = stats.ttest_ind(group1, group2)
-        test_name = "t-test (Student, 1908)"
+    if min(group1.size, group2.size) >= WELCH_MIN_N:
+        # t-test sem assumir variâncias iguais
+        stat, p = stats.ttest_ind(group1, group2, equal_var=False)
+        test_name = "Welch t-test (Welch, 1947)"
     else:
         # Mann-Whitney U test (não-paramétrico)
         stat, p = stats.mannwhitneyu(group1, group2, alternative='two-sided')
@@ -108,36 +161,143 @@ def statistical_test(group1: pd.Series, group2: pd.Series) -> Tuple[str, float,
     return test_name, stat, p, p < 0.05
 
 
-def confidence_interval(data: pd.Series, confidence: float = 0.95) -> Tuple[float, float]:
+def compare_means(mean1: float, mean2: float, names) -> Tuple[str, str, float, float, float, float]:
     """
-    Calcula intervalo de confiança para a média.
+    Compara as médias de dois servidores (names[0] e names[1]).
     
-    Usa distribuição t de Student para amostras pequenas.
+    Retorna: (menor, maior, média_menor, média_maior, diferença, diferença_%)
+    com a diferença percentual relativa à menor média (NaN se ela for zero).
     """
-    n = len(data)
+    means = (mean1, mean2)
+    low = 0 if mean1 < mean2 else 1
+    diff = abs(mean1 - mean2)
+    pct = diff / means[low] * 100 if means[low] else math.nan
+    return names[low], names[1 - low], means[low], means[1 - low], diff, pct
+
+
+@lru_cache(maxsize=None)
+def t_critical(confidence: float, dof: int) -> float:
+    """Valor crítico bilateral da t de Student (memoizado: n é o mesmo por servidor)."""
+    return stats.t.ppf((1 + confidence) / 2, dof)
+
+
+def confidence_interval_from_moments(mean: float, std: float, n: int,
+                                     confidence: float = 0.95) -> Tuple[float, float]:
+    """Intervalo de confiança para a média a partir de média/desvio/n já agregados."""
     if n < 2:
-        return data.mean(), data.mean()
-    
-    mean = data.mean()
-    se = stats.sem(data)
-    margin = se * stats.t.ppf((1 + confidence) / 2, n - 1)
+        return mean, mean
+    margin = std / math.sqrt(n) * t_critical(confidence, int(n) - 1)
     return mean - margin, mean + margin
 
 
-def detect_outliers(data: pd.Series) -> Tuple[pd.Series, int]:
+def detect_outliers(data: pd.Series) -> Tuple[np.ndarray, int]:
     """
     Detecta outliers usando método IQR (Tukey, 1977).
     
     Outliers: valores fora de [Q1 - 1.5*IQR, Q3 + 1.5*IQR]
     """
-    Q1 = data.quantile(0.25)
-    Q3 = data.quantile(0.75)
-    IQR = Q3 - Q1
-    lower_bound = Q1 - 1.5 * IQR
-    upper_bound = Q3 + 1.5 * IQR
+    outliers, n_outliers = iqr_outliers(np.ascontiguousarray(data, dtype=np.float64))
+    return outliers, int(n_outliers)
+
+
+def take_valid(values: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    """Seleciona as posições idx de uma coluna numérica, descartando NaN."""
+    selected = values[idx]
+    return selected[~np.isnan(selected)]
+
+
+def summarize_groups(df: pd.DataFrame, metric_cols: list, positions: dict) -> pd.DataFrame:
+    """
+    Estatísticas descritivas por servidor no formato do groupby().agg().
+    
+    Colunas (métrica, estatística) com mean/median/var/min/max/count/std e
+    os quartis q1/q3; índice com os servidores na ordem de positions.
+    count/média/variância/mínimo/máximo saem de uma única passada por métrica
+    (group_moments) e mediana/quartis de um np.partition por servidor, sem
+    ordenar os grupos. É a única fonte das estatísticas por servidor e da
+    tabela do describe().
+    """
+    names = list(positions)
+    group_ids = np.full(len(df), -1, dtype=np.int64)
+    for g, idx in enumerate(positions.values()):
+        group_ids[idx] = g
+    
+    data = {}
+    for col in metric_cols:
+        values = df[col].to_numpy()
+        count, mean, m2, min_, max_ = group_moments(values, group_ids, len(names))
+        q1, median, q3 = np.array([
+            median_quartiles(take_valid(values, idx)) for idx in positions.values()
+        ]).reshape(-1, 3).T
+        var = np.divide(m2, count - 1, out=np.full(len(names), np.nan), where=count > 1)
+        data[(col, 'mean')] = mean
+        data[(col, 'median')] = median
+        data[(col, 'var')] = var
+        data[(col, 'min')] = min_
+        data[(col, 'max')] = max_
+        data[(col, 'count')] = count
+        data[(col, 'std')] = np.sqrt(var)
+        data[(col, 'q1')] = q1
+        data[(col, 'q3')] = q3
+    return pd.DataFrame(data, index=pd.Index(names, name='server'))
+
+
+def describe_from_summary(col_summary: pd.DataFrame) -> pd.DataFrame:
+    """
+    Monta a tabela do describe() a partir de agregados já calculados.
+    
+    col_summary: colunas de summarize_groups de uma métrica por servidor
+    """
+    table = pd.DataFrame({
+        'count': col_summary['count'].astype('float64'),
+        'mean': col_summary['mean'],
+        'std': col_summary['std'],
+        'min': col_summary['min'],
+        '25%': col_summary['q1'],
+        '50%': col_summary['median'],
+        '75%': col_summary['q3'],
+        'max': col_summary['max'],
+    })
+    table = table[table['count'] > 0].sort_index()
+    table.columns.name = None
+    return table
+
+
+def read_results_csv(csv_path: Path) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Lê o CSV de resultados com campos vazios como NaN e tipos já normalizados.
+    
+    Retorna (df, primeira_linha). A primeira linha é lida à parte e fornece
+    os escalares do cabeçalho do relatório (query, runs); o arquivo completo
+    materializa só as colunas usadas na análise, com as métricas já saindo
+    do parser como float64, sem a passada de inferência de tipos.
+    
+    Usa o parser multithread do PyArrow quando instalado; se ele rejeitar o
+    arquivo (linhas irregulares, por exemplo), relê com o parser C do pandas,
+    sem tipos fixos, e converte as métricas com errors='coerce'.
+    """
+    head = pd.read_csv(csv_path, sep=';', nrows=1)
+    usecols = [col for col in head.columns if col in LOADED_COLUMNS]
+    dtypes = {col: 'float64' for col in usecols if col in NUMERIC_COLUMNS}
     
-    outliers = data[(data < lower_bound) | (data > upper_bound)]
-    return outliers, len(outliers)
+    df = None
+    if CSV_ENGINE == 'pyarrow':
+        try:
+            df = pd.read_csv(csv_path, sep=';', na_values=[''], usecols=usecols,
+                             dtype=dtypes, engine='pyarrow')
+        except ValueError:
+            df = None
+    if df is None:
+        df = pd.read_csv(csv_path, sep=';', na_values=[''], usecols=usecols)
+    
+    for col in dtypes:
+        if df[col].dtype != np.float64:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
+    # Rótulos como categorias (agrupar com observed=True, ver CATEGORICAL_COLUMNS)
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df, head.iloc[0]
 
 
 def analyze_results(csv_file: str = "firebird_benchmark_results.csv"):
@@ -150,22 +310,38 @@ def analyze_results(csv_file: str = "firebird_benchmark_results.csv"):
         print("  ./run-benchmark.sh")
         return
     
-    # Ler CSV
-    df = pd.read_csv(csv_path, sep=';')
+    import_dependencies()
+    
+    # Ler CSV (campos vazios viram NaN já no parser)
+    df, first_row = read_results_csv(csv_path)
+    
+    # Agrupamento e posições das linhas de cada servidor calculados uma única vez
+    # e reaproveitados no cabeçalho, nas estatísticas, na comparação e nas tabelas.
+    # 'server' é categórica: observed=True agrupa só os valores presentes (o
+    # padrão do pandas 3; no 2.x, omiti-lo emite FutureWarning)
+    by_server = df.groupby('server', sort=False, observed=True)
+    positions = by_server.indices
+    
+    # Relatório montado em memória e emitido com uma única escrita no stdout
+    report = io.StringIO()
+    
+    def emit(line: str) -> None:
+        report.write(line)
+        report.write("\n")
     
-    print("=" * 70)
-    print("📊 ANÁLISE ESTATÍSTICA DE RESULTADOS - BENCHMARK FIREBIRD")
-    print("Metodologia Científica com Testes de Significância")
-    print("=" * 70)
-    print()
+    emit("=" * 70)
+    emit("📊 ANÁLISE ESTATÍSTICA DE RESULTADOS - BENCHMARK FIREBIRD")
+    emit("Metodologia Científica com Testes de Significância")
+    emit("=" * 70)
+    emit("")
     
     # Informações gerais
-    print(f"📁 Arquivo: {csv_file}")
-    print(f"📈 Total de execuções: {len(df)}")
-    print(f"🖥️  Servidores testados: {df['server'].unique().tolist()}")
-    print(f"🔍 Query executada: {df['query'].iloc[0]}")
-    print(f"🔄 Execuções por servidor: {df['runs'].iloc[0]}")
-    print()
+    emit(f"📁 Arquivo: {csv_file}")
+    emit(f"📈 Total de execuções: {len(df)}")
+    emit(f"🖥️  Servidores testados: {list(positions)}")
+    emit(f"🔍 Query executada: {first_row['query']}")
+    emit(f"🔄 Execuções por servidor: {first_row['runs']}")
+    emit("")
     
     # Mostrar colunas disponíveis
     has_latency = 'latency_seconds' in df.columns
@@ -173,125 +349,156 @@ def analyze_results(csv_file: str = "firebird_benchmark_results.csv"):
     has_stats = 'seq_reads' in df.columns
     
     if has_latency:
-        print("✅ Dados de latência disponíveis")
+        emit("✅ Dados de latência disponíveis")
     if has_server_time:
-        print("✅ Tempo interno do servidor disponível")
+        emit("✅ Tempo interno do servidor disponível")
     if has_stats:
-        print("✅ Estatísticas de I/O disponíveis")
-    print()
+        emit("✅ Estatísticas de I/O disponíveis")
+    emit("")
     
     # Estatísticas por servidor
-    print("=" * 70)
-    print("📊 ESTATÍSTICAS DESCRITIVAS POR SERVIDOR")
-    print("=" * 70)
-    print()
-    
-    for server in df['server'].unique():
-        server_df = df[df['server'] == server]
-        total_times = server_df['elapsed_total_seconds']
+    emit("=" * 70)
+    emit("📊 ESTATÍSTICAS DESCRITIVAS POR SERVIDOR")
+    emit("=" * 70)
+    emit("")
+    
+    metric_cols = ['elapsed_total_seconds']
+    if has_server_time:
+        metric_cols.append('elapsed_server_seconds')
+    if has_latency:
+        metric_cols.append('latency_seconds')
+    
+    # Uma única passada por métrica para todas as estatísticas descritivas
+    # (desvio padrão derivado da variância, sem outra redução por grupo)
+    summary = summarize_groups(df, metric_cols, positions)
+    
+    # Colunas de I/O presentes resolvidas uma vez, fora do laço por servidor
+    io_cols = [
+        col for col in ('seq_reads', 'idx_reads', 'inserts', 'updates', 'deletes')
+        if col in df.columns
+    ]
+    if has_stats:
+        io_summary = by_server[io_cols].agg(['sum', 'mean'])
+    
+    # Momentos por (servidor, métrica), reaproveitados na comparação
+    stats_cache = {
+        (server, col): {
+            'mean': summary.at[server, (col, 'mean')],
+            'var': summary.at[server, (col, 'var')],
+            'n': int(summary.at[server, (col, 'count')]),
+        }
+        for server in summary.index
+        for col in metric_cols
+    }
+    
+    # Colunas como ndarrays: o laço só indexa buffers já prontos pelas
+    # posições de cada servidor, sem montar um sub-DataFrame por servidor
+    total_values = df['elapsed_total_seconds'].to_numpy()
+    srv_values = df['elapsed_server_seconds'].to_numpy() if has_server_time else None
+    
+    for server in summary.index:
+        desc = summary.loc[server]
+        idx = positions[server]
+        total_times = total_values[idx]
         
         # Detectar outliers
         outliers_total, n_outliers_total = detect_outliers(total_times)
         
         # Calcular intervalo de confiança
-        ci_lower, ci_upper = confidence_interval(total_times)
+        tot = desc['elapsed_total_seconds']
+        ci_lower, ci_upper = confidence_interval_from_moments(tot['mean'], tot['std'], tot['count'])
         
         # Testar normalidade
-        _, p_shapiro, is_normal = test_normality(total_times)
+        _, p_normal, is_normal = test_normality(total_times)
         
-        print(f"🖥️  {server}")
-        print(f"   Tempo Total (com rede):")
-        print(f"      Média:        {total_times.mean():.6f} s")
-        print(f"      IC 95%:       [{ci_lower:.6f}, {ci_upper:.6f}] s")
-        print(f"      Mediana:      {total_times.median():.6f} s")
-        print(f"      Mínimo:       {total_times.min():.6f} s")
-        print(f"      Máximo:       {total_times.max():.6f} s")
-        print(f"      Desvio Padrão: {total_times.std():.6f} s")
-        print(f"      Coef. Variação: {(total_times.std() / total_times.mean() * 100):.2f}%")
-        print(f"      Outliers:     {n_outliers_total} detectados (Tukey, 1977)")
-        print(f"      Normalidade:  {'Normal' if is_normal else 'Não-normal'} (Shapiro-Wilk p={p_shapiro:.4f})")
+        emit(f"🖥️  {server}")
+        emit(f"   Tempo Total (com rede):")
+        emit(f"      Média:        {tot['mean']:.6f} s")
+        emit(f"      IC 95%:       [{ci_lower:.6f}, {ci_upper:.6f}] s")
+        emit(f"      Mediana:      {tot['median']:.6f} s")
+        emit(f"      Mínimo:       {tot['min']:.6f} s")
+        emit(f"      Máximo:       {tot['max']:.6f} s")
+        emit(f"      Desvio Padrão: {tot['std']:.6f} s")
+        emit(f"      Coef. Variação: {(tot['std'] / tot['mean'] * 100):.2f}%")
+        emit(f"      Outliers:     {n_outliers_total} detectados (Tukey, 1977)")
+        emit(f"      Normalidade:  {'Normal' if is_normal else 'Não-normal'} ({normality_test_name(len(total_times))} p={p_normal:.4f})")
         
         # Tempo do servidor (se disponível)
-        if has_server_time and 'elapsed_server_seconds' in server_df.columns:
-            server_times = server_df['elapsed_server_seconds'].replace('', pd.NA).dropna()
-            if len(server_times) > 0:
-                server_times = pd.to_numeric(server_times, errors='coerce').dropna()
-                if len(server_times) > 0:
-                    ci_srv_lower, ci_srv_upper = confidence_interval(server_times)
-                    _, p_srv, is_normal_srv = test_normality(server_times)
-                    outliers_srv, n_outliers_srv = detect_outliers(server_times)
-                    
-                    print(f"   Tempo Servidor (processamento interno):")
-                    print(f"      Média:        {server_times.mean():.6f} s")
-                    print(f"      IC 95%:       [{ci_srv_lower:.6f}, {ci_srv_upper:.6f}] s")
-                    print(f"      Mediana:      {server_times.median():.6f} s")
-                    print(f"      Mínimo:       {server_times.min():.6f} s")
-                    print(f"      Máximo:       {server_times.max():.6f} s")
-                    print(f"      Desvio Padrão: {server_times.std():.6f} s")
-                    print(f"      Outliers:     {n_outliers_srv} detectados")
-                    print(f"      Normalidade:  {'Normal' if is_normal_srv else 'Não-normal'} (p={p_srv:.4f})")
+        if has_server_time and desc[('elapsed_server_seconds', 'count')] > 0:
+            srv = desc['elapsed_server_seconds']
+            server_times = take_valid(srv_values, idx)
+            ci_srv_lower, ci_srv_upper = confidence_interval_from_moments(
+                srv['mean'], srv['std'], srv['count']
+            )
+            _, p_srv, is_normal_srv = test_normality(server_times)
+            outliers_srv, n_outliers_srv = detect_outliers(server_times)
+            
+            emit(f"   Tempo Servidor (processamento interno):")
+            emit(f"      Média:        {srv['mean']:.6f} s")
+            emit(f"      IC 95%:       [{ci_srv_lower:.6f}, {ci_srv_upper:.6f}] s")
+            emit(f"      Mediana:      {srv['median']:.6f} s")
+            emit(f"      Mínimo:       {srv['min']:.6f} s")
+            emit(f"      Máximo:       {srv['max']:.6f} s")
+            emit(f"      Desvio Padrão: {srv['std']:.6f} s")
+            emit(f"      Outliers:     {n_outliers_srv} detectados")
+            emit(f"      Normalidade:  {'Normal' if is_normal_srv else 'Não-normal'} ({normality_test_name(len(server_times))} p={p_srv:.4f})")
         
         # Latência (se disponível)
-        if has_latency and 'latency_seconds' in server_df.columns:
-            latencies = server_df['latency_seconds'].replace('', pd.NA).dropna()
-            if len(latencies) > 0:
-                latencies = pd.to_numeric(latencies, errors='coerce').dropna()
-                if len(latencies) > 0:
-                    print(f"   Latência de Rede:")
-                    print(f"      Média:        {latencies.mean():.6f} s")
-                    print(f"      Mediana:      {latencies.median():.6f} s")
-                    print(f"      Mínimo:       {latencies.min():.6f} s")
-                    print(f"      Máximo:       {latencies.max():.6f} s")
+        if has_latency and desc[('latency_seconds', 'count')] > 0:
+            lat = desc['latency_seconds']
+            emit(f"   Latência de Rede:")
+            emit(f"      Média:        {lat['mean']:.6f} s")
+            emit(f"      Mediana:      {lat['median']:.6f} s")
+            emit(f"      Mínimo:       {lat['min']:.6f} s")
+            emit(f"      Máximo:       {lat['max']:.6f} s")
         
         # Estatísticas de I/O (se disponíveis)
         if has_stats:
-            print(f"   Estatísticas de I/O (média):")
-            for col in ['seq_reads', 'idx_reads', 'inserts', 'updates', 'deletes']:
-                if col in server_df.columns:
-                    values = server_df[col].replace('', pd.NA).dropna()
-                    if len(values) > 0:
-                        values = pd.to_numeric(values, errors='coerce').dropna()
-                        if len(values) > 0 and values.sum() > 0:
-                            print(f"      {col}: {values.mean():.2f}")
-        print()
+            emit(f"   Estatísticas de I/O (média):")
+            for col in io_cols:
+                if io_summary.at[server, (col, 'sum')] > 0:
+                    emit(f"      {col}: {io_summary.at[server, (col, 'mean')]:.2f}")
+        emit("")
     
     # Comparação direta com testes estatísticos
-    print("=" * 70)
-    print("⚖️  COMPARAÇÃO ESTATÍSTICA ENTRE SERVIDORES")
-    print("=" * 70)
-    print()
+    emit("=" * 70)
+    emit("⚖️  COMPARAÇÃO ESTATÍSTICA ENTRE SERVIDORES")
+    emit("=" * 70)
+    emit("")
     
-    servers = df['server'].unique()
+    # Médias/variâncias/n já vêm do agg; os testes recebem ndarrays contíguos
+    servers = summary.index
     if len(servers) == 2:
-        server1_df = df[df['server'] == servers[0]]
-        server2_df = df[df['server'] == servers[1]]
+        idx1, idx2 = positions[servers[0]], positions[servers[1]]
         
         # Comparação de tempo total
-        server1_total = server1_df['elapsed_total_seconds']
-        server2_total = server2_df['elapsed_total_seconds']
-        
-        mean1_total = server1_total.mean()
-        mean2_total = server2_total.mean()
+        server1_total = total_values[idx1]
+        server2_total = total_values[idx2]
         
-        diff_total = abs(mean1_total - mean2_total)
-        pct_diff_total = (diff_total / min(mean1_total, mean2_total)) * 100
+        c1_total = stats_cache[(servers[0], 'elapsed_total_seconds')]
+        c2_total = stats_cache[(servers[1], 'elapsed_total_seconds')]
+        mean1_total = c1_total['mean']
+        mean2_total = c2_total['mean']
         
-        faster_total = servers[0] if mean1_total < mean2_total else servers[1]
-        slower_total = servers[1] if faster_total == servers[0] else servers[0]
+        (faster_total, slower_total, low_total, high_total,
+         diff_total, pct_diff_total) = compare_means(mean1_total, mean2_total, servers)
         
         # Teste estatístico
         test_name_total, stat_total, p_total, is_sig_total = statistical_test(server1_total, server2_total)
-        cohens_d_total = calculate_cohens_d(server1_total, server2_total)
+        cohens_d_total = cohens_d_from_moments(
+            mean1_total, c1_total['var'], c1_total['n'],
+            mean2_total, c2_total['var'], c2_total['n'],
+        )
         effect_size_total = interpret_cohens_d(cohens_d_total)
         
-        print("📊 TEMPO TOTAL (com rede e latência):")
-        print(f"   🏆 Mais rápido: {faster_total} - {min(mean1_total, mean2_total):.6f} s")
-        print(f"   🐌 Mais lento:  {slower_total} - {max(mean1_total, mean2_total):.6f} s")
-        print(f"   📊 Diferença:   {diff_total:.6f} s ({pct_diff_total:.2f}%)")
-        print(f"   📈 Teste:       {test_name_total}")
-        print(f"   📊 p-valor:     {p_total:.6f} {'(significativo)' if is_sig_total else '(não significativo)'}")
-        print(f"   📏 Cohen's d:   {cohens_d_total:.4f} (efeito {effect_size_total})")
-        print()
+        emit("📊 TEMPO TOTAL (com rede e latência):")
+        emit(f"   🏆 Mais rápido: {faster_total} - {low_total:.6f} s")
+        emit(f"   🐌 Mais lento:  {slower_total} - {high_total:.6f} s")
+        emit(f"   📊 Diferença:   {diff_total:.6f} s ({pct_diff_total:.2f}%)")
+        emit(f"   📈 Teste:       {test_name_total}")
+        emit(f"   📊 p-valor:     {p_total:.6f} {'(significativo)' if is_sig_total else '(não significativo)'}")
+        emit(f"   📏 Cohen's d:   {cohens_d_total:.4f} (efeito {effect_size_total})")
+        emit("")
         
         # Comparação de tempo do servidor (se disponível)
         server1_srv = None
@@ -299,222 +506,221 @@ def analyze_results(csv_file: str = "firebird_benchmark_results.csv"):
         has_server_data = False
         
         if has_server_time:
-            server1_srv = pd.to_numeric(server1_df['elapsed_server_seconds'].replace('', pd.NA), errors='coerce').dropna()
-            server2_srv = pd.to_numeric(server2_df['elapsed_server_seconds'].replace('', pd.NA), errors='coerce').dropna()
+            server1_srv = take_valid(srv_values, idx1)
+            server2_srv = take_valid(srv_values, idx2)
             
             if len(server1_srv) > 0 and len(server2_srv) > 0:
                 has_server_data = True
-                mean1_srv = server1_srv.mean()
-                mean2_srv = server2_srv.mean()
-                
-                diff_srv = abs(mean1_srv - mean2_srv)
-                pct_diff_srv = (diff_srv / min(mean1_srv, mean2_srv)) * 100
+                c1_srv = stats_cache[(servers[0], 'elapsed_server_seconds')]
+                c2_srv = stats_cache[(servers[1], 'elapsed_server_seconds')]
+                mean1_srv = c1_srv['mean']
+                mean2_srv = c2_srv['mean']
                 
-                faster_srv = servers[0] if mean1_srv < mean2_srv else servers[1]
-                slower_srv = servers[1] if faster_srv == servers[0] else servers[0]
+                (faster_srv, slower_srv, low_srv, high_srv,
+                 diff_srv, pct_diff_srv) = compare_means(mean1_srv, mean2_srv, servers)
                 
                 # Teste estatístico
                 test_name_srv, stat_srv, p_srv, is_sig_srv = statistical_test(server1_srv, server2_srv)
-                cohens_d_srv = calculate_cohens_d(server1_srv, server2_srv)
+                cohens_d_srv = cohens_d_from_moments(
+                    mean1_srv, c1_srv['var'], c1_srv['n'],
+                    mean2_srv, c2_srv['var'], c2_srv['n'],
+                )
                 effect_size_srv = interpret_cohens_d(cohens_d_srv)
                 
-                print("🔧 TEMPO DO SERVIDOR (processamento interno do Firebird):")
-                print(f"   🏆 Mais rápido: {faster_srv} - {min(mean1_srv, mean2_srv):.6f} s")
-                print(f"   🐌 Mais lento:  {slower_srv} - {max(mean1_srv, mean2_srv):.6f} s")
-                print(f"   📊 Diferença:   {diff_srv:.6f} s ({pct_diff_srv:.2f}%)")
-                print(f"   📈 Teste:       {test_name_srv}")
-                print(f"   📊 p-valor:     {p_srv:.6f} {'(significativo α=0.05)' if is_sig_srv else '(não significativo α=0.05)'}")
-                print(f"   📏 Cohen's d:   {cohens_d_srv:.4f} (efeito {effect_size_srv})")
-                print()
+                emit("🔧 TEMPO DO SERVIDOR (processamento interno do Firebird):")
+                emit(f"   🏆 Mais rápido: {faster_srv} - {low_srv:.6f} s")
+                emit(f"   🐌 Mais lento:  {slower_srv} - {high_srv:.6f} s")
+                emit(f"   📊 Diferença:   {diff_srv:.6f} s ({pct_diff_srv:.2f}%)")
+                emit(f"   📈 Teste:       {test_name_srv}")
+                emit(f"   📊 p-valor:     {p_srv:.6f} {'(significativo α=0.05)' if is_sig_srv else '(não significativo α=0.05)'}")
+                emit(f"   📏 Cohen's d:   {cohens_d_srv:.4f} (efeito {effect_size_srv})")
+                emit("")
         
         # Comparação de latência (se disponível)
         if has_latency:
-            server1_lat = pd.to_numeric(server1_df['latency_seconds'].replace('', pd.NA), errors='coerce').dropna()
-            server2_lat = pd.to_numeric(server2_df['latency_seconds'].replace('', pd.NA), errors='coerce').dropna()
+            lat_values = df['latency_seconds'].to_numpy()
+            server1_lat = take_valid(lat_values, idx1)
+            server2_lat = take_valid(lat_values, idx2)
             
             if len(server1_lat) > 0 and len(server2_lat) > 0:
-                mean1_lat = server1_lat.mean()
-                mean2_lat = server2_lat.mean()
+                c1_lat = stats_cache[(servers[0], 'latency_seconds')]
+                c2_lat = stats_cache[(servers[1], 'latency_seconds')]
+                mean1_lat = c1_lat['mean']
+                mean2_lat = c2_lat['mean']
                 
-                diff_lat = abs(mean1_lat - mean2_lat)
-                
-                lower_lat = servers[0] if mean1_lat < mean2_lat else servers[1]
-                higher_lat = servers[1] if lower_lat == servers[0] else servers[0]
+                lower_lat, higher_lat, low_lat, high_lat, diff_lat, _ = compare_means(
+                    mean1_lat, mean2_lat, servers
+                )
                 
                 # Teste estatístico
                 test_name_lat, stat_lat, p_lat, is_sig_lat = statistical_test(server1_lat, server2_lat)
-                cohens_d_lat = calculate_cohens_d(server1_lat, server2_lat)
+                cohens_d_lat = cohens_d_from_moments(
+                    mean1_lat, c1_lat['var'], c1_lat['n'],
+                    mean2_lat, c2_lat['var'], c2_lat['n'],
+                )
                 effect_size_lat = interpret_cohens_d(cohens_d_lat)
                 
-                print("🌐 LATÊNCIA DE REDE:")
-                print(f"   🏆 Menor latência: {lower_lat} - {min(mean1_lat, mean2_lat):.6f} s")
-                print(f"   📡 Maior latência: {higher_lat} - {max(mean1_lat, mean2_lat):.6f} s")
-                print(f"   📊 Diferença:      {diff_lat:.6f} s")
-                print(f"   📈 Teste:          {test_name_lat}")
-                print(f"   📊 p-valor:        {p_lat:.6f} {'(significativo)' if is_sig_lat else '(não significativo)'}")
-                print(f"   📏 Cohen's d:      {cohens_d_lat:.4f} (efeito {effect_size_lat})")
-                print()
+                emit("🌐 LATÊNCIA DE REDE:")
+                emit(f"   🏆 Menor latência: {lower_lat} - {low_lat:.6f} s")
+                emit(f"   📡 Maior latência: {higher_lat} - {high_lat:.6f} s")
+                emit(f"   📊 Diferença:      {diff_lat:.6f} s")
+                emit(f"   📈 Teste:          {test_name_lat}")
+                emit(f"   📊 p-valor:        {p_lat:.6f} {'(significativo)' if is_sig_lat else '(não significativo)'}")
+                emit(f"   📏 Cohen's d:      {cohens_d_lat:.4f} (efeito {effect_size_lat})")
+                emit("")
         
         # Interpretação científica
-        print("=" * 70)
-        print("🔬 INTERPRETAÇÃO CIENTÍFICA DOS RESULTADOS")
-        print("=" * 70)
-        print()
+        emit("=" * 70)
+        emit("🔬 INTERPRETAÇÃO CIENTÍFICA DOS RESULTADOS")
+        emit("=" * 70)
+        emit("")
         
         if has_server_data:
-            print(f"📊 Significância Estatística (α = 0.05):")
+            emit(f"📊 Significância Estatística (α = 0.05):")
             if is_sig_srv:
-                print(f"   ✅ A diferença no tempo de processamento do servidor é")
-                print(f"      ESTATISTICAMENTE SIGNIFICATIVA (p = {p_srv:.6f})")
-                print(f"   ✅ Podemos rejeitar a hipótese nula (H0: μ₁ = μ₂)")
-                print(f"   ✅ Conclusão: {faster_srv} é REALMENTE mais rápido que {slower_srv}")
+                emit(f"   ✅ A diferença no tempo de processamento do servidor é")
+                emit(f"      ESTATISTICAMENTE SIGNIFICATIVA (p = {p_srv:.6f})")
+                emit(f"   ✅ Podemos rejeitar a hipótese nula (H0: μ₁ = μ₂)")
+                emit(f"   ✅ Conclusão: {faster_srv} é REALMENTE mais rápido que {slower_srv}")
             else:
-                print(f"   ⚠️  A diferença no tempo de processamento do servidor")
-                print(f"      NÃO É ESTATISTICAMENTE SIGNIFICATIVA (p = {p_srv:.6f})")
-                print(f"   ⚠️  Não podemos rejeitar a hipótese nula (H0: μ₁ = μ₂)")
-                print(f"   ⚠️  Conclusão: A diferença observada pode ser devido ao acaso")
-            print()
+                emit(f"   ⚠️  A diferença no tempo de processamento do servidor")
+                emit(f"      NÃO É ESTATISTICAMENTE SIGNIFICATIVA (p = {p_srv:.6f})")
+                emit(f"   ⚠️  Não podemos rejeitar a hipótese nula (H0: μ₁ = μ₂)")
+                emit(f"   ⚠️  Conclusão: A diferença observada pode ser devido ao acaso")
+            emit("")
             
-            print(f"📏 Tamanho do Efeito (Cohen's d = {cohens_d_srv:.4f}):")
+            emit(f"📏 Tamanho do Efeito (Cohen's d = {cohens_d_srv:.4f}):")
             if abs(cohens_d_srv) < 0.2:
-                print(f"   → Efeito INSIGNIFICANTE (Cohen, 1988)")
-                print(f"   → Diferença muito pequena, sem relevância prática")
+                emit(f"   → Efeito INSIGNIFICANTE (Cohen, 1988)")
+                emit(f"   → Diferença muito pequena, sem relevância prática")
             elif abs(cohens_d_srv) < 0.5:
-                print(f"   → Efeito PEQUENO (Cohen, 1988)")
-                print(f"   → Diferença detectável mas de impacto limitado")
+                emit(f"   → Efeito PEQUENO (Cohen, 1988)")
+                emit(f"   → Diferença detectável mas de impacto limitado")
             elif abs(cohens_d_srv) < 0.8:
-                print(f"   → Efeito MÉDIO (Cohen, 1988)")
-                print(f"   → Diferença substancial com relevância prática")
+                emit(f"   → Efeito MÉDIO (Cohen, 1988)")
+                emit(f"   → Diferença substancial com relevância prática")
             else:
-                print(f"   → Efeito GRANDE (Cohen, 1988)")
-                print(f"   → Diferença muito substancial, altamente relevante")
-            print()
+                emit(f"   → Efeito GRANDE (Cohen, 1988)")
+                emit(f"   → Diferença muito substancial, altamente relevante")
+            emit("")
             
-            print(f"🎯 Recomendação:")
+            emit(f"🎯 Recomendação:")
             if is_sig_srv and abs(cohens_d_srv) >= 0.5:
-                print(f"   ✅ A diferença é tanto estatisticamente significativa quanto")
-                print(f"      praticamente relevante. {faster_srv} apresenta performance")
-                print(f"      superior com {pct_diff_srv:.1f}% de vantagem.")
-                print(f"   ✅ Recomenda-se {faster_srv} para ambientes de produção.")
+                emit(f"   ✅ A diferença é tanto estatisticamente significativa quanto")
+                emit(f"      praticamente relevante. {faster_srv} apresenta performance")
+                emit(f"      superior com {pct_diff_srv:.1f}% de vantagem.")
+                emit(f"   ✅ Recomenda-se {faster_srv} para ambientes de produção.")
             elif is_sig_srv and abs(cohens_d_srv) < 0.5:
-                print(f"   ⚠️  Embora estatisticamente significativa, a diferença")
-                print(f"      ({pct_diff_srv:.1f}%) tem efeito {effect_size_srv}.")
-                print(f"   ⚠️  Considere outros fatores (custo, manutenção, expertise)")
-                print(f"      além da performance pura.")
+                emit(f"   ⚠️  Embora estatisticamente significativa, a diferença")
+                emit(f"      ({pct_diff_srv:.1f}%) tem efeito {effect_size_srv}.")
+                emit(f"   ⚠️  Considere outros fatores (custo, manutenção, expertise)")
+                emit(f"      além da performance pura.")
             else:
-                print(f"   ℹ️  A diferença observada ({pct_diff_srv:.1f}%) não é")
-                print(f"      estatisticamente significativa.")
-                print(f"   ℹ️  Ambos os servidores têm performance equivalente.")
-                print(f"   ℹ️  Escolha pode ser baseada em outros critérios.")
+                emit(f"   ℹ️  A diferença observada ({pct_diff_srv:.1f}%) não é")
+                emit(f"      estatisticamente significativa.")
+                emit(f"   ℹ️  Ambos os servidores têm performance equivalente.")
+                emit(f"   ℹ️  Escolha pode ser baseada em outros critérios.")
         
-        print()
-        print("📚 REFERÊNCIAS METODOLÓGICAS:")
-        print("   • Shapiro, S.S. & Wilk, M.B. (1965). An analysis of variance")
-        print("     test for normality (complete samples)")
-        print("   • Student (1908). The probable error of a mean")
-        print("   • Mann, H.B. & Whitney, D.R. (1947). On a test of whether")
-        print("     one of two random variables is stochastically larger")
-        print("   • Cohen, J. (1988). Statistical power analysis for the")
-        print("     behavioral sciences (2nd ed.)")
-        print("   • Tukey, J.W. (1977). Exploratory Data Analysis")
-        print()
+        emit("")
+        emit("📚 REFERÊNCIAS METODOLÓGICAS:")
+        emit("   • Shapiro, S.S. & Wilk, M.B. (1965). An analysis of variance")
+        emit("     test for normality (complete samples)")
+        emit("   • D'Agostino, R.B. & Pearson, E.S. (1973). Tests for departure")
+        emit("     from normality")
+        emit("   • Student (1908). The probable error of a mean")
+        emit("   • Welch, B.L. (1947). The generalization of \"Student's\"")
+        emit("     problem when several different population variances are involved")
+        emit("   • Mann, H.B. & Whitney, D.R. (1947). On a test of whether")
+        emit("     one of two random variables is stochastically larger")
+        emit("   • Cohen, J. (1988). Statistical power analysis for the")
+        emit("     behavioral sciences (2nd ed.)")
+        emit("   • Tukey, J.W. (1977). Exploratory Data Analysis")
+        emit("")
         higher_lat = servers[1] if lower_lat == servers[0] else servers[0]
         
-        print("🌐 LATÊNCIA DE REDE:")
-        print(f"   🏆 Menor latência: {lower_lat} - {min(mean1_lat, mean2_lat):.6f} s")
-        print(f"   📡 Maior latência: {higher_lat} - {max(mean1_lat, mean2_lat):.6f} s")
-        print(f"   📊 Diferença:      {diff_lat:.6f} s")
-        print()
+        emit("🌐 LATÊNCIA DE REDE:")
+        emit(f"   🏆 Menor latência: {lower_lat} - {min(mean1_lat, mean2_lat):.6f} s")
+        emit(f"   📡 Maior latência: {higher_lat} - {max(mean1_lat, mean2_lat):.6f} s")
+        emit(f"   📊 Diferença:      {diff_lat:.6f} s")
+        emit("")
         
         # Interpretação
-        print("🔍 INTERPRETAÇÃO:")
+        emit("🔍 INTERPRETAÇÃO:")
         if has_server_time and len(server1_srv) > 0 and len(server2_srv) > 0:
             if pct_diff_srv < 5:
-                print("   ✅ Performance do banco similar entre servidores (< 5%)")
+                emit("   ✅ Performance do banco similar entre servidores (< 5%)")
             elif pct_diff_srv < 15:
-                print("   ⚠️  Diferença moderada de performance do banco (5-15%)")
+                emit("   ⚠️  Diferença moderada de performance do banco (5-15%)")
             else:
-                print(f"   🔴 Diferença significativa! {faster_srv} processa {pct_diff_srv:.1f}% mais rápido")
+                emit(f"   🔴 Diferença significativa! {faster_srv} processa {pct_diff_srv:.1f}% mais rápido")
         
         if pct_diff_total < 5:
-            print("   ✅ Performance total similar (< 5%)")
+            emit("   ✅ Performance total similar (< 5%)")
         elif pct_diff_total < 15:
-            print("   ⚠️  Diferença moderada na experiência do usuário (5-15%)")
+            emit("   ⚠️  Diferença moderada na experiência do usuário (5-15%)")
         else:
-            print(f"   🔴 {faster_total} oferece experiência {pct_diff_total:.1f}% mais rápida")
+            emit(f"   🔴 {faster_total} oferece experiência {pct_diff_total:.1f}% mais rápida")
     
-    print()
+    emit("")
     
     # Tabela de estatísticas descritivas
-    print("=" * 70)
-    print("📋 TABELA DE ESTATÍSTICAS DESCRITIVAS")
-    print("=" * 70)
-    print()
-    print("Tempo Total:")
-    print(df.groupby('server')['elapsed_total_seconds'].describe())
-    print()
-    
-    if has_server_time:
-        server_times_df = df[['server', 'elapsed_server_seconds']].copy()
-        server_times_df['elapsed_server_seconds'] = pd.to_numeric(
-            server_times_df['elapsed_server_seconds'].replace('', pd.NA), 
-            errors='coerce'
-        )
-        server_times_df = server_times_df.dropna()
-        if len(server_times_df) > 0:
-            print("Tempo do Servidor:")
-            print(server_times_df.groupby('server')['elapsed_server_seconds'].describe())
-            print()
-    
-    if has_latency:
-        latency_df = df[['server', 'latency_seconds']].copy()
-        latency_df['latency_seconds'] = pd.to_numeric(
-            latency_df['latency_seconds'].replace('', pd.NA), 
-            errors='coerce'
-        )
-        latency_df = latency_df.dropna()
-        if len(latency_df) > 0:
-            print("Latência:")
-            print(latency_df.groupby('server')['latency_seconds'].describe())
-            print()
+    emit("=" * 70)
+    emit("📋 TABELA DE ESTATÍSTICAS DESCRITIVAS")
+    emit("=" * 70)
+    emit("")
+    # Equivalente ao describe(), servido inteiro do summary (nenhuma passada nova)
+    table_titles = {
+        'elapsed_total_seconds': "Tempo Total:",
+        'elapsed_server_seconds': "Tempo do Servidor:",
+        'latency_seconds': "Latência:",
+    }
+    for col in metric_cols:
+        table = describe_from_summary(summary[col])
+        if len(table) > 0:
+            emit(table_titles[col])
+            table.to_string(buf=report)
+            report.write("\n")
+            emit("")
     
     # Sugestão de visualização
-    print("=" * 70)
-    print("📈 DICAS DE VISUALIZAÇÃO")
-    print("=" * 70)
-    print()
-    print("Para visualizar graficamente, você pode:")
-    print()
-    print("1. Importar em Excel/LibreOffice e criar gráficos")
-    print()
-    print("2. Usar Python com matplotlib:")
-    print("   ```python")
-    print("   import pandas as pd")
-    print("   import matplotlib.pyplot as plt")
-    print()
-    print("   df = pd.read_csv('firebird_benchmark_results.csv', sep=';')")
-    print("   ")
-    print("   # Comparar tempos totais")
-    print("   df.boxplot(by='server', column='elapsed_total_seconds')")
-    print("   plt.ylabel('Tempo Total (segundos)')")
-    print("   plt.title('Comparação de Performance - Tempo Total')")
-    print("   plt.suptitle('')")
-    print("   plt.show()")
-    print("   ")
-    print("   # Comparar tempos do servidor (sem rede)")
-    print("   df_srv = df[df['elapsed_server_seconds'] != ''].copy()")
-    print("   df_srv['elapsed_server_seconds'] = pd.to_numeric(df_srv['elapsed_server_seconds'])")
-    print("   df_srv.boxplot(by='server', column='elapsed_server_seconds')")
-    print("   plt.ylabel('Tempo Servidor (segundos)')")
-    print("   plt.title('Comparação - Processamento Interno Firebird')")
-    print("   plt.suptitle('')")
-    print("   plt.show()")
-    print("   ```")
-    print()
-    print("3. Usar ferramentas online como:")
-    print("   - Google Sheets")
-    print("   - Plotly Chart Studio")
-    print()
+    emit("=" * 70)
+    emit("📈 DICAS DE VISUALIZAÇÃO")
+    emit("=" * 70)
+    emit("")
+    emit("Para visualizar graficamente, você pode:")
+    emit("")
+    emit("1. Importar em Excel/LibreOffice e criar gráficos")
+    emit("")
+    emit("2. Usar Python com matplotlib:")
+    emit("   ```python")
+    emit("   import pandas as pd")
+    emit("   import matplotlib.pyplot as plt")
+    emit("")
+    emit("   df = pd.read_csv('firebird_benchmark_results.csv', sep=';')")
+    emit("   ")
+    emit("   # Comparar tempos totais")
+    emit("   df.boxplot(by='server', column='elapsed_total_seconds')")
+    emit("   plt.ylabel('Tempo Total (segundos)')")
+    emit("   plt.title('Comparação de Performance - Tempo Total')")
+    emit("   plt.suptitle('')")
+    emit("   plt.show()")
+    emit("   ")
+    emit("   # Comparar tempos do servidor (sem rede)")
+    emit("   df_srv = df[df['elapsed_server_seconds'] != ''].copy()")
+    emit("   df_srv['elapsed_server_seconds'] = pd.to_numeric(df_srv['elapsed_server_seconds'])")
+    emit("   df_srv.boxplot(by='server', column='elapsed_server_seconds')")
+    emit("   plt.ylabel('Tempo Servidor (segundos)')")
+    emit("   plt.title('Comparação - Processamento Interno Firebird')")
+    emit("   plt.suptitle('')")
+    emit("   plt.show()")
+    emit("   ```")
+    emit("")
+    emit("3. Usar ferramentas online como:")
+    emit("   - Google Sheets")
+    emit("   - Plotly Chart Studio")
+    emit("")
+    
+    sys.stdout.write(report.getvalue())
 
 
 if __name__ == "__main__":
@@ -6,8 +6,8 @@ Este script implementa metodologia científica para análise de performance
 com foco em comparação por IP/servidor (não por plataforma/OS).
 
 Metodologia:
-- Testes de normalidade (Shapiro-Wilk)
-- Testes de significância estatística (t-test ou Mann-Whitney U)
+- Testes de normalidade (Shapiro-Wilk; D'Agostino-Pearson K² para amostras grandes)
+- Testes de significância estatística (Welch t-test ou Mann-Whitney U)
 - Cálculo de intervalo de confiança (95%)
 - Análise de outliers (Tukey IQR)
 - Tamanho do efeito (Cohen's d)
@@ -15,33 +15,55 @@ Metodologia:
 
 Referências:
 - Shapiro, S. S., & Wilk, M. B. (1965). An analysis of variance test for normality
+- D'Agostino, R. B., & Pearson, E. S. (1973). Tests for departure from normality
 - Student (1908). The probable error of a mean
+- Welch, B. L. (1947). The generalization of "Student's" problem when several
+  different population variances are involved
 - Mann, H. B., & Whitney, D. R. (1947). On a test of whether one of two random 
   variables is stochastically larger than the other
 - Cohen, J. (1988). Statistical power analysis for the behavioral sciences
 """
 
+import io
 import sys
 from pathlib import Path
 from typing import Tuple, List, Dict, Any
-from itertools import combinations
 import math
 
 # Verificar dependências
 try:
     import pandas as pd
-    import statistics
-    from scipy import stats
+    from scipy import stats, special
     import numpy as np
 except ImportError as e:
     print("Este script requer pandas, scipy e numpy. Instale com:")
     print("  uv pip install pandas scipy numpy")
     sys.exit(1)
 
+# PyArrow é opcional: quando instalado, o CSV é lido pelo parser multithread do Arrow
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+# Núcleos numéricos (compilados com Numba se instalado; NumPy puro caso contrário)
+from _fastmath import iqr_outliers
+
+# A partir deste n (em ambos os grupos) a comparação usa Welch t-test (TCL)
+WELCH_MIN_N = 30
+
+# Acima deste n a normalidade usa D'Agostino K² (uma passada de momentos, sem ordenação)
+SHAPIRO_MAX_N = 50
+
 
-def calculate_cohens_d(group1: pd.Series, group2: pd.Series) -> float:
+def cohens_d_matrix(n: np.ndarray, means: np.ndarray, variances: np.ndarray) -> np.ndarray:
     """
-    Calcula Cohen's d para medir o tamanho do efeito.
+    Cohen's d de todos os pares de servidores em uma única operação.
+    
+    d[i, j] = (média_i - média_j) / desvio_padrão_combinado(i, j), a partir de
+    n, média e variância amostral (ddof=1) de cada servidor; 0 quando o
+    desvio combinado é nulo.
     
     Interpretação (Cohen, 1988):
     - |d| < 0.2: efeito insignificante
@@ -49,10 +71,12 @@ def calculate_cohens_d(group1: pd.Series, group2: pd.Series) -> float:
     - 0.5 ≤ |d| < 0.8: efeito médio
     - |d| ≥ 0.8: efeito grande
     """
-    n1, n2 = len(group1), len(group2)
-    var1, var2 = group1.var(), group2.var()
-    pooled_std = math.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2))
-    return (group1.mean() - group2.mean()) / pooled_std if pooled_std > 0 else 0
+    n_i, n_j = n[:, None], n[None, :]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pooled_std = np.sqrt(
+            ((n_i - 1) * variances[:, None] + (n_j - 1) * variances[None, :]) / (n_i + n_j - 2)
+        )
+        return np.where(pooled_std > 0, (means[:, None] - means[None, :]) / pooled_std, 0.0)
 
 
 def interpret_cohens_d(d: float) -> str:
@@ -68,62 +92,125 @@ def interpret_cohens_d(d: float) -> str:
         return "grande"
 
 
-def test_normality(data: pd.Series) -> Tuple[float, float, bool]:
+def normality_test_name(n: int) -> str:
+    """Nome do teste de normalidade aplicado por test_normality para n amostras."""
+    return "Shapiro-Wilk" if n <= SHAPIRO_MAX_N else "D'Agostino K²"
+
+
+def test_normality(data: np.ndarray) -> Tuple[float, float, bool]:
     """
-    Testa normalidade usando Shapiro-Wilk.
+    Testa normalidade usando Shapiro-Wilk (n <= SHAPIRO_MAX_N) ou
+    D'Agostino-Pearson K² (n maior).
     
     H0: Os dados seguem distribuição normal
     Se p > 0.05, não rejeitamos H0 (dados são normais)
     """
     if len(data) < 3:
         return 0, 0, False
-    # Shapiro-Wilk tem limite de 5000 amostras
-    sample = data.sample(min(5000, len(data)), random_state=42) if len(data) > 5000 else data
-    stat, p = stats.shapiro(sample)
+    if len(data) > SHAPIRO_MAX_N:
+        # Shapiro-Wilk é hipersensível e O(N log N) para n grande
+        stat, p = stats.normaltest(data)
+    else:
+        stat, p = stats.shapiro(data)
     return stat, p, p > 0.05
 
 
-def statistical_test(group1: pd.Series, group2: pd.Series) -> Tuple[str, float, float, bool]:
+def mann_whitney_sorted(a: np.ndarray, b: np.ndarray) -> Tuple[float, float]:
+    """
+    Mann-Whitney U bilateral a partir de dois arrays já ordenados.
+    
+    Mesmo resultado (U1, p-valor) de stats.mannwhitneyu(a, b), mas sem
+    re-ranquear a amostra combinada a cada par: U1 vem de searchsorted sobre
+    o outro grupo ordenado e as contagens de empates de uma única varredura
+    da junção dos dois. Segue o mesmo critério do SciPy para escolher entre
+    distribuição exata (amostras pequenas sem empates, delegada ao SciPy) e
+    aproximação normal com correção de empates e de continuidade.
+    """
+    n1, n2 = a.size, b.size
+    # U1 = #{(x, y): x > y} + 0.5 * #{x == y}
+    u1 = (np.searchsorted(b, a, 'left').sum() + np.searchsorted(b, a, 'right').sum()) / 2
+    
+    merged = np.sort(np.concatenate((a, b)), kind='stable')
+    bounds = np.flatnonzero(np.diff(merged)) + 1
+    ties = np.diff(np.concatenate(([0], bounds, [merged.size])))
+    if (n1 <= 8 or n2 <= 8) and ties.size == merged.size:
+        stat, p = stats.mannwhitneyu(a, b, alternative='two-sided')
+        return stat, p
+    
+    n = n1 + n2
+    ties = ties.astype(np.float64)
+    tie_term = (ties**3 - ties).sum()
+    s = math.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+    numerator = u1 - n1 * n2 / 2
+    numerator -= 0.5 * np.sign(numerator)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = np.float64(numerator) / s
+    p = min(max(2 * special.ndtr(-abs(z)), 0.0), 1.0)
+    return u1, p
+
+
+def statistical_test(group1: np.ndarray, group2: np.ndarray) -> Tuple[str, float, float, bool]:
     """
     Realiza teste estatístico apropriado.
     
-    Se ambos grupos são normais: t-test independente
-    Caso contrário: Mann-Whitney U test
-    """
-    _, _, normal1 = test_normality(group1)
-    _, _, normal2 = test_normality(group2)
+    Se ambos grupos têm n >= WELCH_MIN_N: Welch t-test (Welch, 1947), robusto à
+    não-normalidade pelo Teorema Central do Limite e a variâncias diferentes
+    Caso contrário: Mann-Whitney U test (Mann & Whitney, 1947)
     
-    if normal1 and normal2:
-        stat, p = stats.ttest_ind(group1, group2)
-        test_name = "t-test (Student, 1908)"
+    A escolha depende só de n, como em analyze_results.py. Os grupos devem
+    vir ordenados (ordenados uma vez por servidor).
+    """
+    if min(group1.size, group2.size) >= WELCH_MIN_N:
+        # t-test sem assumir variâncias iguais
+        stat, p = stats.ttest_ind(group1, group2, equal_var=False)
+        test_name = "Welch t-test (Welch, 1947)"
     else:
-        stat, p = stats.mannwhitneyu(group1, group2, alternative='two-sided')
+        stat, p = mann_whitney_sorted(group1, group2)
         test_name = "Mann-Whitney U (1947)"
     
     return test_name, stat, p, p < 0.05
 
 
-def confidence_interval(data: pd.Series, confidence: float = 0.95) -> Tuple[float, float]:
-    """Calcula intervalo de confiança para a média."""
-    n = len(data)
-    if n < 2:
-        return data.mean(), data.mean()
-    
-    mean = data.mean()
-    se = stats.sem(data)
-    margin = se * stats.t.ppf((1 + confidence) / 2, n - 1)
-    return mean - margin, mean + margin
+def confidence_intervals(n: np.ndarray, means: np.ndarray, stds: np.ndarray,
+                         confidence: float = 0.95) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Intervalos de confiança da média de todos os servidores de uma vez.
+    
+    Um único stats.t.ppf com o vetor de graus de liberdade; servidores com
+    menos de 2 execuções ficam com intervalo degenerado [média, média].
+    """
+    valid = n >= 2
+    dof = np.where(valid, n - 1, 1)
+    margin = stats.t.ppf((1 + confidence) / 2, dof) * stds / np.sqrt(n)
+    margin = np.where(valid, margin, 0.0)
+    return means - margin, means + margin
+
+
+def detect_outliers(data: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Detecta outliers usando método IQR (Tukey, 1977).
+    
+    Outliers: valores fora de [Q1 - 1.5*IQR, Q3 + 1.5*IQR]
+    """
+    outliers, n_outliers = iqr_outliers(np.ascontiguousarray(data, dtype=np.float64))
+    return outliers, int(n_outliers)
 
 
-def detect_outliers(data: pd.Series) -> Tuple[pd.Series, int]:
-    """Detecta outliers usando método IQR (Tukey, 1977)."""
-    Q1 = data.quantile(0.25)
-    Q3 = data.quantile(0.75)
-    IQR = Q3 - Q1
-    lower_bound = Q1 - 1.5 * IQR
-    upper_bound = Q3 + 1.5 * IQR
-    outliers = data[(data < lower_bound) | (data > upper_bound)]
-    return outliers, len(outliers)
+def read_timings_csv(csv_path: Path, server_col: str) -> pd.DataFrame:
+    """
+    Lê só as duas colunas usadas na análise: identificador do servidor e
+    elapsed_total_seconds (já como float64 no parser do PyArrow).
+    
+    Se o PyArrow não estiver instalado ou rejeitar o arquivo, usa o parser C.
+    """
+    usecols = [server_col, 'elapsed_total_seconds']
+    if CSV_ENGINE == 'pyarrow':
+        try:
+            return pd.read_csv(csv_path, sep=';', usecols=usecols,
+                               dtype={'elapsed_total_seconds': 'float64'}, engine='pyarrow')
+        except ValueError:
+            pass
+    return pd.read_csv(csv_path, sep=';', usecols=usecols)
 
 
 def analyze_results_by_ip(csv_file: str = "benchmark_results.csv"):
@@ -136,90 +223,113 @@ def analyze_results_by_ip(csv_file: str = "benchmark_results.csv"):
         print("  uv run python -m src.compare_firebird_diferent_os.main_new")
         return
     
-    # Ler CSV
-    df = pd.read_csv(csv_path, sep=';')
+    # Relatório montado em memória e emitido com uma única escrita no stdout
+    report = io.StringIO()
     
-    print("=" * 80)
-    print("📊 ANÁLISE ESTATÍSTICA DE BENCHMARK - COMPARAÇÃO POR IP/SERVIDOR")
-    print("   Metodologia Científica com Testes de Significância")
-    print("=" * 80)
-    print()
-    
-    # Informações gerais
-    print(f"📁 Arquivo: {csv_file}")
-    print(f"📈 Total de execuções: {len(df)}")
+    def emit(line: str) -> None:
+        report.write(line)
+        report.write("\n")
     
+    # Ler CSV: cabeçalho primeiro, depois só as colunas analisadas
+    columns = pd.read_csv(csv_path, sep=';', nrows=0).columns
     # Usar server_name como identificador (coluna correta do CSV)
-    server_col = 'server_name' if 'server_name' in df.columns else 'server'
+    server_col = 'server_name' if 'server_name' in columns else 'server'
+    df = read_timings_csv(csv_path, server_col)
     
-    # Extrair IPs únicos
-    servers = df[server_col].unique()
-    print(f"🖥️  Servidores testados ({len(servers)} IPs):")
+    emit("=" * 80)
+    emit("📊 ANÁLISE ESTATÍSTICA DE BENCHMARK - COMPARAÇÃO POR IP/SERVIDOR")
+    emit("   Metodologia Científica com Testes de Significância")
+    emit("=" * 80)
+    emit("")
+    
+    # Informações gerais
+    emit(f"📁 Arquivo: {csv_file}")
+    emit(f"📈 Total de execuções: {len(df)}")
+    
+    # Tempos de cada IP materializados uma única vez como ndarray float64
+    # (ordem de primeira aparição); todas as seções seguintes só leem este cache
+    times = pd.to_numeric(df['elapsed_total_seconds'], errors='coerce')
+    groups = {
+        name: grp.dropna().to_numpy(dtype=np.float64)
+        for name, grp in times.groupby(df[server_col], sort=False)
+    }
+    servers = list(groups)
+    server_pos = {s: i for i, s in enumerate(servers)}
+    # Cópias ordenadas, feitas uma vez: cada par de Mann-Whitney só faz buscas binárias
+    sorted_groups = {s: np.sort(arr) for s, arr in groups.items()}
+    means = {s: arr.mean() for s, arr in groups.items()}
+    
+    # n, média e desvio por servidor em vetores; IC 95% de todos numa chamada só
+    n_vec = np.array([groups[s].size for s in servers], dtype=np.float64)
+    mean_vec = np.array([means[s] for s in servers])
+    var_vec = np.array([groups[s].var(ddof=1) for s in servers])
+    std_vec = np.sqrt(var_vec)
+    ci_lower_vec, ci_upper_vec = confidence_intervals(n_vec, mean_vec, std_vec)
+    
+    emit(f"🖥️  Servidores testados ({len(servers)} IPs):")
     for s in servers:
-        count = len(df[df[server_col] == s])
-        print(f"      • {s}: {count} execuções")
-    print()
+        emit(f"      • {s}: {len(groups[s])} execuções")
+    emit("")
     
     # Verificar colunas disponíveis
-    has_latency = 'latency_seconds' in df.columns
-    has_server_time = 'elapsed_server_seconds' in df.columns
+    has_latency = 'latency_seconds' in columns
+    has_server_time = 'elapsed_server_seconds' in columns
     
     # ========== ESTATÍSTICAS DESCRITIVAS POR IP ==========
-    print("=" * 80)
-    print("📊 ESTATÍSTICAS DESCRITIVAS POR IP")
-    print("=" * 80)
-    print()
+    emit("=" * 80)
+    emit("📊 ESTATÍSTICAS DESCRITIVAS POR IP")
+    emit("=" * 80)
+    emit("")
     
     server_stats = []
     
-    for server in servers:
-        server_df = df[df[server_col] == server]
-        total_times = server_df['elapsed_total_seconds']
+    for pos, server in enumerate(servers):
+        total_times = groups[server]
         
         # Calcular estatísticas
         outliers, n_outliers = detect_outliers(total_times)
-        ci_lower, ci_upper = confidence_interval(total_times)
-        _, p_shapiro, is_normal = test_normality(total_times)
+        ci_lower, ci_upper = ci_lower_vec[pos], ci_upper_vec[pos]
+        _, p_normal, is_normal = test_normality(total_times)
         
         stats_dict = {
             'server': server,
             'n': len(total_times),
-            'mean': total_times.mean(),
-            'median': total_times.median(),
-            'std': total_times.std(),
+            'mean': means[server],
+            'median': np.median(total_times),
+            'std': std_vec[pos],
             'min': total_times.min(),
             'max': total_times.max(),
             'ci_lower': ci_lower,
             'ci_upper': ci_upper,
-            'cv': (total_times.std() / total_times.mean() * 100),
+            'cv': (std_vec[pos] / means[server] * 100),
             'outliers': n_outliers,
             'is_normal': is_normal,
-            'p_shapiro': p_shapiro,
+            'p_normal': p_normal,
             'data': total_times
         }
         server_stats.append(stats_dict)
         
-        print(f"🖥️  IP: {server}")
-        print(f"   ├─ Execuções:    {stats_dict['n']}")
-        print(f"   ├─ Média:        {stats_dict['mean']*1000:.2f} ms")
-        print(f"   ├─ IC 95%:       [{ci_lower*1000:.2f}, {ci_upper*1000:.2f}] ms")
-        print(f"   ├─ Mediana:      {stats_dict['median']*1000:.2f} ms")
-        print(f"   ├─ Mínimo:       {stats_dict['min']*1000:.2f} ms")
-        print(f"   ├─ Máximo:       {stats_dict['max']*1000:.2f} ms")
-        print(f"   ├─ Desvio:       {stats_dict['std']*1000:.2f} ms")
-        print(f"   ├─ CV:           {stats_dict['cv']:.1f}%")
-        print(f"   ├─ Outliers:     {n_outliers}")
-        print(f"   └─ Normalidade:  {'Normal' if is_normal else 'Não-normal'} (p={p_shapiro:.4f})")
-        print()
+        emit(f"🖥️  IP: {server}")
+        emit(f"   ├─ Execuções:    {stats_dict['n']}")
+        emit(f"   ├─ Média:        {stats_dict['mean']*1000:.2f} ms")
+        emit(f"   ├─ IC 95%:       [{ci_lower*1000:.2f}, {ci_upper*1000:.2f}] ms")
+        emit(f"   ├─ Mediana:      {stats_dict['median']*1000:.2f} ms")
+        emit(f"   ├─ Mínimo:       {stats_dict['min']*1000:.2f} ms")
+        emit(f"   ├─ Máximo:       {stats_dict['max']*1000:.2f} ms")
+        emit(f"   ├─ Desvio:       {stats_dict['std']*1000:.2f} ms")
+        emit(f"   ├─ CV:           {stats_dict['cv']:.1f}%")
+        emit(f"   ├─ Outliers:     {n_outliers}")
+        emit(f"   └─ Normalidade:  {'Normal' if is_normal else 'Não-normal'} ({normality_test_name(stats_dict['n'])} p={p_normal:.4f})")
+        emit("")
     
     # Ordenar por média (mais rápido primeiro)
     server_stats.sort(key=lambda x: x['mean'])
     
     # ========== RANKING DE PERFORMANCE ==========
-    print("=" * 80)
-    print("🏆 RANKING DE PERFORMANCE (por tempo médio)")
-    print("=" * 80)
-    print()
+    emit("=" * 80)
+    emit("🏆 RANKING DE PERFORMANCE (por tempo médio)")
+    emit("=" * 80)
+    emit("")
     
     medals = ["🥇", "🥈", "🥉"] + [f"#{i}" for i in range(4, 11)]
     
@@ -230,31 +340,41 @@ def analyze_results_by_ip(csv_file: str = "benchmark_results.csv"):
             pct = ((stat['mean'] - server_stats[0]['mean']) / server_stats[0]['mean']) * 100
             diff_vs_best = f" (+{pct:.1f}% vs melhor)"
         
-        print(f"   {medal} {stat['server']}: {stat['mean']*1000:.2f} ms{diff_vs_best}")
+        emit(f"   {medal} {stat['server']}: {stat['mean']*1000:.2f} ms{diff_vs_best}")
     
-    print()
+    emit("")
     
     # ========== COMPARAÇÕES PAREADAS ==========
-    print("=" * 80)
-    print("⚖️  COMPARAÇÕES PAREADAS ENTRE IPs")
-    print("=" * 80)
-    print()
+    emit("=" * 80)
+    emit("⚖️  COMPARAÇÕES PAREADAS ENTRE IPs")
+    emit("=" * 80)
+    emit("")
     
     comparisons = []
     
-    for (s1, s2) in combinations(servers, 2):
-        data1 = df[df[server_col] == s1]['elapsed_total_seconds']
-        data2 = df[df[server_col] == s2]['elapsed_total_seconds']
+    # Cohen's d de todos os pares de uma vez (vetores por servidor já calculados)
+    d_matrix = cohens_d_matrix(n_vec, mean_vec, var_vec)
+    
+    # Todos os pares (i < j, mesma ordem de combinations) calculados em lote
+    pair_i, pair_j = np.triu_indices(len(servers), k=1)
+    pair_mean1, pair_mean2 = mean_vec[pair_i], mean_vec[pair_j]
+    pair_diff = np.abs(pair_mean1 - pair_mean2)
+    pair_pct = (pair_diff / np.minimum(pair_mean1, pair_mean2)) * 100
+    pair_first_faster = pair_mean1 < pair_mean2
+    pair_d = d_matrix[pair_i, pair_j]
+    
+    for k, (i, j) in enumerate(zip(pair_i, pair_j)):
+        s1, s2 = servers[i], servers[j]
+        mean1, mean2 = pair_mean1[k], pair_mean2[k]
+        diff = pair_diff[k]
+        pct_diff = pair_pct[k]
         
-        mean1, mean2 = data1.mean(), data2.mean()
-        diff = abs(mean1 - mean2)
-        pct_diff = (diff / min(mean1, mean2)) * 100
+        faster, slower = (s1, s2) if pair_first_faster[k] else (s2, s1)
         
-        faster = s1 if mean1 < mean2 else s2
-        slower = s2 if faster == s1 else s1
-        
-        test_name, stat, p_value, is_sig = statistical_test(data1, data2)
-        cohens_d = calculate_cohens_d(data1, data2)
+        test_name, stat, p_value, is_sig = statistical_test(
+            sorted_groups[s1], sorted_groups[s2]
+        )
+        cohens_d = pair_d[k]
         effect_size = interpret_cohens_d(cohens_d)
         
         comp = {
@@ -276,20 +396,20 @@ def analyze_results_by_ip(csv_file: str = "benchmark_results.csv"):
         
         sig_icon = "✅" if is_sig else "⚠️"
         
-        print(f"📌 {s1} vs {s2}")
-        print(f"   ├─ Mais rápido: {faster} ({min(mean1, mean2)*1000:.2f} ms)")
-        print(f"   ├─ Mais lento:  {slower} ({max(mean1, mean2)*1000:.2f} ms)")
-        print(f"   ├─ Diferença:   {diff*1000:.2f} ms ({pct_diff:.1f}%)")
-        print(f"   ├─ Teste:       {test_name}")
-        print(f"   ├─ p-valor:     {p_value:.6f} {sig_icon}")
-        print(f"   └─ Cohen's d:   {abs(cohens_d):.4f} (efeito {effect_size})")
-        print()
+        emit(f"📌 {s1} vs {s2}")
+        emit(f"   ├─ Mais rápido: {faster} ({min(mean1, mean2)*1000:.2f} ms)")
+        emit(f"   ├─ Mais lento:  {slower} ({max(mean1, mean2)*1000:.2f} ms)")
+        emit(f"   ├─ Diferença:   {diff*1000:.2f} ms ({pct_diff:.1f}%)")
+        emit(f"   ├─ Teste:       {test_name}")
+        emit(f"   ├─ p-valor:     {p_value:.6f} {sig_icon}")
+        emit(f"   └─ Cohen's d:   {abs(cohens_d):.4f} (efeito {effect_size})")
+        emit("")
     
     # ========== MATRIZ DE COMPARAÇÃO ==========
-    print("=" * 80)
-    print("📋 MATRIZ DE COMPARAÇÃO (% diferença)")
-    print("=" * 80)
-    print()
+    emit("=" * 80)
+    emit("📋 MATRIZ DE COMPARAÇÃO (% diferença)")
+    emit("=" * 80)
+    emit("")
     
     # Criar matriz
     col_width = max(15, max(len(s) for s in servers) + 2)
@@ -297,146 +417,164 @@ def analyze_results_by_ip(csv_file: str = "benchmark_results.csv"):
     # Cabeçalho
     header = "IP".ljust(col_width) + " │ "
     header += " │ ".join(s[-col_width+2:].center(col_width-2) for s in servers)
-    print(header)
-    print("─" * len(header))
+    emit(header)
+    emit("─" * len(header))
+    
+    # Matriz S×S inteira em uma operação: diferença relativa ao mais rápido do par
+    m1 = mean_vec[:, None]
+    m2 = mean_vec[None, :]
+    row_faster = m1 < m2
+    pct_matrix = np.where(row_faster, (m2 - m1) / m1, (m1 - m2) / m2) * 100
     
-    for s1 in servers:
+    for i, s1 in enumerate(servers):
         row = s1[-col_width:].ljust(col_width) + " │ "
         cells = []
-        for s2 in servers:
-            if s1 == s2:
+        for j in range(len(servers)):
+            if i == j:
                 cells.append("-".center(col_width-2))
             else:
-                m1 = df[df[server_col] == s1]['elapsed_total_seconds'].mean()
-                m2 = df[df[server_col] == s2]['elapsed_total_seconds'].mean()
-                if m1 < m2:
-                    pct = ((m2 - m1) / m1) * 100
-                    cells.append(f"+{pct:.1f}%".center(col_width-2))
-                else:
-                    pct = ((m1 - m2) / m2) * 100
-                    cells.append(f"-{pct:.1f}%".center(col_width-2))
+                sign = "+" if row_faster[i, j] else "-"
+                cells.append(f"{sign}{pct_matrix[i, j]:.1f}%".center(col_width-2))
         row += " │ ".join(cells)
-        print(row)
+        emit(row)
     
-    print()
-    print("   Legenda: +X% = linha é X% mais RÁPIDA que coluna")
-    print("            -X% = linha é X% mais LENTA que coluna")
-    print()
+    emit("")
+    emit("   Legenda: +X% = linha é X% mais RÁPIDA que coluna")
+    emit("            -X% = linha é X% mais LENTA que coluna")
+    emit("")
     
     # ========== INTERPRETAÇÃO CIENTÍFICA ==========
-    print("=" * 80)
-    print("🔬 INTERPRETAÇÃO CIENTÍFICA DOS RESULTADOS")
-    print("=" * 80)
-    print()
+    emit("=" * 80)
+    emit("🔬 INTERPRETAÇÃO CIENTÍFICA DOS RESULTADOS")
+    emit("=" * 80)
+    emit("")
     
     best = server_stats[0]
     worst = server_stats[-1]
     
-    # Comparação melhor vs pior
-    best_data = df[df[server_col] == best['server']]['elapsed_total_seconds']
-    worst_data = df[df[server_col] == worst['server']]['elapsed_total_seconds']
-    
-    _, _, p_bw, is_sig_bw = statistical_test(best_data, worst_data)
-    cohens_d_bw = calculate_cohens_d(best_data, worst_data)
+    # Comparação melhor vs pior: o par já foi testado nas comparações pareadas
+    # (teste e |d| são simétricos); só um único servidor exige o cálculo aqui
+    comps_by_pair = {}
+    for c in comparisons:
+        comps_by_pair[(c['server1'], c['server2'])] = c
+        comps_by_pair[(c['server2'], c['server1'])] = c
+    comp_bw = comps_by_pair.get((best['server'], worst['server']))
+    if comp_bw is not None:
+        p_bw, is_sig_bw = comp_bw['p_value'], comp_bw['is_significant']
+    else:
+        _, _, p_bw, is_sig_bw = statistical_test(
+            sorted_groups[best['server']], sorted_groups[worst['server']]
+        )
+    cohens_d_bw = d_matrix[server_pos[best['server']], server_pos[worst['server']]]
     pct_diff_bw = ((worst['mean'] - best['mean']) / best['mean']) * 100
     
-    print(f"📊 Análise: {best['server']} (melhor) vs {worst['server']} (pior)")
-    print()
+    emit(f"📊 Análise: {best['server']} (melhor) vs {worst['server']} (pior)")
+    emit("")
     
     if is_sig_bw:
-        print(f"   ✅ DIFERENÇA ESTATISTICAMENTE SIGNIFICATIVA (p = {p_bw:.6f})")
-        print(f"   ✅ {best['server']} é comprovadamente mais rápido")
+        emit(f"   ✅ DIFERENÇA ESTATISTICAMENTE SIGNIFICATIVA (p = {p_bw:.6f})")
+        emit(f"   ✅ {best['server']} é comprovadamente mais rápido")
     else:
-        print(f"   ⚠️  Diferença NÃO é estatisticamente significativa (p = {p_bw:.6f})")
-        print(f"   ⚠️  A diferença observada pode ser devido ao acaso")
-    print()
+        emit(f"   ⚠️  Diferença NÃO é estatisticamente significativa (p = {p_bw:.6f})")
+        emit(f"   ⚠️  A diferença observada pode ser devido ao acaso")
+    emit("")
     
     effect = interpret_cohens_d(cohens_d_bw)
-    print(f"📏 Tamanho do Efeito: Cohen's d = {abs(cohens_d_bw):.4f} ({effect})")
+    emit(f"📏 Tamanho do Efeito: Cohen's d = {abs(cohens_d_bw):.4f} ({effect})")
     
     if abs(cohens_d_bw) < 0.2:
-        print("   → Efeito INSIGNIFICANTE - diferença sem relevância prática")
+        emit("   → Efeito INSIGNIFICANTE - diferença sem relevância prática")
     elif abs(cohens_d_bw) < 0.5:
-        print("   → Efeito PEQUENO - diferença detectável mas limitada")
+        emit("   → Efeito PEQUENO - diferença detectável mas limitada")
     elif abs(cohens_d_bw) < 0.8:
-        print("   → Efeito MÉDIO - diferença substancial e relevante")
+        emit("   → Efeito MÉDIO - diferença substancial e relevante")
     else:
-        print("   → Efeito GRANDE - diferença muito substancial")
-    print()
+        emit("   → Efeito GRANDE - diferença muito substancial")
+    emit("")
     
     # ========== RECOMENDAÇÃO FINAL ==========
-    print("=" * 80)
-    print("🎯 RECOMENDAÇÃO FINAL")
-    print("=" * 80)
-    print()
+    emit("=" * 80)
+    emit("🎯 RECOMENDAÇÃO FINAL")
+    emit("=" * 80)
+    emit("")
     
     if is_sig_bw and abs(cohens_d_bw) >= 0.5:
-        print(f"   ✅ RECOMENDADO: {best['server']}")
-        print(f"   ")
-        print(f"   Performance {pct_diff_bw:.1f}% superior ao servidor mais lento,")
-        print(f"   com diferença estatisticamente significativa e efeito {effect}.")
-        print()
-        print(f"   Tempo médio: {best['mean']*1000:.2f} ms")
-        print(f"   IC 95%: [{best['ci_lower']*1000:.2f}, {best['ci_upper']*1000:.2f}] ms")
+        emit(f"   ✅ RECOMENDADO: {best['server']}")
+        emit(f"   ")
+        emit(f"   Performance {pct_diff_bw:.1f}% superior ao servidor mais lento,")
+        emit(f"   com diferença estatisticamente significativa e efeito {effect}.")
+        emit("")
+        emit(f"   Tempo médio: {best['mean']*1000:.2f} ms")
+        emit(f"   IC 95%: [{best['ci_lower']*1000:.2f}, {best['ci_upper']*1000:.2f}] ms")
     elif is_sig_bw:
-        print(f"   ⚠️  {best['server']} tem a melhor performance média")
-        print(f"   ")
-        print(f"   Diferença de {pct_diff_bw:.1f}% é estatisticamente significativa,")
-        print(f"   porém o efeito prático é {effect}.")
-        print()
-        print(f"   Considere também: custo, localização, manutenção.")
+        emit(f"   ⚠️  {best['server']} tem a melhor performance média")
+        emit(f"   ")
+        emit(f"   Diferença de {pct_diff_bw:.1f}% é estatisticamente significativa,")
+        emit(f"   porém o efeito prático é {effect}.")
+        emit("")
+        emit(f"   Considere também: custo, localização, manutenção.")
     else:
-        print(f"   ℹ️  Performance equivalente entre servidores")
-        print(f"   ")
-        print(f"   A diferença de {pct_diff_bw:.1f}% não é estatisticamente significativa.")
-        print(f"   Escolha baseada em outros critérios (custo, localização, etc.)")
+        emit(f"   ℹ️  Performance equivalente entre servidores")
+        emit(f"   ")
+        emit(f"   A diferença de {pct_diff_bw:.1f}% não é estatisticamente significativa.")
+        emit(f"   Escolha baseada em outros critérios (custo, localização, etc.)")
     
-    print()
+    emit("")
     
     # ========== RESUMO DAS DIFERENÇAS SIGNIFICATIVAS ==========
     sig_comps = [c for c in comparisons if c['is_significant']]
     
     if sig_comps:
-        print("📋 Diferenças Estatisticamente Significativas:")
+        emit("📋 Diferenças Estatisticamente Significativas:")
         for c in sorted(sig_comps, key=lambda x: -x['pct_diff']):
-            print(f"   • {c['faster']} > {c['slower']}: {c['pct_diff']:.1f}% mais rápido (p={c['p_value']:.4f}, d={abs(c['cohens_d']):.2f})")
+            emit(f"   • {c['faster']} > {c['slower']}: {c['pct_diff']:.1f}% mais rápido (p={c['p_value']:.4f}, d={abs(c['cohens_d']):.2f})")
     else:
-        print("📋 Nenhuma diferença estatisticamente significativa entre os servidores.")
-    print()
+        emit("📋 Nenhuma diferença estatisticamente significativa entre os servidores.")
+    emit("")
     
     # ========== TABELA RESUMO ==========
-    print("=" * 80)
-    print("📋 TABELA RESUMO (em milissegundos)")
-    print("=" * 80)
-    print()
-    
-    summary_df = pd.DataFrame([{
-        'IP': s['server'],
-        'Média (ms)': f"{s['mean']*1000:.2f}",
-        'Mediana (ms)': f"{s['median']*1000:.2f}",
-        'Desvio (ms)': f"{s['std']*1000:.2f}",
-        'Min (ms)': f"{s['min']*1000:.2f}",
-        'Max (ms)': f"{s['max']*1000:.2f}",
-        'CV (%)': f"{s['cv']:.1f}"
-    } for s in server_stats])
-    
-    print(summary_df.to_string(index=False))
-    print()
+    emit("=" * 80)
+    emit("📋 TABELA RESUMO (em milissegundos)")
+    emit("=" * 80)
+    emit("")
+    
+    # Tabela montada com f-strings: colunas alinhadas à direita, largura do
+    # maior valor ou do cabeçalho, separadas por um espaço
+    summary_header = ['IP', 'Média (ms)', 'Mediana (ms)', 'Desvio (ms)', 'Min (ms)', 'Max (ms)', 'CV (%)']
+    summary_rows = [[
+        str(s['server']),
+        f"{s['mean']*1000:.2f}",
+        f"{s['median']*1000:.2f}",
+        f"{s['std']*1000:.2f}",
+        f"{s['min']*1000:.2f}",
+        f"{s['max']*1000:.2f}",
+        f"{s['cv']:.1f}"
+    ] for s in server_stats]
+    widths = [max(len(cell) for cell in column) for column in zip(summary_header, *summary_rows)]
+    for row in [summary_header] + summary_rows:
+        emit(" ".join(f"{cell:>{w}}" for cell, w in zip(row, widths)))
+    emit("")
     
     # ========== REFERÊNCIAS ==========
-    print("=" * 80)
-    print("📚 REFERÊNCIAS METODOLÓGICAS")
-    print("=" * 80)
-    print()
-    print("   • Shapiro, S.S. & Wilk, M.B. (1965). An analysis of variance")
-    print("     test for normality (complete samples)")
-    print("   • Student (1908). The probable error of a mean")
-    print("   • Mann, H.B. & Whitney, D.R. (1947). On a test of whether")
-    print("     one of two random variables is stochastically larger")
-    print("   • Cohen, J. (1988). Statistical power analysis for the")
-    print("     behavioral sciences (2nd ed.)")
-    print("   • Tukey, J.W. (1977). Exploratory Data Analysis")
-    print()
+    emit("=" * 80)
+    emit("📚 REFERÊNCIAS METODOLÓGICAS")
+    emit("=" * 80)
+    emit("")
+    emit("   • Shapiro, S.S. & Wilk, M.B. (1965). An analysis of variance")
+    emit("     test for normality (complete samples)")
+    emit("   • D'Agostino, R.B. & Pearson, E.S. (1973). Tests for departure")
+    emit("     from normality")
+    emit("   • Student (1908). The probable error of a mean")
+    emit("   • Welch, B.L. (1947). The generalization of \"Student's\"")
+    emit("     problem when several different population variances are involved")
+    emit("   • Mann, H.B. & Whitney, D.R. (1947). On a test of whether")
+    emit("     one of two random variables is stochastically larger")
+    emit("   • Cohen, J. (1988). Statistical power analysis for the")
+    emit("     behavioral sciences (2nd ed.)")
+    emit("   • Tukey, J.W. (1977). Exploratory Data Analysis")
+    emit("")
+    
+    sys.stdout.write(report.getvalue())
 
 
 if __name__ == "__main__":
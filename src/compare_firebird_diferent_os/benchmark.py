@@ -1,13 +1,46 @@
 import csv
+import functools
 import os
-import statistics
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, Iterator, List, Tuple, Optional, Union
 
 import fdb
-from dotenv import load_dotenv
+import numpy as np
+from scipy.stats import trim_mean
+
+# O .env é lido uma única vez, na importação do módulo. Com o ambiente já
+# definido (contêineres com env_file, CI), COMPARE_FB_SKIP_DOTENV=1 dispensa
+# a busca pelo .env e a própria importação do dotenv
+if os.getenv("COMPARE_FB_SKIP_DOTENV", "").strip().lower() not in ("1", "true", "yes"):
+    from dotenv import load_dotenv
+    load_dotenv()
+
+# Linhas de progresso acumuladas antes de cada escrita no stdout
+LOG_FLUSH_EVERY = 100
+
+# Buffer de escrita do CSV (1 MiB): poucas syscalls write() mesmo com milhares de linhas
+CSV_BUFFER_SIZE = 1 << 20
+
+# Contadores de I/O da conexão; o ID vai como parâmetro para o mesmo texto SQL
+# ser preparado uma única vez e reaproveitado antes e depois de cada execução
+MON_IO_STATS_SQL = """
+    SELECT 
+        SUM(MON$RECORD_SEQ_READS) as SEQ_READS,
+        SUM(MON$RECORD_IDX_READS) as IDX_READS,
+        SUM(MON$RECORD_INSERTS) as INSERTS,
+        SUM(MON$RECORD_UPDATES) as UPDATES,
+        SUM(MON$RECORD_DELETES) as DELETES,
+        SUM(MON$RECORD_BACKOUTS) as BACKOUTS,
+        SUM(MON$RECORD_PURGES) as PURGES,
+        SUM(MON$RECORD_EXPUNGES) as EXPUNGES
+    FROM MON$IO_STATS
+    WHERE MON$STAT_GROUP = 1 
+    AND MON$STAT_ID = ?
+"""
 
 
 @dataclass
@@ -28,9 +61,13 @@ class BenchmarkResult:
     records_fetched: Optional[int] = None
 
 
+@functools.lru_cache(maxsize=1)
 def load_configs() -> Dict[str, FbConfig]:
-    load_dotenv()
-
+    """
+    Configurações dos dois servidores, lidas das variáveis de ambiente.
+    
+    O ambiente não muda durante o processo: o resultado fica em cache.
+    """
     win = FbConfig(
         name="Windows",
         host=os.getenv("WIN_FB_HOST", ""),
@@ -79,78 +116,103 @@ def open_connection(cfg: FbConfig) -> fdb.Connection:
     )
 
 
+def default_warmup(runs: int) -> int:
+    """Execuções de aquecimento descartadas: 5% das execuções, no mínimo 3."""
+    return max(3, runs // 20)
+
+
 def run_benchmark_for_server(
-    cfg: FbConfig, query: str, runs: int
-) -> Tuple[List[float], List[Optional[Dict[str, Any]]]]:
-    """Executa a mesma query N vezes numa conexão única e mede o tempo de cada execução."""
+    cfg: FbConfig, query: str, runs: int, warmup: Optional[int] = None
+) -> Tuple[np.ndarray, List[Optional[Dict[str, Any]]]]:
+    """
+    Executa a mesma query N vezes numa conexão única e mede o tempo de cada execução.
+    
+    Antes da medição roda `warmup` execuções descartadas (padrão: default_warmup),
+    que pagam a compilação do plano, o cache frio e a alocação de recursos no servidor.
+    """
+    if warmup is None:
+        warmup = default_warmup(runs)
+    
     print(f"\n== Benchmark em {cfg.name} ==")
     print(f"Host: {cfg.host}, DB: {cfg.database}")
-    print(f"Execuções: {runs}")
+    print(f"Execuções: {runs} (+{warmup} de aquecimento, descartadas)")
     print(f"Query: {query}\n")
 
     conn = open_connection(cfg)
     cur = conn.cursor()
     
+    # Prepara a query uma única vez: cada execução mede só execute + fetch,
+    # sem repetir o parse/prepare do texto SQL
+    prepared = cur.prep(query)
+    
+    # O plano de execução é do comando preparado, igual em todas as execuções
+    plan_info: Dict[str, Any] = {}
+    try:
+        if prepared.plan:
+            plan_info['plan'] = prepared.plan
+    except Exception as e:
+        plan_info['plan_error'] = str(e)
+    
+    # Aquecimento: execuções completas que não entram nos resultados
+    for _ in range(warmup):
+        cur.execute(prepared)
+        cur.fetchone()
+    
     # Cursor separado para monitoramento
     mon_cur = conn.cursor()
-
-    times: List[float] = []
-    stats_list: List[Optional[Dict[str, Any]]] = []
+    
+    # O ID da conexão não muda durante o benchmark: consultado uma única vez
+    attachment_id = None
+    mon_stats = None
+    try:
+        mon_cur.execute("SELECT CURRENT_CONNECTION FROM RDB$DATABASE")
+        attachment_id = mon_cur.fetchone()[0]
+        mon_stats = mon_cur.prep(MON_IO_STATS_SQL)
+    except Exception:
+        pass
+
+    # Buffers pré-alocados com o tamanho final: atribuição por índice no laço,
+    # sem realocações de append, e tempos já em float64 contíguo
+    times = np.empty(runs, dtype=np.float64)
+    stats_list: List[Optional[Dict[str, Any]]] = [None] * runs
+
+    # Progresso bufferizado: um flush do stdout a cada LOG_FLUSH_EVERY execuções,
+    # não entre todas elas (FB_BENCH_QUIET=1 desliga o log por execução)
+    quiet = os.getenv("FB_BENCH_QUIET", "").lower() in ("1", "true", "yes")
+    log_lines: List[str] = []
+
+    # Métodos resolvidos uma vez e usados como locais dentro do laço
+    perf = time.perf_counter_ns
+    execute = cur.execute
+    fetchone = cur.fetchone
+    mon_execute = mon_cur.execute
+    mon_fetchone = mon_cur.fetchone
+    mon_params = (attachment_id,)
 
     for i in range(1, runs + 1):
         # Captura estatísticas do servidor
-        server_info: Dict[str, Any] = {}
-        
-        try:
-            # Obtém o plano de execução
-            cur.execute(f"SET PLANONLY")
-            cur.execute(query)
-            plan = cur.plan
-            cur.execute(f"SET PLANONLY OFF")
-            if plan:
-                server_info['plan'] = plan
-        except Exception as e:
-            server_info['plan_error'] = str(e)
+        server_info: Dict[str, Any] = dict(plan_info)
         
         # Captura estatísticas ANTES da execução
         stats_before = None
-        try:
-            mon_cur.execute("""
-                SELECT MON$ATTACHMENT_ID 
-                FROM MON$ATTACHMENTS 
-                WHERE MON$ATTACHMENT_ID = CURRENT_CONNECTION
-            """)
-            attachment_id = mon_cur.fetchone()[0]
-            
-            mon_cur.execute(f"""
-                SELECT 
-                    SUM(MON$RECORD_SEQ_READS) as SEQ_READS,
-                    SUM(MON$RECORD_IDX_READS) as IDX_READS,
-                    SUM(MON$RECORD_INSERTS) as INSERTS,
-                    SUM(MON$RECORD_UPDATES) as UPDATES,
-                    SUM(MON$RECORD_DELETES) as DELETES,
-                    SUM(MON$RECORD_BACKOUTS) as BACKOUTS,
-                    SUM(MON$RECORD_PURGES) as PURGES,
-                    SUM(MON$RECORD_EXPUNGES) as EXPUNGES
-                FROM MON$IO_STATS
-                WHERE MON$STAT_GROUP = 1 
-                AND MON$STAT_ID = {attachment_id}
-            """)
-            stats_before = mon_cur.fetchone()
-        except Exception:
-            pass
+        if mon_stats is not None:
+            try:
+                mon_execute(mon_stats, mon_params)
+                stats_before = mon_fetchone()
+            except Exception:
+                pass
         
-        # Mede tempo total (cliente + servidor + rede + latência)
-        t0 = time.perf_counter()
-        t_server_start = time.perf_counter()
-        cur.execute(query)
-        row = cur.fetchone()
-        t_server_end = time.perf_counter()
-        t1 = time.perf_counter()
-
-        elapsed_total = t1 - t0
-        elapsed_server = t_server_end - t_server_start
-        times.append(elapsed_total)
+        # Mede tempo total (cliente + servidor + rede + latência) com três
+        # leituras do relógio em ns: servidor = execute, latência = fetch
+        t0 = perf()
+        execute(prepared)
+        t_exec = perf()
+        row = fetchone()
+        t1 = perf()
+
+        elapsed_total = (t1 - t0) / 1e9
+        elapsed_server = (t_exec - t0) / 1e9
+        times[i - 1] = elapsed_total
         
         server_info['elapsed_total'] = elapsed_total
         server_info['elapsed_server'] = elapsed_server
@@ -158,21 +220,8 @@ def run_benchmark_for_server(
         # Captura estatísticas DEPOIS da execução
         if stats_before:
             try:
-                mon_cur.execute(f"""
-                    SELECT 
-                        SUM(MON$RECORD_SEQ_READS) as SEQ_READS,
-                        SUM(MON$RECORD_IDX_READS) as IDX_READS,
-                        SUM(MON$RECORD_INSERTS) as INSERTS,
-                        SUM(MON$RECORD_UPDATES) as UPDATES,
-                        SUM(MON$RECORD_DELETES) as DELETES,
-                        SUM(MON$RECORD_BACKOUTS) as BACKOUTS,
-                        SUM(MON$RECORD_PURGES) as PURGES,
-                        SUM(MON$RECORD_EXPUNGES) as EXPUNGES
-                    FROM MON$IO_STATS
-                    WHERE MON$STAT_GROUP = 1 
-                    AND MON$STAT_ID = {attachment_id}
-                """)
-                stats_after = mon_cur.fetchone()
+                mon_execute(mon_stats, mon_params)
+                stats_after = mon_fetchone()
                 
                 # Calcula diferenças
                 if stats_before and stats_after:
@@ -186,74 +235,91 @@ def run_benchmark_for_server(
         
         # Tenta obter informações adicionais do cursor
         try:
-            if hasattr(cur, 'rowcount') and cur.rowcount >= 0:
-                server_info['rowcount'] = cur.rowcount
-        except:
+            rowcount = cur.rowcount
+            if rowcount >= 0:
+                server_info['rowcount'] = rowcount
+        except Exception:
             pass
             
-        stats_list.append(server_info if server_info else None)
+        stats_list[i - 1] = server_info if server_info else None
         
-        latency = elapsed_total - elapsed_server
-        print(f"[{cfg.name}] Execução {i}/{runs}: total={elapsed_total:.6f}s, servidor={elapsed_server:.6f}s, latência={latency:.6f}s | retorno={row}")
+        if not quiet:
+            latency = elapsed_total - elapsed_server
+            log_lines.append(f"[{cfg.name}] Execução {i}/{runs}: total={elapsed_total:.6f}s, servidor={elapsed_server:.6f}s, latência={latency:.6f}s | retorno={row}")
+            if len(log_lines) >= LOG_FLUSH_EVERY:
+                sys.stdout.write("\n".join(log_lines) + "\n")
+                sys.stdout.flush()
+                log_lines.clear()
+
+    if log_lines:
+        sys.stdout.write("\n".join(log_lines) + "\n")
+        sys.stdout.flush()
 
     conn.close()
     return times, stats_list
 
 
+def _csv_rows(
+    results: Dict[str, Tuple[np.ndarray, List[Optional[Dict[str, Any]]]]],
+    query: str,
+    runs: int,
+) -> Iterator[tuple]:
+    """Gera as linhas do CSV já formatadas, uma tupla por execução."""
+    for server, (times, stats_list) in results.items():
+        for idx, (t, stats) in enumerate(zip(np.asarray(times).tolist(), stats_list), start=1):
+            stats = stats or {}
+            elapsed_total = stats.get('elapsed_total', t)
+            elapsed_server = stats.get('elapsed_server')
+            has_server = elapsed_server is not None
+            
+            yield (
+                server, idx, f"{elapsed_total:.6f}",
+                f"{elapsed_server:.6f}" if has_server else '',
+                f"{elapsed_total - elapsed_server:.6f}" if has_server else '',
+                stats.get('seq_reads', ''), stats.get('idx_reads', ''),
+                stats.get('inserts', ''), stats.get('updates', ''),
+                stats.get('deletes', ''),
+                stats.get('plan', ''), stats.get('rowcount', ''), query, runs,
+            )
+
+
 def save_csv(
     filename: str,
-    results: Dict[str, Tuple[List[float], List[Optional[Dict[str, Any]]]]],
+    results: Dict[str, Tuple[np.ndarray, List[Optional[Dict[str, Any]]]]],
     query: str,
     runs: int,
 ) -> Path:
     path = Path(filename).resolve()
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with path.open("w", newline="", encoding="utf-8") as f:
+    with path.open("w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
         writer = csv.writer(f, delimiter=";")
         writer.writerow([
             "server", "run_index", "elapsed_total_seconds", "elapsed_server_seconds", 
             "latency_seconds", "seq_reads", "idx_reads", "inserts", "updates", "deletes",
             "plan", "rowcount", "query", "runs"
         ])
-        for server, (times, stats_list) in results.items():
-            for idx, (t, stats) in enumerate(zip(times, stats_list), start=1):
-                elapsed_total = stats.get('elapsed_total', t) if stats else t
-                elapsed_server = stats.get('elapsed_server', '') if stats else ''
-                latency = (elapsed_total - elapsed_server) if (stats and 'elapsed_server' in stats) else ''
-                
-                seq_reads = stats.get('seq_reads', '') if stats else ''
-                idx_reads = stats.get('idx_reads', '') if stats else ''
-                inserts = stats.get('inserts', '') if stats else ''
-                updates = stats.get('updates', '') if stats else ''
-                deletes = stats.get('deletes', '') if stats else ''
-                
-                plan = stats.get('plan', '') if stats else ''
-                rowcount = stats.get('rowcount', '') if stats else ''
-                
-                writer.writerow([
-                    server, idx, f"{elapsed_total:.6f}", 
-                    f"{elapsed_server:.6f}" if elapsed_server != '' else '',
-                    f"{latency:.6f}" if latency != '' else '',
-                    seq_reads, idx_reads, inserts, updates, deletes,
-                    plan, rowcount, query, runs
-                ])
+        # Uma única chamada: o laço de escrita roda dentro do módulo csv (C)
+        writer.writerows(_csv_rows(results, query, runs))
 
     return path
 
 
-def print_stats(label: str, times: List[float]) -> None:
-    if not times:
+def print_stats(label: str, times: Union[List[float], np.ndarray]) -> None:
+    if len(times) == 0:
         print(f"{label}: sem dados.")
         return
 
-    mean = statistics.fmean(times)
-    min_t = min(times)
-    max_t = max(times)
+    # Reduções e percentis do NumPy direto no buffer float64; a média aparada
+    # (10% de cada cauda) é menos sensível a picos isolados que a média simples
+    times = np.asarray(times, dtype=np.float64)
+    p50, p95, p99 = np.percentile(times, [50, 95, 99])
+    trimmed = trim_mean(times, 0.1)
 
     print(
-        f"{label}: média={mean:.6f}s, mínimo={min_t:.6f}s, máximo={max_t:.6f}s, "
-        f"execuções={len(times)}"
+        f"{label}: média={times.mean():.6f}s, média aparada={trimmed:.6f}s, "
+        f"mínimo={times.min():.6f}s, máximo={times.max():.6f}s, "
+        f"p50={p50:.6f}s, p95={p95:.6f}s, p99={p99:.6f}s, execuções={len(times)}"
     )
 
 
@@ -261,18 +327,39 @@ def main() -> None:
     configs = load_configs()
 
     runs = int(os.getenv("FB_BENCH_RUNS", "20"))
-    query = os.getenv(
-        "FB_BENCH_QUERY", "SELECT CURRENT_TIMESTAMP FROM RDB$DATABASE"
-    )
-
-    all_results: Dict[str, Tuple[List[float], List[Optional[Dict[str, Any]]]]] = {}
-
-    for key, cfg in configs.items():
-        try:
-            times, stats = run_benchmark_for_server(cfg, query=query, runs=runs)
-            all_results[cfg.name] = (times, stats)
-        except Exception as e:
-            print(f"\nERRO ao executar benchmark em {cfg.name}: {e}")
+    # Vazio: default_warmup(runs)
+    warmup_env = os.getenv("FB_BENCH_WARMUP", "").strip()
+    warmup = int(warmup_env) if warmup_env else None
+    # Padrão com retorno inteiro: o fdb não monta um datetime a cada fetch, e o
+    # tempo medido fica mais perto do round-trip puro. CURRENT_TIMESTAMP (ou
+    # qualquer outra query) continua disponível via FB_BENCH_QUERY.
+    query = os.getenv("FB_BENCH_QUERY", "SELECT 1 FROM RDB$DATABASE")
+
+    # Servidores em paralelo (uma thread e uma conexão por servidor): o tempo
+    # total passa a ser o do servidor mais lento, não a soma dos dois
+    parallel = os.getenv("FB_BENCH_PARALLEL", "").lower() in ("1", "true", "yes")
+
+    all_results: Dict[str, Tuple[np.ndarray, List[Optional[Dict[str, Any]]]]] = {}
+
+    if parallel:
+        with ThreadPoolExecutor(max_workers=len(configs)) as executor:
+            futures = {
+                cfg.name: executor.submit(run_benchmark_for_server, cfg, query=query, runs=runs, warmup=warmup)
+                for cfg in configs.values()
+            }
+            # Resultados coletados na ordem das configurações (CSV estável)
+            for name, future in futures.items():
+                try:
+                    all_results[name] = future.result()
+                except Exception as e:
+                    print(f"\nERRO ao executar benchmark em {name}: {e}")
+    else:
+        for key, cfg in configs.items():
+            try:
+                times, stats = run_benchmark_for_server(cfg, query=query, runs=runs, warmup=warmup)
+                all_results[cfg.name] = (times, stats)
+            except Exception as e:
+                print(f"\nERRO ao executar benchmark em {cfg.name}: {e}")
 
     print("\n==== Estatísticas gerais ====")
     for server_name, (times, _) in all_results.items():
@@ -9,113 +9,185 @@ Supports concurrent execution with multiple threads for improved performance.
 """
 
 import csv
-import statistics
+import os
+import queue
+import shutil
+import sys
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, Iterator, List, Sequence, Tuple, Optional, TextIO
 
-from .database import DatabaseConfig, DatabaseConnectionFactory
+import numpy as np
+from scipy.stats import trim_mean
+
+# PyArrow is optional: only needed for the Parquet output (save_parquet)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+from .database import ConnectionPool, DatabaseConfig, DatabaseConnectionFactory
 from .collectors import StatisticsCollectorFactory
 
+# Progress is buffered: sequential runs flush stdout every LOG_FLUSH_EVERY
+# executions, concurrent runs at most once per PROGRESS_INTERVAL seconds
+LOG_FLUSH_EVERY = 100
+PROGRESS_INTERVAL = 0.1
+
+# CSV write buffer (1 MiB): a few large write() syscalls instead of one per row
+CSV_BUFFER_SIZE = 1 << 20
+
+# Extended header with db_type and os_type
+CSV_HEADER = [
+    "db_type", "os_type", "server_name", "run_index", 
+    "elapsed_total_seconds", "elapsed_server_seconds", 
+    "latency_seconds", "seq_reads", "idx_reads", "inserts", "updates", "deletes",
+    "plan", "rowcount", "query", "runs", "server_time_seconds"
+]
+
+# I/O counters common to every collector (get_io_stats keys written to the CSV)
+IO_STAT_FIELDS = ('seq_reads', 'idx_reads', 'inserts', 'updates', 'deletes')
+
+
+@dataclass(slots=True)
+class RunStats:
+    """
+    Metrics of a single benchmark run.
+    
+    Slotted dataclass instead of a dict: one of these is kept per run and
+    server until the CSV is written. None means "not collected" and is
+    written as an empty CSV cell.
+    """
+    elapsed_total: float = 0.0
+    elapsed_server: Optional[float] = None
+    latency: Optional[float] = None
+    seq_reads: Optional[int] = None
+    idx_reads: Optional[int] = None
+    inserts: Optional[int] = None
+    updates: Optional[int] = None
+    deletes: Optional[int] = None
+    plan: Optional[str] = None
+    plan_error: Optional[str] = None
+    rowcount: Optional[int] = None
+    server_time: Optional[float] = None
+    
+    def update_io(self, io_stats: Dict[str, Any]) -> None:
+        """Copy the common I/O counters from a collector's get_io_stats()."""
+        for field in IO_STAT_FIELDS:
+            if field in io_stats:
+                setattr(self, field, io_stats[field])
+
+
+def _write_log(lines: List[str]) -> None:
+    """Write the buffered progress lines with a single stdout write and clear them."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
 
 def _execute_single_query(
-    config: DatabaseConfig, 
+    pool: ConnectionPool, 
     query: str, 
     run_number: int,
-    total_runs: int
-) -> Tuple[float, Optional[Dict[str, Any]]]:
+    collect_stats: bool = False
+) -> Tuple[float, Optional[RunStats]]:
     """
     Execute uma única query (usada para execução concorrente).
     
     Args:
-        config: Database configuration
+        pool: Pool de conexões já abertas do servidor
         query: SQL query to execute
         run_number: Número da execução (1-based)
-        total_runs: Total de execuções
+        collect_stats: Se True, captura MON$/Handler/pg_stat antes e depois
+            da query (padrão: False, ver run_benchmark_for_server_concurrent)
     
     Returns:
-        Tuple of (elapsed_time, stats_dict)
+        Tuple of (elapsed_time, run stats)
+    
+    Errors propagate to the caller, which reports them: worker threads never
+    write to stdout, so no lock is contended while other runs are timed.
     """
+    # Borrow an already-open connection: no TCP/auth handshake per run
+    connection = pool.acquire()
     try:
-        # Create new connection for this thread
-        connection = DatabaseConnectionFactory.create(config)
-        connection.connect()
-        
-        # Create statistics collector
-        stats_collector = StatisticsCollectorFactory.create(config.db_type, connection)
+        server_info = RunStats()
         
-        server_info: Dict[str, Any] = {}
+        # Collector only when it will be used: plan on the first run, I/O stats if enabled
+        stats_collector = None
+        if collect_stats or run_number == 1:
+            stats_collector = StatisticsCollectorFactory.create(pool.config.db_type, connection)
         
         # Get execution plan (apenas na primeira execução para não sobrecarregar)
         if run_number == 1:
             try:
                 plan = stats_collector.get_execution_plan(query)
                 if plan:
-                    server_info['plan'] = plan
+                    server_info.plan = plan
             except Exception as e:
-                server_info['plan_error'] = str(e)
+                server_info.plan_error = str(e)
         
         # Capture statistics BEFORE
-        try:
-            stats_collector.capture_before()
-        except Exception:
-            pass
+        if collect_stats:
+            try:
+                stats_collector.capture_before()
+            except Exception:
+                pass
         
-        # Measure time
-        t0 = time.perf_counter()
-        t_server_start = time.perf_counter()
+        # Prepared once per pooled connection (the connections cache it by
+        # SQL text): later runs on the same connection skip parse and plan
+        prepared = connection.prepare(query)
         
-        connection.execute_query(query)
+        # Measure time: server = execute, latency = fetch (integer ns clock)
+        t0 = time.perf_counter_ns()
+        connection.execute_prepared(prepared)
+        t_exec = time.perf_counter_ns()
         row = connection.fetchone()
+        t1 = time.perf_counter_ns()
         
-        t_server_end = time.perf_counter()
-        t1 = time.perf_counter()
-
-        elapsed_total = t1 - t0
-        elapsed_server = t_server_end - t_server_start
+        elapsed_total = (t1 - t0) / 1e9
+        elapsed_server = (t_exec - t0) / 1e9
         
-        server_info['elapsed_total'] = elapsed_total
-        server_info['elapsed_server'] = elapsed_server
-        server_info['latency'] = elapsed_total - elapsed_server
+        server_info.elapsed_total = elapsed_total
+        server_info.elapsed_server = elapsed_server
+        server_info.latency = elapsed_total - elapsed_server
         
         # Capture statistics AFTER
-        try:
-            stats_collector.capture_after()
-            io_stats = stats_collector.get_io_stats()
-            server_info.update(io_stats)
-        except Exception:
-            pass
+        if collect_stats:
+            try:
+                stats_collector.capture_after()
+                server_info.update_io(stats_collector.get_io_stats())
+                server_info.server_time = stats_collector.get_server_time()
+            except Exception:
+                pass
         
-        # Get rowcount
+        # Get rowcount (-1 when the cursor does not report it)
         try:
-            cursor = connection.cursor
-            if hasattr(cursor, 'rowcount') and cursor.rowcount >= 0:
-                server_info['rowcount'] = cursor.rowcount
-        except:
+            rowcount = getattr(connection.cursor, 'rowcount', -1)
+            if rowcount >= 0:
+                server_info.rowcount = rowcount
+        except Exception:
             pass
-        
-        connection.close()
-        
-        # Print progress
-        print(
-            f"[{config.name}] ✓ {run_number}/{total_runs}: "
-            f"{elapsed_total:.6f}s"
-        )
-        
-        return elapsed_total, server_info
-        
-    except Exception as e:
-        print(f"[{config.name}] ✗ {run_number}/{total_runs}: Erro - {e}")
-        return 0.0, None
+    finally:
+        # The collector's cursor must not outlive the task on a pooled connection
+        if stats_collector is not None:
+            stats_collector.close()
+        pool.release(connection)
+
+    return elapsed_total, server_info
 
 
 def run_benchmark_for_server_concurrent(
     config: DatabaseConfig, 
     query: str, 
     runs: int,
-    max_workers: int = 10
-) -> Tuple[List[float], List[Optional[Dict[str, Any]]]]:
+    max_workers: int = 10,
+    collect_stats: bool = False
+) -> Tuple[np.ndarray, List[Optional[RunStats]]]:
     """
     Execute query N vezes com execução CONCORRENTE (múltiplas threads).
     
@@ -124,9 +196,14 @@ def run_benchmark_for_server_concurrent(
         query: SQL query to execute
         runs: Number of times to execute the query
         max_workers: Número máximo de threads paralelas (padrão: 10)
+        collect_stats: Se True, cada execução captura as estatísticas de I/O
+            do banco (padrão: False). As tabelas de monitoramento (MON$, SHOW
+            STATUS, pg_stat_*) são globais no servidor e serializam as
+            threads, distorcendo justamente os tempos concorrentes; no modo
+            sequencial a coleta continua sempre ativa.
     
     Returns:
-        Tuple of (times list, stats list)
+        Tuple of (times array, stats list)
     """
     print(f"\n== Benchmark CONCORRENTE em {config.name} ==")
     print(f"Tipo: {config.db_type.upper()}, OS: {config.os_type.upper()}")
@@ -134,43 +211,52 @@ def run_benchmark_for_server_concurrent(
     print(f"Execuções: {runs} (max {max_workers} threads paralelas)")
     print(f"Query: {query}\n")
 
-    times: List[float] = []
-    stats_list: List[Optional[Dict[str, Any]]] = []
+    # Buffers com o tamanho final: cada resultado vai direto para a posição
+    # da sua execução, sem dicionário intermediário nem segunda passada
+    times = np.zeros(runs, dtype=np.float64)
+    stats_list: List[Optional[RunStats]] = [None] * runs
     
-    # Execute com ThreadPoolExecutor
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    # Execute com ThreadPoolExecutor; uma conexão aberta por thread, antes
+    # de qualquer medição
+    with ConnectionPool(config, size=min(max_workers, runs)) as pool, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
         # Submit todas as tarefas
         futures = {
-            executor.submit(_execute_single_query, config, query, i, runs): i 
+            executor.submit(_execute_single_query, pool, query, i, collect_stats): i 
             for i in range(1, runs + 1)
         }
         
-        # Coletar resultados conforme completam
-        results_dict = {}
+        # Coletar resultados conforme completam, já na ordem de execução original.
+        # Só esta thread escreve o progresso, em lotes a cada PROGRESS_INTERVAL
+        log_lines: List[str] = []
+        last_flush = time.monotonic()
         for future in as_completed(futures):
             run_num = futures[future]
             try:
-                elapsed_time, stats = future.result()
-                results_dict[run_num] = (elapsed_time, stats)
+                times[run_num - 1], stats_list[run_num - 1] = future.result()
+                log_lines.append(f"[{config.name}] ✓ {run_num}/{runs}: {times[run_num - 1]:.6f}s")
             except Exception as e:
-                print(f"[{config.name}] Erro na execução {run_num}: {e}")
-                results_dict[run_num] = (0.0, None)
-    
-    # Ordenar resultados pela ordem de execução original
-    for i in range(1, runs + 1):
-        if i in results_dict:
-            elapsed_time, stats = results_dict[i]
-            times.append(elapsed_time)
-            stats_list.append(stats)
+                log_lines.append(f"[{config.name}] ✗ {run_num}/{runs}: Erro - {e}")
+            now = time.monotonic()
+            if now - last_flush >= PROGRESS_INTERVAL:
+                _write_log(log_lines)
+                last_flush = now
+        _write_log(log_lines)
     
     print(f"\n✅ Benchmark concorrente concluído: {len(times)}/{runs} execuções bem-sucedidas\n")
     
     return times, stats_list
 
 
+def default_warmup(runs: int) -> int:
+    """Number of discarded warm-up runs: 5% of the runs, at least 3."""
+    return max(3, runs // 20)
+
+
 def run_benchmark_for_server(
-    config: DatabaseConfig, query: str, runs: int
-) -> Tuple[List[float], List[Optional[Dict[str, Any]]]]:
+    config: DatabaseConfig, query: str, runs: int, warmup: Optional[int] = None,
+    capture_stats: bool = True
+) -> Tuple[np.ndarray, List[Optional[RunStats]]]:
     """
     Execute the same query N times on a single connection and measure execution time.
     
@@ -178,97 +264,204 @@ def run_benchmark_for_server(
         config: Database configuration
         query: SQL query to execute
         runs: Number of times to execute the query
+        warmup: Discarded runs before measuring, which absorb plan compilation
+            and cold caches (default: default_warmup(runs))
+        capture_stats: Query the database I/O counters around every run
+            (default: True). Each snapshot is an extra round-trip and, on
+            Firebird, a MON$ scan that can cost as much as the benchmarked
+            query; with False only the wall-clock times (and the plan, read
+            once) are recorded and the I/O and server_time columns stay empty.
     
     Returns:
-        Tuple of (times list, stats list)
+        Tuple of (times array, stats list)
     """
+    if warmup is None:
+        warmup = default_warmup(runs)
+    
     print(f"\n== Benchmark em {config.name} ==")
     print(f"Tipo: {config.db_type.upper()}, OS: {config.os_type.upper()}")
     print(f"Host: {config.host}, DB: {config.database}")
-    print(f"Execuções: {runs}")
+    print(f"Execuções: {runs} (+{warmup} de aquecimento, descartadas)")
     print(f"Query: {query}\n")
 
-    # Create database connection using factory
-    connection = DatabaseConnectionFactory.create(config)
-    connection.connect()
-    
-    # Create statistics collector using factory
-    stats_collector = StatisticsCollectorFactory.create(config.db_type, connection)
-
-    times: List[float] = []
-    stats_list: List[Optional[Dict[str, Any]]] = []
-
-    for i in range(1, runs + 1):
-        # Collect statistics for this execution
-        server_info: Dict[str, Any] = {}
-        
-        # Get execution plan (without actually running the query)
-        try:
-            plan = stats_collector.get_execution_plan(query)
-            if plan:
-                server_info['plan'] = plan
-        except Exception as e:
-            server_info['plan_error'] = str(e)
+    # Create database connection using factory; the same connection serves
+    # every warm-up and measured run and is closed even if a run fails
+    with DatabaseConnectionFactory.create(config) as connection:
+        # Create statistics collector using factory
+        stats_collector = StatisticsCollectorFactory.create(config.db_type, connection)
         
-        # Capture statistics BEFORE execution
         try:
-            stats_collector.capture_before()
-        except Exception:
-            pass
-        
-        # Measure total time (client + server + network)
-        t0 = time.perf_counter()
-        t_server_start = time.perf_counter()
-        
-        connection.execute_query(query)
-        row = connection.fetchone()
-        
-        t_server_end = time.perf_counter()
-        t1 = time.perf_counter()
+            # Prepare once: each run only executes and fetches, without re-parsing the SQL
+            prepared = connection.prepare(query)
+            
+            # Warm-up runs: executed in full but never recorded
+            for _ in range(warmup):
+                connection.execute_prepared(prepared)
+                connection.fetchone()
+            
+            # The plan does not change between runs: fetch it once and reuse it
+            plan: Optional[str] = None
+            plan_error: Optional[str] = None
+            try:
+                plan = stats_collector.get_execution_plan(query) or None
+            except Exception as e:
+                plan_error = str(e)
 
-        elapsed_total = t1 - t0
-        elapsed_server = t_server_end - t_server_start
-        times.append(elapsed_total)
-        
-        server_info['elapsed_total'] = elapsed_total
-        server_info['elapsed_server'] = elapsed_server
-        server_info['latency'] = elapsed_total - elapsed_server
-        
-        # Capture statistics AFTER execution
-        try:
-            stats_collector.capture_after()
-            io_stats = stats_collector.get_io_stats()
-            server_info.update(io_stats)
-        except Exception:
-            pass
-        
-        # Get rowcount if available
-        try:
+            # Pre-sized buffers filled by index (no list growth inside the loop);
+            # times is a contiguous float64 array so statistics run in NumPy
+            times = np.empty(runs, dtype=np.float64)
+            stats_list: List[Optional[RunStats]] = [None] * runs
+
+            # Bound methods resolved once, used as locals inside the loop
+            perf = time.perf_counter_ns
+            execute = connection.execute_prepared
+            fetchone = connection.fetchone
+            capture_before = stats_collector.capture_before
+            capture_after = stats_collector.capture_after
+            get_io_stats = stats_collector.get_io_stats
+            get_server_time = stats_collector.get_server_time
+            advance_collector = stats_collector.advance
+            # The main cursor does not change during the loop, nor whether it has rowcount
             cursor = connection.cursor
-            if hasattr(cursor, 'rowcount') and cursor.rowcount >= 0:
-                server_info['rowcount'] = cursor.rowcount
-        except:
-            pass
-            
-        stats_list.append(server_info if server_info else None)
-        
-        latency = elapsed_total - elapsed_server
-        print(
-            f"[{config.name}] Execução {i}/{runs}: "
-            f"total={elapsed_total:.6f}s, servidor={elapsed_server:.6f}s, "
-            f"latência={latency:.6f}s | retorno={row}"
-        )
-        
-        # Reset collector for next iteration
-        stats_collector.reset()
+            has_rowcount = hasattr(cursor, 'rowcount')
+            log_lines: List[str] = []
+            # Only the first run (or one after a failed snapshot) needs its own
+            # before snapshot; afterwards the previous after snapshot is reused
+            need_before = True
+
+            for i in range(1, runs + 1):
+                # Collect statistics for this execution
+                server_info = RunStats(plan=plan, plan_error=plan_error)
+                
+                # Capture statistics BEFORE execution
+                if capture_stats and need_before:
+                    try:
+                        capture_before()
+                    except Exception:
+                        pass
+                
+                # Measure total time (client + server + network) with three integer
+                # ns clock reads: server = execute, latency = fetch
+                t0 = perf()
+                execute(prepared)
+                t_exec = perf()
+                row = fetchone()
+                t1 = perf()
 
-    connection.close()
+                elapsed_total = (t1 - t0) / 1e9
+                elapsed_server = (t_exec - t0) / 1e9
+                times[i - 1] = elapsed_total
+                
+                server_info.elapsed_total = elapsed_total
+                server_info.elapsed_server = elapsed_server
+                server_info.latency = elapsed_total - elapsed_server
+                
+                # Capture statistics AFTER execution
+                if capture_stats:
+                    try:
+                        capture_after()
+                        server_info.update_io(get_io_stats())
+                        server_info.server_time = get_server_time()
+                    except Exception:
+                        pass
+                
+                # Get rowcount if available
+                if has_rowcount:
+                    try:
+                        rowcount = cursor.rowcount
+                        if rowcount >= 0:
+                            server_info.rowcount = rowcount
+                    except Exception:
+                        pass
+                    
+                stats_list[i - 1] = server_info
+                
+                latency = elapsed_total - elapsed_server
+                log_lines.append(
+                    f"[{config.name}] Execução {i}/{runs}: "
+                    f"total={elapsed_total:.6f}s, servidor={elapsed_server:.6f}s, "
+                    f"latência={latency:.6f}s | retorno={row}"
+                )
+                if len(log_lines) >= LOG_FLUSH_EVERY:
+                    _write_log(log_lines)
+                
+                # This run's after snapshot becomes the next run's before snapshot
+                if capture_stats:
+                    need_before = not advance_collector()
+
+            _write_log(log_lines)
+        finally:
+            # The stats cursor is closed even if a run fails
+            stats_collector.close()
     return times, stats_list
 
 
+def _csv_value(value: Any) -> Any:
+    """CSV cell for an optional metric: empty when it was not collected."""
+    return '' if value is None else value
+
+
+def _csv_seconds(value: Optional[float]) -> str:
+    """CSV cell for an optional duration, with microsecond resolution."""
+    return '' if value is None else f"{value:.6f}"
+
+
+def _csv_rows(
+    results: Dict[str, Tuple[DatabaseConfig, np.ndarray, List[Optional[RunStats]]]],
+    query: str,
+    runs: int,
+) -> Iterator[tuple]:
+    """Yield the formatted CSV rows, one tuple per run."""
+    empty = RunStats()
+    for server_name, (config, times, stats_list) in results.items():
+        db_type, os_type = config.db_type, config.os_type
+        for idx, (t, stats) in enumerate(zip(times.tolist(), stats_list), start=1):
+            # Failed runs have no stats: only the recorded time is written
+            elapsed_total = stats.elapsed_total if stats is not None else t
+            stats = stats or empty
+            
+            yield (
+                db_type, os_type, server_name, idx,
+                f"{elapsed_total:.6f}",
+                _csv_seconds(stats.elapsed_server),
+                _csv_seconds(stats.latency),
+                _csv_value(stats.seq_reads), _csv_value(stats.idx_reads),
+                _csv_value(stats.inserts), _csv_value(stats.updates),
+                _csv_value(stats.deletes),
+                _csv_value(stats.plan), _csv_value(stats.rowcount), query, runs,
+                # Measured by the database (no network); elapsed_server is client-side
+                _csv_seconds(stats.server_time),
+            )
+
+
+def _open_csv(filename: str) -> Tuple[Path, TextIO]:
+    """Create the output CSV, write the header and return (path, open file)."""
+    path = Path(filename).resolve()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    f = path.open("w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE)
+    csv.writer(f, delimiter=";").writerow(CSV_HEADER)
+    return path, f
+
+
+def _publish_csv(partial_path: Path, path: Path) -> None:
+    """
+    Move the finished partial CSV onto the output file.
+    
+    os.replace is atomic, but fails when the output is a bind-mounted file
+    (docker-compose mounts ./benchmark_results.csv): there the contents are
+    copied into the existing file and the partial file is removed.
+    """
+    try:
+        os.replace(partial_path, path)
+    except OSError:
+        shutil.copyfile(partial_path, path)
+        partial_path.unlink(missing_ok=True)
+
+
 def save_csv(
     filename: str,
-    results: Dict[str, Tuple[DatabaseConfig, List[float], List[Optional[Dict[str, Any]]]]],
+    results: Dict[str, Tuple[DatabaseConfig, np.ndarray, List[Optional[RunStats]]]],
     query: str,
     runs: int,
 ) -> Path:
@@ -284,123 +477,249 @@ def save_csv(
     Returns:
         Path to the saved CSV file
     """
-    path = Path(filename).resolve()
-    path.parent.mkdir(parents=True, exist_ok=True)
+    path, f = _open_csv(filename)
+    with f:
+        # Single call: the per-row write loop runs inside the csv module (C)
+        csv.writer(f, delimiter=";").writerows(_csv_rows(results, query, runs))
+
+    return path
 
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f, delimiter=";")
-        
-        # Extended header with db_type and os_type
-        writer.writerow([
-            "db_type", "os_type", "server_name", "run_index", 
-            "elapsed_total_seconds", "elapsed_server_seconds", 
-            "latency_seconds", "seq_reads", "idx_reads", "inserts", "updates", "deletes",
-            "plan", "rowcount", "query", "runs"
-        ])
-        
-        for server_name, (config, times, stats_list) in results.items():
-            for idx, (t, stats) in enumerate(zip(times, stats_list), start=1):
-                elapsed_total = stats.get('elapsed_total', t) if stats else t
-                elapsed_server = stats.get('elapsed_server', '') if stats else ''
-                latency = stats.get('latency', '') if stats else ''
-                
-                seq_reads = stats.get('seq_reads', '') if stats else ''
-                idx_reads = stats.get('idx_reads', '') if stats else ''
-                inserts = stats.get('inserts', '') if stats else ''
-                updates = stats.get('updates', '') if stats else ''
-                deletes = stats.get('deletes', '') if stats else ''
-                
-                plan = stats.get('plan', '') if stats else ''
-                rowcount = stats.get('rowcount', '') if stats else ''
-                
-                writer.writerow([
-                    config.db_type,
-                    config.os_type,
-                    server_name,
-                    idx,
-                    f"{elapsed_total:.6f}",
-                    f"{elapsed_server:.6f}" if elapsed_server != '' else '',
-                    f"{latency:.6f}" if latency != '' else '',
-                    seq_reads, idx_reads, inserts, updates, deletes,
-                    plan, rowcount, query, runs
-                ])
 
+def save_parquet(
+    filename: str,
+    results: Dict[str, Tuple[DatabaseConfig, np.ndarray, List[Optional[RunStats]]]],
+    query: str,
+    runs: int,
+) -> Path:
+    """
+    Save benchmark results to a Parquet file (requires pyarrow).
+    
+    Same columns as the CSV, but typed: durations stay float64 at full
+    precision instead of 6-decimal strings, missing metrics are nulls and
+    the file is zstd-compressed. pandas.read_parquet loads it directly.
+    
+    Args:
+        filename: Output Parquet filename
+        results: Dictionary mapping server name to (config, times, stats)
+        query: Query that was executed
+        runs: Number of runs performed
+    
+    Returns:
+        Path to the saved Parquet file
+    """
+    if pa is None:
+        raise ImportError("Saída Parquet requer pyarrow: uv pip install pyarrow")
+
+    columns: Dict[str, list] = {name: [] for name in CSV_HEADER}
+    empty = RunStats()
+    for server_name, (config, times, stats_list) in results.items():
+        n = len(stats_list)
+        columns["db_type"] += [config.db_type] * n
+        columns["os_type"] += [config.os_type] * n
+        columns["server_name"] += [server_name] * n
+        columns["run_index"] += range(1, n + 1)
+        for t, stats in zip(times.tolist(), stats_list):
+            # Failed runs have no stats: only the recorded time is written
+            columns["elapsed_total_seconds"].append(stats.elapsed_total if stats is not None else t)
+            stats = stats or empty
+            columns["elapsed_server_seconds"].append(stats.elapsed_server)
+            columns["latency_seconds"].append(stats.latency)
+            for field in IO_STAT_FIELDS:
+                columns[field].append(getattr(stats, field))
+            columns["plan"].append(stats.plan)
+            columns["rowcount"].append(stats.rowcount)
+            columns["server_time_seconds"].append(stats.server_time)
+    total = len(columns["run_index"])
+    columns["query"] = [query] * total
+    columns["runs"] = [runs] * total
+
+    types = {
+        "run_index": pa.int64(), "runs": pa.int64(), "rowcount": pa.int64(),
+        "elapsed_total_seconds": pa.float64(), "elapsed_server_seconds": pa.float64(),
+        "latency_seconds": pa.float64(), "server_time_seconds": pa.float64(),
+        **{field: pa.int64() for field in IO_STAT_FIELDS},
+    }
+    table = pa.table({
+        name: pa.array(values, type=types.get(name, pa.string()))
+        for name, values in columns.items()
+    })
+
+    path = Path(filename).resolve()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, path, compression="zstd")
     return path
 
 
-def print_stats(label: str, times: List[float]) -> None:
+def print_stats(label: str, times: np.ndarray) -> None:
     """
     Print statistical summary of benchmark times.
     
     Args:
         label: Label for the benchmark (e.g., server name)
-        times: List of execution times
+        times: Array of execution times
     """
-    if not times:
+    if len(times) == 0:
         print(f"{label}: sem dados.")
         return
 
-    mean = statistics.fmean(times)
-    min_t = min(times)
-    max_t = max(times)
+    # Reductions and percentiles run in NumPy over the float64 buffer; the
+    # 10% trimmed mean is robust to isolated spikes
+    times = np.asarray(times, dtype=np.float64)
+    p50, p95, p99 = np.percentile(times, [50, 95, 99])
+    trimmed = trim_mean(times, 0.1)
 
     print(
-        f"{label}: média={mean:.6f}s, mínimo={min_t:.6f}s, máximo={max_t:.6f}s, "
-        f"execuções={len(times)}"
+        f"{label}: média={times.mean():.6f}s, média aparada={trimmed:.6f}s, "
+        f"mínimo={times.min():.6f}s, máximo={times.max():.6f}s, "
+        f"p50={p50:.6f}s, p95={p95:.6f}s, p99={p99:.6f}s, execuções={len(times)}"
     )
 
 
 def run_benchmark(
-    configs: List[DatabaseConfig],
+    configs: Sequence[DatabaseConfig],
     query: str,
     runs: int,
     output_file: str = "benchmark_results.csv",
     concurrent: bool = False,
-    max_workers: int = 10
-) -> Dict[str, Tuple[DatabaseConfig, List[float], List[Optional[Dict[str, Any]]]]]:
+    max_workers: int = 10,
+    parallel_servers: bool = False,
+    warmup: Optional[int] = None,
+    async_csv: bool = False,
+    concurrent_stats: bool = False,
+    parquet_file: Optional[str] = None,
+    capture_stats: bool = True
+) -> Dict[str, Tuple[DatabaseConfig, np.ndarray, List[Optional[RunStats]]]]:
     """
     Run benchmarks on multiple database servers.
     
     Args:
-        configs: List of database configurations
+        configs: Database configurations
         query: SQL query to execute
         runs: Number of times to execute the query per server
         output_file: Output CSV filename
         concurrent: Se True, executa queries em paralelo (padrão: False)
         max_workers: Número máximo de threads paralelas quando concurrent=True (padrão: 10)
+        parallel_servers: Se True, roda todos os servidores ao mesmo tempo, uma
+            thread (e conexões próprias) por servidor (padrão: False)
+        warmup: Execuções de aquecimento descartadas no modo sequencial
+            (padrão: default_warmup(runs))
+        async_csv: Se True, uma thread dedicada grava o CSV de cada servidor
+            enquanto o próximo já está sendo medido (padrão: False). A thread
+            disputa o GIL com o laço medido, por isso é opcional.
+        concurrent_stats: Coleta estatísticas de I/O também no modo concorrente
+            (padrão: False)
+        parquet_file: Se informado, grava também os resultados em Parquet
+            (tipado, float64 sem arredondamento; requer pyarrow). O CSV
+            continua sendo gerado, pois é o que as análises leem.
+        capture_stats: Se False, não consulta os contadores de I/O do banco
+            em nenhum modo (padrão: True). Elimina duas consultas extras por
+            execução (no Firebird, varreduras de MON$) e deixa só o tempo de
+            relógio; as colunas de I/O e server_time ficam vazias.
     
     Returns:
         Dictionary mapping server name to (config, times, stats)
     """
-    all_results: Dict[str, Tuple[DatabaseConfig, List[float], List[Optional[Dict[str, Any]]]]] = {}
+    all_results: Dict[str, Tuple[DatabaseConfig, np.ndarray, List[Optional[RunStats]]]] = {}
 
-    for config in configs:
-        try:
-            if concurrent:
-                times, stats = run_benchmark_for_server_concurrent(
-                    config, query=query, runs=runs, max_workers=max_workers
-                )
+    # CSV aberto desde o início: as linhas de cada servidor são gravadas assim
+    # que ele termina, e um erro no meio não perde os servidores já medidos.
+    # A gravação vai para um arquivo .partial ao lado do destino, que só
+    # substitui output_file se algum servidor terminou: um benchmark em que
+    # todos falham preserva os resultados anteriores
+    csv_path = Path(output_file).resolve()
+    partial_path, csv_file = _open_csv(f"{output_file}.partial")
+    csv_out = csv.writer(csv_file, delimiter=";")
+
+    def write_rows(batch: Dict[str, Tuple[DatabaseConfig, np.ndarray, List[Optional[RunStats]]]]) -> None:
+        csv_out.writerows(_csv_rows(batch, query, runs))
+        csv_file.flush()
+
+    # Com async_csv, os lotes de cada servidor vão para uma fila drenada por
+    # uma thread de escrita; None na fila encerra a thread
+    write_queue: Optional[queue.Queue] = None
+    writer_errors: List[Exception] = []
+
+    def drain_writes() -> None:
+        while (batch := write_queue.get()) is not None:
+            try:
+                write_rows(batch)
+            except Exception as e:
+                writer_errors.append(e)
+
+    if async_csv:
+        write_queue = queue.Queue()
+        writer_thread = threading.Thread(target=drain_writes, name="csv-writer", daemon=True)
+        writer_thread.start()
+
+    def record(config: DatabaseConfig, times: np.ndarray,
+               stats: List[Optional[RunStats]]) -> None:
+        all_results[config.name] = (config, times, stats)
+        batch = {config.name: (config, times, stats)}
+        if write_queue is not None:
+            write_queue.put(batch)
+        else:
+            write_rows(batch)
+
+    def benchmark_server(config: DatabaseConfig) -> Tuple[np.ndarray, List[Optional[RunStats]]]:
+        if concurrent:
+            return run_benchmark_for_server_concurrent(
+                config, query=query, runs=runs, max_workers=max_workers,
+                collect_stats=concurrent_stats and capture_stats
+            )
+        return run_benchmark_for_server(
+            config, query=query, runs=runs, warmup=warmup, capture_stats=capture_stats
+        )
+
+    def report_error(config: DatabaseConfig, e: Exception) -> None:
+        print(f"\n❌ ERRO ao executar benchmark em {config.name}: {e}")
+        import traceback
+        traceback.print_exc()
+
+    try:
+        with csv_file:
+            if parallel_servers and len(configs) > 1:
+                # Servidores independentes em paralelo: o tempo total passa a ser o do
+                # servidor mais lento, não a soma de todos
+                with ThreadPoolExecutor(max_workers=len(configs)) as executor:
+                    futures = [(config, executor.submit(benchmark_server, config)) for config in configs]
+                    # Resultados coletados na ordem das configurações (CSV estável)
+                    for config, future in futures:
+                        try:
+                            times, stats = future.result()
+                        except Exception as e:
+                            report_error(config, e)
+                            continue
+                        record(config, times, stats)
             else:
-                times, stats = run_benchmark_for_server(config, query=query, runs=runs)
-            all_results[config.name] = (config, times, stats)
-        except Exception as e:
-            print(f"\n❌ ERRO ao executar benchmark em {config.name}: {e}")
-            import traceback
-            traceback.print_exc()
+                for config in configs:
+                    try:
+                        times, stats = benchmark_server(config)
+                    except Exception as e:
+                        report_error(config, e)
+                        continue
+                    record(config, times, stats)
+
+            if write_queue is not None:
+                write_queue.put(None)
+                writer_thread.join()
+                if writer_errors:
+                    raise writer_errors[0]
+    finally:
+        if all_results:
+            _publish_csv(partial_path, csv_path)
+        else:
+            partial_path.unlink(missing_ok=True)
 
     # Print general statistics
     print("\n==== Estatísticas gerais ====")
     for server_name, (config, times, _) in all_results.items():
         print_stats(f"{server_name} ({config.db_type}/{config.os_type})", times)
 
-    # Save results to CSV
+    # Results were already streamed to the CSV (published only if a server finished)
     if all_results:
-        csv_path = save_csv(
-            filename=output_file,
-            results=all_results,
-            query=query,
-            runs=runs,
-        )
         print(f"\n✅ Resultados detalhados salvos em: {csv_path}")
+        if parquet_file:
+            parquet_path = save_parquet(parquet_file, all_results, query, runs)
+            print(f"✅ Resultados em Parquet salvos em: {parquet_path}")
     
     return all_results
@@ -5,13 +5,42 @@ This module provides abstract base classes and factory patterns for collecting
 database-specific performance metrics and execution statistics.
 """
 
+import functools
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence, Tuple, Type
+
+
+# Plan pool: (connection config, query text) -> plan. The plan of a query does
+# not change between runs, so each server explains each query only once
+_PLAN_CACHE: Dict[Tuple[Any, str], Optional[str]] = {}
+
+
+def clear_plan_cache() -> None:
+    """Forget every cached execution plan (e.g. after schema or index changes)."""
+    _PLAN_CACHE.clear()
+
+
+def _row_to_dict(keys: Sequence[str], row: Sequence[Any]) -> Dict[str, Any]:
+    """Map a counters row to its keys, with NULL counters read as 0."""
+    return {key: value or 0 for key, value in zip(keys, row)}
 
 
 class StatisticsCollector(ABC):
     """Abstract base class for database statistics collection."""
     
+    # Slots in the whole hierarchy (ABC itself declares none): subclasses list
+    # only the attributes they add
+    __slots__ = ('connection', '_stats_before', '_stats_after', '_server_time', '_stats_cursor')
+    
+    # (output metric, source counters) pairs for get_io_stats: each metric is
+    # the summed after - before delta of its counters
+    _DELTA_KEYS: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()
+    
+    # Whether advance() may reuse an after snapshot as the next before
+    # snapshot. Only valid when capture_after() runs no statement after its
+    # snapshot: anything it runs later would land in the next run's delta
+    _CHAIN_SNAPSHOTS = True
+    
     def __init__(self, connection: Any):
         """
         Initialize collector with a database connection.
@@ -22,35 +51,57 @@ class StatisticsCollector(ABC):
         self.connection = connection
         self._stats_before: Optional[Dict[str, Any]] = None
         self._stats_after: Optional[Dict[str, Any]] = None
+        self._server_time: Optional[float] = None
+        self._stats_cursor: Any = None
     
-    @abstractmethod
     def get_execution_plan(self, query: str) -> Optional[str]:
         """
         Get the execution plan for a query without executing it.
         
+        Plans are pooled per server and query text: only the first call
+        reaches the database. Failures are returned as "Plan error: ..." and
+        not cached, so a later call can retry.
+        
         Args:
             query: SQL query string
             
         Returns:
             Execution plan as string, or None if unavailable
         """
-        pass
+        key = (self.connection.config, query)
+        try:
+            return _PLAN_CACHE[key]
+        except KeyError:
+            pass
+        
+        try:
+            plan = self._explain(query)
+        except Exception as e:
+            return f"Plan error: {str(e)}"
+        
+        _PLAN_CACHE[key] = plan
+        return plan
     
     @abstractmethod
+    def _explain(self, query: str) -> Optional[str]:
+        """Ask the database for the plan of query (errors propagate)."""
+        pass
+    
     def capture_before(self) -> None:
         """Capture database statistics before query execution."""
-        pass
+        self._capture('_stats_before')
     
-    @abstractmethod
     def capture_after(self) -> None:
         """Capture database statistics after query execution."""
-        pass
+        self._capture('_stats_after')
     
-    @abstractmethod
     def get_io_stats(self) -> Dict[str, Any]:
         """
         Get I/O statistics delta between before/after captures.
         
+        Computed from the collector's _DELTA_KEYS table ({} if a snapshot
+        is missing).
+        
         Returns:
             Dictionary with keys:
                 - seq_reads: Sequential/table reads
@@ -60,12 +111,105 @@ class StatisticsCollector(ABC):
                 - deletes: Record deletes
                 - (optional DB-specific metrics)
         """
+        before, after = self._stats_before, self._stats_after
+        if not before or not after:
+            return {}
+        return {
+            metric: sum(after[key] - before[key] for key in keys)
+            for metric, keys in self._DELTA_KEYS
+        }
+    
+    def _get_stats_cursor(self) -> Any:
+        """
+        Cursor dedicated to the monitoring queries, opened on first use.
+        
+        Kept for the collector's lifetime, so each before/after snapshot is
+        just an execute + fetch instead of a cursor open/close pair.
+        """
+        if self._stats_cursor is None:
+            self._stats_cursor = self.connection.get_cursor()
+        return self._stats_cursor
+    
+    @abstractmethod
+    def _read_stats(self) -> Optional[Dict[str, Any]]:
+        """Read one snapshot of the database counters (None if unavailable)."""
         pass
     
+    def _capture(self, attr_name: str) -> None:
+        """Store a _read_stats() snapshot in attr_name (None on any error)."""
+        try:
+            setattr(self, attr_name, self._read_stats())
+        except Exception:
+            setattr(self, attr_name, None)
+    
+    def get_server_time(self) -> Optional[float]:
+        """
+        Server-side execution time of the last query, in seconds.
+        
+        Measured by the database itself, so it excludes the network round-trip
+        that the client-side elapsed_server includes. Collectors fill it in
+        capture_after(); None when the database does not expose it.
+        """
+        return self._server_time
+    
     def reset(self) -> None:
         """Reset captured statistics."""
         self._stats_before = None
         self._stats_after = None
+        self._server_time = None
+    
+    def advance(self) -> bool:
+        """
+        Start the next run from the current after snapshot.
+        
+        Between two consecutive runs on the same connection nothing else
+        executes, so the after snapshot of one run is also the before
+        snapshot of the next: chaining them halves the monitoring queries.
+        Collectors whose capture_after() issues other statements after the
+        snapshot set _CHAIN_SNAPSHOTS = False and always take a fresh one.
+        
+        Returns:
+            True if a snapshot was carried over, False if the next run still
+            needs capture_before() (the after snapshot was not available, or
+            the collector does not chain snapshots)
+        """
+        if not self._CHAIN_SNAPSHOTS:
+            self.reset()
+            return False
+        self._stats_before = self._stats_after
+        self._stats_after = None
+        self._server_time = None
+        return self._stats_before is not None
+    
+    def close(self) -> None:
+        """Close the stats cursor; the connection itself stays open."""
+        if self._stats_cursor is not None:
+            try:
+                self._stats_cursor.close()
+            except Exception:
+                pass
+            self._stats_cursor = None
+
+
+@functools.cache
+def _collector_classes() -> Dict[str, Type[StatisticsCollector]]:
+    """
+    Map of db_type to collector class, built once on first use.
+    
+    The imports stay lazy because the submodules import StatisticsCollector
+    from this package.
+    """
+    from .firebird import FirebirdStatsCollector
+    from .mysql import MySQLStatsCollector
+    from .postgresql import PostgreSQLStatsCollector
+    from .mariadb import MariaDBStatsCollector
+    
+    return {
+        'firebird': FirebirdStatsCollector,
+        'mysql': MySQLStatsCollector,
+        'postgresql': PostgreSQLStatsCollector,
+        'mariadb': MariaDBStatsCollector,
+    }
 
 
 class StatisticsCollectorFactory:
@@ -83,19 +227,7 @@ class StatisticsCollectorFactory:
         Returns:
             StatisticsCollector instance for the specified database
         """
-        from .firebird import FirebirdStatsCollector
-        from .mysql import MySQLStatsCollector
-        from .postgresql import PostgreSQLStatsCollector
-        from .mariadb import MariaDBStatsCollector
-        
-        collectors = {
-            'firebird': FirebirdStatsCollector,
-            'mysql': MySQLStatsCollector,
-            'postgresql': PostgreSQLStatsCollector,
-            'mariadb': MariaDBStatsCollector,
-        }
-        
-        collector_class = collectors.get(db_type.lower())
+        collector_class = _collector_classes().get(db_type.lower())
         if not collector_class:
             raise ValueError(
                 f"Database type não suportado: {db_type}"
@@ -5,111 +5,99 @@ from typing import Any, Dict, Optional
 from . import StatisticsCollector
 
 
+HANDLER_STATUS_SQL = "SHOW STATUS LIKE 'Handler_%'"
+# Handler counters used by get_io_stats (stored under their lowercase names)
+HANDLER_COUNTERS = (
+    'Handler_read_rnd_next', 'Handler_read_key', 'Handler_read_next',
+    'Handler_write', 'Handler_update', 'Handler_delete',
+)
+# Snapshot keys, built once so every snapshot dict shares the same key objects
+HANDLER_KEYS = tuple(name.lower() for name in HANDLER_COUNTERS)
+
+# TIMER_WAIT (picoseconds) of this connection's second most recent finished
+# statement: capture_after() runs it right after the Handler snapshot, so the
+# most recent one is the snapshot and the one before it the benchmarked query
+SERVER_TIME_SQL = """
+    SELECT h.TIMER_WAIT
+    FROM performance_schema.events_statements_history h
+    JOIN performance_schema.threads t ON t.THREAD_ID = h.THREAD_ID
+    WHERE t.PROCESSLIST_ID = CONNECTION_ID()
+    ORDER BY h.EVENT_ID DESC
+    LIMIT 1 OFFSET 1
+"""
+
+
 class MySQLStatsCollector(StatisticsCollector):
     """MySQL-specific statistics collector using EXPLAIN and SHOW STATUS."""
     
-    def get_execution_plan(self, query: str) -> Optional[str]:
+    __slots__ = ()
+    
+    # capture_after() reads performance_schema after its Handler snapshot;
+    # chained, that lookup's handler work would be counted in the next run
+    _CHAIN_SNAPSHOTS = False
+    
+    # Handler_read_rnd_next counts sequential table scans; index reads are
+    # Handler_read_key + Handler_read_next
+    _DELTA_KEYS = (
+        ('seq_reads', ('handler_read_rnd_next',)),
+        ('idx_reads', ('handler_read_key', 'handler_read_next')),
+        ('inserts', ('handler_write',)),
+        ('updates', ('handler_update',)),
+        ('deletes', ('handler_delete',)),
+    )
+    
+    def _explain(self, query: str) -> Optional[str]:
         """Get MySQL execution plan using EXPLAIN."""
-        try:
-            cursor = self.connection.get_cursor()
-            cursor.execute(f"EXPLAIN {query}")
-            rows = cursor.fetchall()
-            cursor.close()
-            
-            if rows:
-                # Format EXPLAIN output as string
-                # Columns: id, select_type, table, type, possible_keys, key, key_len, ref, rows, Extra
-                plan_lines = []
-                for row in rows:
-                    plan_lines.append(f"id={row[0]} type={row[3]} table={row[2]} rows={row[8]}")
-                return "; ".join(plan_lines)
-            return None
-        except Exception as e:
-            return f"Plan error: {str(e)}"
+        cursor = self.connection.get_cursor()
+        cursor.execute(f"EXPLAIN {query}")
+        rows = cursor.fetchall()
+        cursor.close()
+        
+        if rows:
+            # Format EXPLAIN output as string
+            # Columns: id, select_type, table, type, possible_keys, key, key_len, ref, rows, Extra
+            plan_lines = []
+            for row in rows:
+                plan_lines.append(f"id={row[0]} type={row[3]} table={row[2]} rows={row[8]}")
+            return "; ".join(plan_lines)
+        return None
     
-    def capture_before(self) -> None:
-        """Capture MySQL Handler statistics before query execution."""
+    def _read_stats(self) -> Optional[Dict[str, Any]]:
+        """Read the session's Handler_* counters."""
+        cursor = self._get_stats_cursor()
+        cursor.execute(HANDLER_STATUS_SQL)
+        
+        stats = {}
+        for name, value in cursor.fetchall():
+            stats[name] = int(value) if value.isdigit() else 0
+        
+        return dict(zip(HANDLER_KEYS, [stats.get(name, 0) for name in HANDLER_COUNTERS]))
+    
+    def _read_server_time(self) -> Optional[float]:
+        """
+        TIMER_WAIT of the benchmarked statement, in seconds.
+        
+        Read from performance_schema right after the Handler snapshot, so the
+        lookup stays outside the counter window (see SERVER_TIME_SQL); None
+        if performance_schema is disabled or not accessible.
+        """
         try:
-            cursor = self.connection.get_cursor()
-            cursor.execute("""
-                SHOW STATUS LIKE 'Handler_%'
-            """)
-            results = cursor.fetchall()
-            cursor.close()
+            cursor = self._get_stats_cursor()
+            cursor.execute(SERVER_TIME_SQL)
+            result = cursor.fetchone()
             
-            stats = {}
-            for name, value in results:
-                stats[name] = int(value) if value.isdigit() else 0
-            
-            self._stats_before = {
-                'handler_read_rnd_next': stats.get('Handler_read_rnd_next', 0),
-                'handler_read_key': stats.get('Handler_read_key', 0),
-                'handler_read_next': stats.get('Handler_read_next', 0),
-                'handler_write': stats.get('Handler_write', 0),
-                'handler_update': stats.get('Handler_update', 0),
-                'handler_delete': stats.get('Handler_delete', 0),
-            }
+            if result and result[0] is not None:
+                return result[0] / 1e12
+            return None
         except Exception:
-            self._stats_before = None
+            return None
     
     def capture_after(self) -> None:
         """Capture MySQL Handler statistics after query execution."""
-        try:
-            cursor = self.connection.get_cursor()
-            cursor.execute("""
-                SHOW STATUS LIKE 'Handler_%'
-            """)
-            results = cursor.fetchall()
-            cursor.close()
-            
-            stats = {}
-            for name, value in results:
-                stats[name] = int(value) if value.isdigit() else 0
-            
-            self._stats_after = {
-                'handler_read_rnd_next': stats.get('Handler_read_rnd_next', 0),
-                'handler_read_key': stats.get('Handler_read_key', 0),
-                'handler_read_next': stats.get('Handler_read_next', 0),
-                'handler_write': stats.get('Handler_write', 0),
-                'handler_update': stats.get('Handler_update', 0),
-                'handler_delete': stats.get('Handler_delete', 0),
-            }
-        except Exception:
-            self._stats_after = None
-    
-    def get_io_stats(self) -> Dict[str, Any]:
-        """
-        Get I/O statistics delta for MySQL.
-        
-        Maps MySQL Handler counters to standard metrics:
-        - seq_reads: Handler_read_rnd_next (sequential table scans)
-        - idx_reads: Handler_read_key + Handler_read_next (index operations)
-        - inserts: Handler_write
-        - updates: Handler_update
-        - deletes: Handler_delete
-        """
-        if not self._stats_before or not self._stats_after:
-            return {}
-        
-        return {
-            'seq_reads': (
-                self._stats_after['handler_read_rnd_next'] - 
-                self._stats_before['handler_read_rnd_next']
-            ),
-            'idx_reads': (
-                (self._stats_after['handler_read_key'] - self._stats_before['handler_read_key']) +
-                (self._stats_after['handler_read_next'] - self._stats_before['handler_read_next'])
-            ),
-            'inserts': (
-                self._stats_after['handler_write'] - 
-                self._stats_before['handler_write']
-            ),
-            'updates': (
-                self._stats_after['handler_update'] - 
-                self._stats_before['handler_update']
-            ),
-            'deletes': (
-                self._stats_after['handler_delete'] - 
-                self._stats_before['handler_delete']
-            ),
-        }
+        # Handler snapshot first: the performance_schema query must not count
+        # in this run's delta. Without a snapshot the statement history offset
+        # is unknown, so no server time is reported either
+        super().capture_after()
+        self._server_time = (
+            self._read_server_time() if self._stats_after is not None else None
+        )
@@ -6,18 +6,47 @@ This module provides flexible configuration loading supporting both:
 2. New format: SERVER{N}_* environment variables for unlimited servers
 """
 
+import functools
 import os
-from typing import Dict, List, Optional
-
-from dotenv import load_dotenv
+import re
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from .database import DatabaseConfig
 
+# The .env file is read once, when the module is imported. Where the
+# environment is already populated (containers with env_file, CI),
+# COMPARE_FB_SKIP_DOTENV=1 skips the .env search and the dotenv import
+if os.getenv("COMPARE_FB_SKIP_DOTENV", "").strip().lower() not in ("1", "true", "yes"):
+    from dotenv import load_dotenv
+    load_dotenv()
+
+# SERVER{N}_<FIELD> variables of the multi-database format
+SERVER_VAR_PATTERN = re.compile(r"^SERVER(\d+)_([A-Z]+)$")
+
+# Default port based on database type
+_DEFAULT_PORTS = {
+    'firebird': 3050,
+    'mysql': 3306,
+    'postgresql': 5432,
+    'mariadb': 3306,
+}
+
 
-def load_database_configs() -> List[DatabaseConfig]:
+def _env(key: str, default: str = "") -> str:
+    """Stripped value of an environment variable; default when unset or empty."""
+    value = os.environ.get(key)
+    return value.strip() if value else default
+
+
+@functools.lru_cache(maxsize=1)
+def load_database_configs() -> Tuple[DatabaseConfig, ...]:
     """
     Load database configurations from environment variables.
     
+    Computed once per process (the environment does not change while the
+    benchmark runs); a tuple is returned so the cached value is not mutated.
+    
     Supports two formats:
     
     1. Legacy format (Firebird only, backward compatible):
@@ -27,47 +56,44 @@ def load_database_configs() -> List[DatabaseConfig]:
     2. New format (multi-database):
        SERVER1_TYPE, SERVER1_OS, SERVER1_NAME, SERVER1_HOST, SERVER1_PORT, ...
        SERVER2_TYPE, SERVER2_OS, SERVER2_NAME, SERVER2_HOST, SERVER2_PORT, ...
-       ...up to SERVER10
+       ...any number of servers, in SERVER{N} order
     
     Returns:
-        List of DatabaseConfig objects
+        Tuple of DatabaseConfig objects
     
     Raises:
         ValueError: If no valid configurations are found
     """
-    load_dotenv()
-    
     configs: List[DatabaseConfig] = []
     
-    # Try new format first (SERVER{N}_*)
-    for i in range(1, 11):  # Support up to 10 servers
-        prefix = f"SERVER{i}_"
+    # Try new format first: one pass over the environment groups the
+    # SERVER{N}_* variables by N, so only defined servers are visited
+    servers: Dict[int, Dict[str, str]] = {}
+    for key, value in os.environ.items():
+        match = SERVER_VAR_PATTERN.match(key)
+        if match:
+            servers.setdefault(int(match.group(1)), {})[match.group(2)] = value.strip()
+    
+    for i in sorted(servers):
+        fields = servers[i]
         
-        db_type = os.getenv(f"{prefix}TYPE", "").strip().lower()
+        db_type = fields.get("TYPE", "").lower()
         if not db_type:
             continue  # Skip if no type defined
         
-        os_type = os.getenv(f"{prefix}OS", "").strip().lower()
-        name = os.getenv(f"{prefix}NAME", "").strip()
-        host = os.getenv(f"{prefix}HOST", "").strip()
-        port_str = os.getenv(f"{prefix}PORT", "").strip()
-        database = os.getenv(f"{prefix}DATABASE", "").strip()
-        user = os.getenv(f"{prefix}USER", "").strip()
-        password = os.getenv(f"{prefix}PASSWORD", "").strip()
-        charset = os.getenv(f"{prefix}CHARSET", "UTF8").strip()
-        
-        # Default port based on database type
-        default_ports = {
-            'firebird': 3050,
-            'mysql': 3306,
-            'postgresql': 5432,
-            'mariadb': 3306,
-        }
+        os_type = fields.get("OS", "").lower()
+        name = fields.get("NAME", "")
+        host = fields.get("HOST", "")
+        port_str = fields.get("PORT", "")
+        database = fields.get("DATABASE", "")
+        user = fields.get("USER", "")
+        password = fields.get("PASSWORD", "")
+        charset = fields.get("CHARSET", "UTF8")
         
         try:
-            port = int(port_str) if port_str else default_ports.get(db_type, 3050)
+            port = int(port_str) if port_str else _DEFAULT_PORTS.get(db_type, 3050)
         except ValueError:
-            port = default_ports.get(db_type, 3050)
+            port = _DEFAULT_PORTS.get(db_type, 3050)
         
         # Default name if not provided
         if not name:
@@ -106,7 +132,7 @@ def load_database_configs() -> List[DatabaseConfig]:
             "Exemplo: SERVER1_TYPE=firebird, SERVER1_HOST=..., etc."
         )
     
-    return configs
+    return tuple(configs)
 
 
 def _load_legacy_configs() -> List[DatabaseConfig]:
@@ -119,7 +145,7 @@ def _load_legacy_configs() -> List[DatabaseConfig]:
     configs: List[DatabaseConfig] = []
     
     # Windows Firebird
-    win_host = os.getenv("WIN_FB_HOST", "").strip()
+    win_host = _env("WIN_FB_HOST")
     if win_host:
         try:
             config = DatabaseConfig(
@@ -127,10 +153,10 @@ def _load_legacy_configs() -> List[DatabaseConfig]:
                 os_type="windows",
                 name="Windows",
                 host=win_host,
-                port=int(os.getenv("WIN_FB_PORT", "3050")),
-                database=os.getenv("WIN_FB_DATABASE", "").strip(),
-                user=os.getenv("WIN_FB_USER", "").strip(),
-                password=os.getenv("WIN_FB_PASSWORD", "").strip(),
+                port=int(_env("WIN_FB_PORT", "3050")),
+                database=_env("WIN_FB_DATABASE"),
+                user=_env("WIN_FB_USER"),
+                password=_env("WIN_FB_PASSWORD"),
                 charset="UTF8",
             )
             configs.append(config)
@@ -138,7 +164,7 @@ def _load_legacy_configs() -> List[DatabaseConfig]:
             print(f"⚠️  Aviso: Configuração Windows Firebird inválida: {e}")
     
     # Linux Firebird
-    lin_host = os.getenv("LIN_FB_HOST", "").strip()
+    lin_host = _env("LIN_FB_HOST")
     if lin_host:
         try:
             config = DatabaseConfig(
@@ -146,10 +172,10 @@ def _load_legacy_configs() -> List[DatabaseConfig]:
                 os_type="linux",
                 name="Linux",
                 host=lin_host,
-                port=int(os.getenv("LIN_FB_PORT", "3050")),
-                database=os.getenv("LIN_FB_DATABASE", "").strip(),
-                user=os.getenv("LIN_FB_USER", "").strip(),
-                password=os.getenv("LIN_FB_PASSWORD", "").strip(),
+                port=int(_env("LIN_FB_PORT", "3050")),
+                database=_env("LIN_FB_DATABASE"),
+                user=_env("LIN_FB_USER"),
+                password=_env("LIN_FB_PASSWORD"),
                 charset="UTF8",
             )
             configs.append(config)
@@ -159,15 +185,20 @@ def _load_legacy_configs() -> List[DatabaseConfig]:
     return configs
 
 
-def get_benchmark_params() -> Dict[str, any]:
+@functools.lru_cache(maxsize=1)
+def get_benchmark_params() -> Mapping[str, Any]:
     """
     Get benchmark parameters from environment variables.
     
+    Computed once per process and returned as a read-only mapping, since the
+    same cached object is shared by every caller.
+    
     Returns:
-        Dictionary with 'runs', 'query', 'concurrent', and 'max_workers' keys
+        Mapping with 'runs', 'query', 'concurrent', 'max_workers',
+        'parallel_servers', 'warmup' (None when unset), 'async_csv',
+        'concurrent_stats', 'parquet_file' (None when unset) and
+        'capture_stats' (True unless FB_BENCH_CAPTURE_STATS is 0/false/no) keys
     """
-    load_dotenv()
-    
     # Parse concurrent setting
     concurrent_val = os.getenv("FB_BENCH_CONCURRENT", "0").strip()
     try:
@@ -177,12 +208,20 @@ def get_benchmark_params() -> Dict[str, any]:
         concurrent = False
         max_workers = 10
     
-    return {
+    warmup_val = os.getenv("FB_BENCH_WARMUP", "").strip()
+    
+    return MappingProxyType({
         'runs': int(os.getenv("FB_BENCH_RUNS", "20")),
         'query': os.getenv("FB_BENCH_QUERY", "SELECT 1"),
         'concurrent': concurrent,
         'max_workers': max_workers if concurrent else 10,
-    }
+        'parallel_servers': os.getenv("FB_BENCH_PARALLEL", "0").strip().lower() in ("1", "true", "yes"),
+        'warmup': int(warmup_val) if warmup_val else None,
+        'async_csv': os.getenv("FB_BENCH_ASYNC_CSV", "0").strip().lower() in ("1", "true", "yes"),
+        'concurrent_stats': os.getenv("FB_BENCH_CONCURRENT_STATS", "0").strip().lower() in ("1", "true", "yes"),
+        'parquet_file': os.getenv("FB_BENCH_PARQUET", "").strip() or None,
+        'capture_stats': os.getenv("FB_BENCH_CAPTURE_STATS", "1").strip().lower() not in ("0", "false", "no"),
+    })
 
 
 def get_server_specific_query(server_index: int) -> Optional[str]:
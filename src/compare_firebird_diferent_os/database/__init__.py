@@ -6,12 +6,18 @@ multiple SQL databases (Firebird, MySQL, PostgreSQL, MariaDB) across different
 operating systems.
 """
 
+import functools
+import importlib
+import queue
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+_VALID_DB_TYPES = frozenset({'firebird', 'mysql', 'postgresql', 'mariadb'})
+_VALID_OS_TYPES = frozenset({'windows', 'linux'})
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
     """Configuration for database connection with multi-DB support."""
     
@@ -26,30 +32,33 @@ class DatabaseConfig:
     charset: str = "UTF8"
     
     def __post_init__(self):
-        """Validate required fields."""
-        self.db_type = self.db_type.lower()
-        self.os_type = self.os_type.lower()
+        """Validate required fields (and normalize the types to lower case)."""
+        db_type = self.db_type.lower()
+        os_type = self.os_type.lower()
+        # Frozen dataclass: the normalized values are set through object
+        object.__setattr__(self, 'db_type', db_type)
+        object.__setattr__(self, 'os_type', os_type)
         
-        if self.db_type not in ('firebird', 'mysql', 'postgresql', 'mariadb'):
+        if db_type not in _VALID_DB_TYPES:
             raise ValueError(
-                f"Tipo de banco inválido: {self.db_type}. "
+                f"Tipo de banco inválido: {db_type}. "
                 f"Suportados: firebird, mysql, postgresql, mariadb"
             )
         
-        if self.os_type not in ('windows', 'linux'):
+        if os_type not in _VALID_OS_TYPES:
             raise ValueError(
-                f"Tipo de SO inválido: {self.os_type}. Suportados: windows, linux"
+                f"Tipo de SO inválido: {os_type}. Suportados: windows, linux"
             )
         
-        missing = []
-        for field, value in [
-            ("host", self.host),
-            ("database", self.database),
-            ("user", self.user),
-            ("password", self.password),
-        ]:
-            if not value:
-                missing.append(field)
+        missing = [
+            field for field, value in (
+                ("host", self.host),
+                ("database", self.database),
+                ("user", self.user),
+                ("password", self.password),
+            )
+            if not value
+        ]
         
         if missing:
             raise ValueError(
@@ -58,7 +67,17 @@ class DatabaseConfig:
 
 
 class DatabaseConnection(ABC):
-    """Abstract base class for database connections."""
+    """
+    Abstract base class for database connections.
+    
+    One instance is one open session: the benchmark connects once per server
+    and runs every execution on it, never reconnecting between runs. Used as
+    a context manager, it connects on entry and closes on exit.
+    """
+    
+    # Slots in the whole hierarchy (ABC itself declares none): subclasses list
+    # only the attributes they add
+    __slots__ = ('config', '_connection', '_cursor')
     
     def __init__(self, config: DatabaseConfig):
         self.config = config
@@ -75,6 +94,20 @@ class DatabaseConnection(ABC):
         """Execute a query and return the cursor."""
         pass
     
+    def prepare(self, query: str) -> Any:
+        """
+        Prepare a query once for repeated execution.
+        
+        Returns an opaque handle for execute_prepared(). The default handle is
+        the SQL text itself; drivers with server-side prepared statements
+        override this so the query is parsed and planned only once.
+        """
+        return query
+    
+    def execute_prepared(self, handle: Any) -> Any:
+        """Execute a handle returned by prepare() and return the cursor."""
+        return self.execute_query(handle)
+    
     @abstractmethod
     def fetchone(self) -> Any:
         """Fetch one row from the cursor."""
@@ -95,6 +128,13 @@ class DatabaseConnection(ABC):
         """Get the current connection/session ID."""
         pass
     
+    def __enter__(self) -> "DatabaseConnection":
+        self.connect()
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
     @property
     def connection(self) -> Any:
         """Get the underlying connection object."""
@@ -106,28 +146,84 @@ class DatabaseConnection(ABC):
         return self._cursor
 
 
+# db_type -> (submodule, class): each submodule imports its own driver
+_CONNECTION_MODULES = {
+    'firebird': ('.firebird', 'FirebirdConnection'),
+    'mysql': ('.mysql', 'MySQLConnection'),
+    'postgresql': ('.postgresql', 'PostgreSQLConnection'),
+    'mariadb': ('.mariadb', 'MariaDBConnection'),
+}
+
+
+@functools.cache
+def _connection_class(db_type: str) -> type:
+    """
+    Import only the connection class for db_type, once.
+    
+    Lazy per type, so benchmarking Firebird and PostgreSQL does not require
+    the MySQL or MariaDB drivers to be installed.
+    """
+    module_name, class_name = _CONNECTION_MODULES[db_type]
+    module = importlib.import_module(module_name, package=__package__)
+    return getattr(module, class_name)
+
+
 class DatabaseConnectionFactory:
     """Factory for creating database-specific connection instances."""
     
     @staticmethod
     def create(config: DatabaseConfig) -> DatabaseConnection:
         """Create a database connection based on db_type."""
-        from .firebird import FirebirdConnection
-        from .mysql import MySQLConnection
-        from .postgresql import PostgreSQLConnection
-        from .mariadb import MariaDBConnection
-        
-        connections = {
-            'firebird': FirebirdConnection,
-            'mysql': MySQLConnection,
-            'postgresql': PostgreSQLConnection,
-            'mariadb': MariaDBConnection,
-        }
-        
-        connection_class = connections.get(config.db_type)
-        if not connection_class:
+        if config.db_type not in _CONNECTION_MODULES:
             raise ValueError(
                 f"Database type não suportado: {config.db_type}"
             )
         
-        return connection_class(config)
+        return _connection_class(config.db_type)(config)
+
+
+class ConnectionPool:
+    """
+    Fixed-size pool of pre-connected DatabaseConnection instances.
+    
+    All connections are opened up front, so TCP handshake and authentication
+    happen before any measurement instead of inside each timed task. Threads
+    borrow a connection with acquire() and hand it back with release().
+    """
+    
+    def __init__(self, config: DatabaseConfig, size: int):
+        self.config = config
+        self._idle: "queue.Queue[DatabaseConnection]" = queue.Queue()
+        self._connections: List[DatabaseConnection] = []
+        try:
+            for _ in range(size):
+                connection = DatabaseConnectionFactory.create(config)
+                connection.connect()
+                self._connections.append(connection)
+                self._idle.put(connection)
+        except Exception:
+            self.close()
+            raise
+    
+    def acquire(self) -> DatabaseConnection:
+        """Take an idle connection, blocking until one is available."""
+        return self._idle.get()
+    
+    def release(self, connection: DatabaseConnection) -> None:
+        """Return a connection to the pool."""
+        self._idle.put(connection)
+    
+    def close(self) -> None:
+        """Close every connection owned by the pool."""
+        for connection in self._connections:
+            try:
+                connection.close()
+            except Exception:
+                pass
+        self._connections.clear()
+    
+    def __enter__(self) -> "ConnectionPool":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
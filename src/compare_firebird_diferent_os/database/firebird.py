@@ -1,6 +1,13 @@
-"""Firebird database connection implementation."""
+"""
+Firebird database connection implementation.
 
-from typing import Any, Optional
+Uses the fdb driver on purpose. fdb calls libfbclient through ctypes, which
+releases the GIL for the duration of each foreign call (attach, prepare,
+execute, fetch). Threads of the concurrent benchmark therefore wait on the
+server in parallel instead of serializing inside the driver.
+"""
+
+from typing import Any, Dict, Optional
 
 import fdb
 
@@ -10,6 +17,13 @@ from . import DatabaseConnection, DatabaseConfig
 class FirebirdConnection(DatabaseConnection):
     """Firebird-specific database connection."""
     
+    __slots__ = ('_prepared', '_cached_attachment_id')
+    
+    def __init__(self, config: DatabaseConfig):
+        super().__init__(config)
+        self._prepared: Dict[str, Any] = {}
+        self._cached_attachment_id: Optional[int] = None
+    
     def connect(self) -> Any:
         """Establish Firebird connection."""
         self._connection = fdb.connect(
@@ -28,13 +42,38 @@ class FirebirdConnection(DatabaseConnection):
         self._cursor.execute(query)
         return self._cursor
     
+    def prepare(self, query: str) -> Any:
+        """
+        Prepare the query on the main cursor (fdb PreparedStatement).
+        
+        Statements are cached by SQL text, so the benchmark loop and the plan
+        lookup in FirebirdStatsCollector share a single prepare.
+        """
+        statement = self._prepared.get(query)
+        if statement is None:
+            statement = self._prepared[query] = self._cursor.prep(query)
+        return statement
+    
+    def execute_prepared(self, handle: Any) -> Any:
+        """Execute a prepared statement without re-parsing the SQL."""
+        self._cursor.execute(handle)
+        return self._cursor
+    
     def fetchone(self) -> Any:
         """Fetch one row from the cursor."""
         return self._cursor.fetchone()
     
     def get_cursor(self) -> Any:
-        """Get a new cursor for separate operations."""
-        return self._connection.cursor()
+        """
+        Get a new cursor for separate operations.
+        
+        These cursors run the single-row monitoring queries (attachment ID,
+        stats snapshots), so arraysize is set to 1: the DB-API fetch-size
+        hint then asks the driver for one row at a time.
+        """
+        cursor = self._connection.cursor()
+        cursor.arraysize = 1
+        return cursor
     
     def close(self) -> None:
         """Close the database connection."""
@@ -42,18 +81,26 @@ class FirebirdConnection(DatabaseConnection):
             self._cursor.close()
         if self._connection:
             self._connection.close()
+        self._prepared.clear()
+        self._cached_attachment_id = None
     
     def get_connection_id(self) -> Optional[Any]:
-        """Get the current Firebird connection ID."""
+        """
+        Get the current Firebird connection ID.
+        
+        The attachment ID is fixed for the connection's lifetime, so it is
+        queried once and cached until close(). CURRENT_CONNECTION is read
+        from RDB$DATABASE: the same value MON$ATTACHMENTS would return,
+        without materializing a monitoring snapshot.
+        """
+        if self._cached_attachment_id is not None:
+            return self._cached_attachment_id
         try:
             cur = self.get_cursor()
-            cur.execute("""
-                SELECT MON$ATTACHMENT_ID 
-                FROM MON$ATTACHMENTS 
-                WHERE MON$ATTACHMENT_ID = CURRENT_CONNECTION
-            """)
+            cur.execute("SELECT CURRENT_CONNECTION FROM RDB$DATABASE")
             result = cur.fetchone()
             cur.close()
-            return result[0] if result else None
+            self._cached_attachment_id = result[0] if result else None
+            return self._cached_attachment_id
         except Exception:
             return None
@@ -10,6 +10,12 @@ from . import DatabaseConnection, DatabaseConfig
 class MariaDBConnection(DatabaseConnection):
     """MariaDB-specific database connection."""
     
+    __slots__ = ('_cursor_prepared',)
+    
+    def __init__(self, config: DatabaseConfig):
+        super().__init__(config)
+        self._cursor_prepared = False
+    
     def connect(self) -> Any:
         """Establish MariaDB connection."""
         self._connection = mariadb.connect(
@@ -27,13 +33,38 @@ class MariaDBConnection(DatabaseConnection):
         self._cursor.execute(query)
         return self._cursor
     
+    def prepare(self, query: str) -> Any:
+        """
+        Switch the main cursor to a prepared cursor.
+        
+        The prepared cursor sends the statement to the server on the first
+        execute and reuses it while the same SQL text is executed again.
+        The switch happens once per connection, so calling prepare() before
+        every execution (as pooled connections do) keeps the server-side
+        statement instead of discarding it.
+        """
+        if not self._cursor_prepared:
+            if self._cursor:
+                self._cursor.close()
+            self._cursor = self._connection.cursor(prepared=True)
+            self._cursor_prepared = True
+        return query
+    
     def fetchone(self) -> Any:
         """Fetch one row from the cursor."""
         return self._cursor.fetchone()
     
     def get_cursor(self) -> Any:
-        """Get a new cursor for separate operations."""
-        return self._connection.cursor()
+        """
+        Get a new cursor for separate operations.
+        
+        These cursors run the single-row monitoring queries (attachment ID,
+        stats snapshots), so arraysize is set to 1: the DB-API fetch-size
+        hint then asks the driver for one row at a time.
+        """
+        cursor = self._connection.cursor()
+        cursor.arraysize = 1
+        return cursor
     
     def close(self) -> None:
         """Close the database connection."""
@@ -41,6 +72,7 @@ class MariaDBConnection(DatabaseConnection):
             self._cursor.close()
         if self._connection:
             self._connection.close()
+        self._cursor_prepared = False
     
     def get_connection_id(self) -> Optional[Any]:
         """Get the current MariaDB connection ID."""
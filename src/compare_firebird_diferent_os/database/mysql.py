@@ -10,6 +10,12 @@ from . import DatabaseConnection, DatabaseConfig
 class MySQLConnection(DatabaseConnection):
     """MySQL-specific database connection."""
     
+    __slots__ = ('_cursor_prepared',)
+    
+    def __init__(self, config: DatabaseConfig):
+        super().__init__(config)
+        self._cursor_prepared = False
+    
     def connect(self) -> Any:
         """Establish MySQL connection."""
         # Map charset UTF8 to utf8mb4 for MySQL
@@ -31,6 +37,23 @@ class MySQLConnection(DatabaseConnection):
         self._cursor.execute(query)
         return self._cursor
     
+    def prepare(self, query: str) -> Any:
+        """
+        Switch the main cursor to a prepared cursor.
+        
+        The prepared cursor sends the statement to the server on the first
+        execute and reuses it while the same SQL text is executed again.
+        The switch happens once per connection, so calling prepare() before
+        every execution (as pooled connections do) keeps the server-side
+        statement instead of discarding it.
+        """
+        if not self._cursor_prepared:
+            if self._cursor:
+                self._cursor.close()
+            self._cursor = self._connection.cursor(prepared=True)
+            self._cursor_prepared = True
+        return query
+    
     def fetchone(self) -> Any:
         """Fetch one row from the cursor."""
         return self._cursor.fetchone()
@@ -45,6 +68,7 @@ class MySQLConnection(DatabaseConnection):
             self._cursor.close()
         if self._connection:
             self._connection.close()
+        self._cursor_prepared = False
     
     def get_connection_id(self) -> Optional[Any]:
         """Get the current MySQL connection ID."""
@@ -1,6 +1,6 @@
 """PostgreSQL database connection implementation."""
 
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 import psycopg2
 
@@ -10,6 +10,12 @@ from . import DatabaseConnection, DatabaseConfig
 class PostgreSQLConnection(DatabaseConnection):
     """PostgreSQL-specific database connection."""
     
+    __slots__ = ('_prepared',)
+    
+    def __init__(self, config: DatabaseConfig):
+        super().__init__(config)
+        self._prepared: Dict[str, str] = {}
+    
     def connect(self) -> Any:
         """Establish PostgreSQL connection."""
         self._connection = psycopg2.connect(
@@ -30,6 +36,27 @@ class PostgreSQLConnection(DatabaseConnection):
         self._cursor.execute(query)
         return self._cursor
     
+    def prepare(self, query: str) -> Any:
+        """
+        Prepare the query server-side with PREPARE (psycopg2 has no prepare API).
+        
+        Statements are cached by SQL text: prepared statements live for the
+        whole session, so the same query is never prepared twice on it.
+        The handle is a parameterless "EXECUTE name" run as is.
+        Statements PREPARE does not accept (SHOW, CALL, DDL, several
+        statements) fall back to the raw SQL text, run by execute_query().
+        """
+        handle = self._prepared.get(query)
+        if handle is None:
+            name = f"bench_stmt_{len(self._prepared) + 1}"
+            try:
+                self._cursor.execute(f"PREPARE {name} AS {query}")
+                handle = f"EXECUTE {name}"
+            except psycopg2.Error:
+                handle = query
+            self._prepared[query] = handle
+        return handle
+    
     def fetchone(self) -> Any:
         """Fetch one row from the cursor."""
         return self._cursor.fetchone()
@@ -44,6 +71,8 @@ class PostgreSQLConnection(DatabaseConnection):
             self._cursor.close()
         if self._connection:
             self._connection.close()
+        # Prepared statements die with the session: a reconnect prepares again
+        self._prepared.clear()
     
     def get_connection_id(self) -> Optional[Any]:
         """Get the current PostgreSQL backend PID."""
@@ -1,86 +1,109 @@
+import functools
 import os
+import sys
 import time
-from typing import Dict, Any
+from dataclasses import dataclass, fields
+from typing import Dict, Any, Optional, Tuple
 
 import fdb
-from dotenv import load_dotenv
 
-
-def load_config() -> Dict[str, Dict[str, Any]]:
-    """Carrega variáveis de ambiente para as duas conexões."""
+# O .env é lido uma única vez, na importação do módulo. Com o ambiente já
+# definido (contêineres com env_file, CI), COMPARE_FB_SKIP_DOTENV=1 dispensa
+# a busca pelo .env e a própria importação do dotenv
+if os.getenv("COMPARE_FB_SKIP_DOTENV", "").strip().lower() not in ("1", "true", "yes"):
+    from dotenv import load_dotenv
     load_dotenv()
 
-    windows_cfg = {
-        "name": "Windows",
-        "host": os.getenv("WIN_FB_HOST"),
-        "port": int(os.getenv("WIN_FB_PORT", "3050")),
-        "database": os.getenv("WIN_FB_DATABASE"),
-        "user": os.getenv("WIN_FB_USER"),
-        "password": os.getenv("WIN_FB_PASSWORD"),
-    }
 
-    linux_cfg = {
-        "name": "Linux",
-        "host": os.getenv("LIN_FB_HOST"),
-        "port": int(os.getenv("LIN_FB_PORT", "3050")),
-        "database": os.getenv("LIN_FB_DATABASE"),
-        "user": os.getenv("LIN_FB_USER"),
-        "password": os.getenv("LIN_FB_PASSWORD"),
-    }
+@dataclass(frozen=True, slots=True)
+class FirebirdCfg:
+    """Configuração de uma das duas conexões Firebird (imutável)."""
+    name: str
+    host: Optional[str]
+    port: int
+    database: Optional[str]
+    user: Optional[str]
+    password: Optional[str]
+
+
+def _read_cfg(name: str, prefix: str) -> FirebirdCfg:
+    """Lê as variáveis {prefix}_FB_* e valida os campos obrigatórios."""
+    cfg = FirebirdCfg(
+        name=name,
+        host=os.getenv(f"{prefix}_FB_HOST"),
+        port=int(os.getenv(f"{prefix}_FB_PORT", "3050")),
+        database=os.getenv(f"{prefix}_FB_DATABASE"),
+        user=os.getenv(f"{prefix}_FB_USER"),
+        password=os.getenv(f"{prefix}_FB_PASSWORD"),
+    )
+
+    missing = [f.name for f in fields(cfg) if f.name != "port" and not getattr(cfg, f.name)]
+    if missing:
+        raise ValueError(
+            f"Variáveis ausentes para conexão {cfg.name}: {', '.join(missing)}"
+        )
+    return cfg
 
-    for cfg in (windows_cfg, linux_cfg):
-        missing = [k for k, v in cfg.items() if (v is None or v == "") and k != "port"]
-        if missing:
-            raise ValueError(
-                f"Variáveis ausentes para conexão {cfg['name']}: {', '.join(missing)}"
-            )
 
-    return {"windows": windows_cfg, "linux": linux_cfg}
+@functools.lru_cache(maxsize=1)
+def load_config() -> Tuple[FirebirdCfg, FirebirdCfg]:
+    """
+    Carrega variáveis de ambiente para as duas conexões (Windows, Linux).
+    
+    Calculado uma vez por processo; as configurações são imutáveis, pois o
+    mesmo objeto em cache é compartilhado por todas as chamadas.
+    """
+    return _read_cfg("Windows", "WIN"), _read_cfg("Linux", "LIN")
 
 
-def open_connection(cfg: Dict[str, Any]) -> fdb.Connection:
-    """Abre uma conexão Firebird com base em um dicionário de config."""
+def open_connection(cfg: FirebirdCfg) -> fdb.Connection:
+    """Abre uma conexão Firebird com base em uma configuração."""
     return fdb.connect(
-        host=cfg["host"],
-        port=cfg["port"],
-        database=cfg["database"],
-        user=cfg["user"],
-        password=cfg["password"],
+        host=cfg.host,
+        port=cfg.port,
+        database=cfg.database,
+        user=cfg.user,
+        password=cfg.password,
         charset="UTF8",
     )
 
 
-def test_connection(cfg: Dict[str, Any]) -> Dict[str, Any]:
+def test_connection(cfg: FirebirdCfg) -> Dict[str, Any]:
     """Abre conexão, executa uma query simples e mede tempo."""
-    dsn = f"{cfg['host']}/{cfg['port']}:{cfg['database']}"
-    print(f"\n== Testando conexão com {cfg['name']} ==")
+    dsn = f"{cfg.host}/{cfg.port}:{cfg.database}"
+    print(f"\n== Testando conexão com {cfg.name} ==")
     print(f"DSN: {dsn}")
 
-    t0 = time.perf_counter()
+    # Relógio inteiro em ns: subtrações exatas, convertidas para segundos só no fim
+    t0 = time.perf_counter_ns()
 
     conn = open_connection(cfg)
-    t_connect = time.perf_counter()
-    print(f"Conexão estabelecida em {t_connect - t0:.4f} s")
+    t_connect = time.perf_counter_ns()
 
     cur = conn.cursor()
     cur.execute("SELECT CURRENT_TIMESTAMP FROM RDB$DATABASE")
     row = cur.fetchone()
-    t_query = time.perf_counter()
-
-    print(f"Query simples executada em {t_query - t_connect:.4f} s")
-    print(f"CURRENT_TIMESTAMP em {cfg['name']}: {row[0]}")
+    t_query = time.perf_counter_ns()
 
     conn.close()
-    t_end = time.perf_counter()
-    total = t_end - t0
-
-    print(f"Tempo total (abrir + query + fechar): {total:.4f} s")
+    t_end = time.perf_counter_ns()
+    total = (t_end - t0) / 1e9
+
+    # Saída só depois da medição, numa única escrita: nenhum print (e nenhuma
+    # chamada de sistema de escrita) dentro das janelas cronometradas
+    log = [
+        f"Conexão estabelecida em {(t_connect - t0) / 1e9:.4f} s",
+        f"Query simples executada em {(t_query - t_connect) / 1e9:.4f} s",
+        f"CURRENT_TIMESTAMP em {cfg.name}: {row[0]}",
+        f"Tempo total (abrir + query + fechar): {total:.4f} s",
+    ]
+    sys.stdout.write("\n".join(log) + "\n")
 
     return {
-        "name": cfg["name"],
+        "name": cfg.name,
         "dsn": dsn,
-        "t_connect": t_connect - t0,
-        "t_query": t_query - t_connect,
+        "t_connect": (t_connect - t0) / 1e9,
+        "t_query": (t_query - t_connect) / 1e9,
         "t_total": total,
     }
 
@@ -89,12 +112,12 @@ def main() -> None:
     configs = load_config()
 
     results = []
-    for key in ("windows", "linux"):
+    for cfg in configs:
         try:
-            res = test_connection(configs[key])
+            res = test_connection(cfg)
             results.append(res)
         except Exception as e:
-            print(f"\nERRO ao testar conexão {configs[key]['name']}: {e}")
+            print(f"\nERRO ao testar conexão {cfg.name}: {e}")
 
     if len(results) == 2:
         print("\n==== Comparação resumida ====")
@@ -28,13 +28,22 @@ def main() -> None:
         query = params['query']
         concurrent = params['concurrent']
         max_workers = params['max_workers']
+        parallel_servers = params['parallel_servers']
+        warmup = params['warmup']
+        async_csv = params['async_csv']
+        concurrent_stats = params['concurrent_stats']
+        parquet_file = params['parquet_file']
+        capture_stats = params['capture_stats']
         
         print(f"\n🎯 Parâmetros do benchmark:")
         print(f"  Execuções por servidor: {runs}")
         print(f"  Query: {query}")
         print(f"  Concorrência: {'SIM' if concurrent else 'NÃO'}")
+        print(f"  Estatísticas de I/O: {'SIM' if capture_stats else 'NÃO (só latência)'}")
         if concurrent:
             print(f"  Threads paralelas: {max_workers}")
+            print(f"  Estatísticas de I/O por execução: {'SIM' if concurrent_stats and capture_stats else 'NÃO'}")
+        print(f"  Servidores em paralelo: {'SIM' if parallel_servers else 'NÃO'}")
         
         # Run benchmarks
         print(f"\n🚀 Iniciando benchmarks...\n")
@@ -46,7 +55,13 @@ def main() -> None:
             runs=runs,
             output_file="benchmark_results.csv",
             concurrent=concurrent,
-            max_workers=max_workers
+            max_workers=max_workers,
+            parallel_servers=parallel_servers,
+            warmup=warmup,
+            async_csv=async_csv,
+            concurrent_stats=concurrent_stats,
+            parquet_file=parquet_file,
+            capture_stats=capture_stats
         )
         
         print("\n" + "=" * 80)
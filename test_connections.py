@@ -7,40 +7,20 @@ accessible and reports their versions and connection status.
 """
 
 import sys
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any
 
 from src.compare_firebird_diferent_os.config import load_database_configs
 from src.compare_firebird_diferent_os.database import DatabaseConnectionFactory
 
 
-def get_database_version(db_type: str, connection: Any) -> Optional[str]:
-    """
-    Get database version string.
-    
-    Args:
-        db_type: Database type ('firebird', 'mysql', 'postgresql', 'mariadb')
-        connection: DatabaseConnection instance
-    
-    Returns:
-        Version string or None if unavailable
-    """
-    version_queries = {
-        'firebird': "SELECT rdb$get_context('SYSTEM', 'ENGINE_VERSION') FROM RDB$DATABASE",
-        'mysql': "SELECT VERSION()",
-        'postgresql': "SELECT version()",
-        'mariadb': "SELECT VERSION()",
-    }
-    
-    query = version_queries.get(db_type)
-    if not query:
-        return None
-    
-    try:
-        connection.execute_query(query)
-        result = connection.fetchone()
-        return result[0] if result else None
-    except Exception as e:
-        return f"Error: {str(e)}"
+# Connectivity check and server version in a single round-trip per server
+TEST_QUERIES = {
+    'firebird': "SELECT 1, rdb$get_context('SYSTEM', 'ENGINE_VERSION') FROM RDB$DATABASE",
+    'mysql': "SELECT 1, VERSION()",
+    'postgresql': "SELECT 1, version()",
+    'mariadb': "SELECT 1, VERSION()",
+}
 
 
 def test_connection(config) -> Dict[str, Any]:
@@ -70,17 +50,13 @@ def test_connection(config) -> Dict[str, Any]:
         connection = DatabaseConnectionFactory.create(config)
         connection.connect()
         
-        # Test simple query (Firebird-compatible)
-        test_query = "SELECT 1 FROM RDB$DATABASE" if config.db_type == 'firebird' else "SELECT 1"
-        connection.execute_query(test_query)
+        # Test simple query, fetching the version in the same row
+        connection.execute_query(TEST_QUERIES[config.db_type])
         test_result = connection.fetchone()
         
         if test_result:
             result['status'] = 'success'
-            
-            # Get version
-            version = get_database_version(config.db_type, connection)
-            result['version'] = version
+            result['version'] = test_result[1]
         else:
             result['status'] = 'failed'
             result['error'] = 'Query returned no results'
@@ -107,27 +83,34 @@ def main() -> None:
         
         print(f"✅ {len(configs)} servidor(es) encontrado(s)\n")
         
-        # Test each connection
-        results = []
-        for i, config in enumerate(configs, 1):
-            print(f"\n[{i}/{len(configs)}] Testando: {config.name}")
-            print(f"    Tipo: {config.db_type.upper()}")
-            print(f"    OS: {config.os_type.upper()}")
-            print(f"    Host: {config.host}:{config.port}")
-            print(f"    Database: {config.database}")
-            print("    Status: ", end="", flush=True)
-            
-            result = test_connection(config)
-            results.append(result)
+        # Test all connections at once: each test is dominated by network
+        # round-trips, so the total is the slowest server instead of the sum.
+        # The drivers are blocking, hence one thread per server; map() keeps
+        # the results in configuration order
+        with ThreadPoolExecutor(max_workers=len(configs)) as executor:
+            results = list(executor.map(test_connection, configs))
+        
+        # Report after all tests finished, so printing does not serialize them;
+        # each server's block is built as lines and written at once
+        for i, (config, result) in enumerate(zip(configs, results), 1):
+            lines = [
+                f"\n[{i}/{len(configs)}] Testando: {config.name}",
+                f"    Tipo: {config.db_type.upper()}",
+                f"    OS: {config.os_type.upper()}",
+                f"    Host: {config.host}:{config.port}",
+                f"    Database: {config.database}",
+            ]
             
             if result['status'] == 'success':
-                print("✅ CONECTADO")
+                lines.append("    Status: ✅ CONECTADO")
                 if result['version']:
-                    print(f"    Versão: {result['version']}")
+                    lines.append(f"    Versão: {result['version']}")
             else:
-                print("❌ FALHOU")
+                lines.append("    Status: ❌ FALHOU")
                 if result['error']:
-                    print(f"    Erro: {result['error']}")
+                    lines.append(f"    Erro: {result['error']}")
+            
+            sys.stdout.write("\n".join(lines) + "\n")
         
         # Summary
         print("\n" + "=" * 80)